@@ -0,0 +1,385 @@
+"""Local stand-in for the Yahoo Fantasy v2 API, for offline load testing.
+
+Serves the league, settings, stat_categories, scoreboard, team roster and
+players stats resources the sensor requests, including the chained
+collections used by snapshot fetch mode. Any league or team ID is accepted.
+Player stats grow on a timer to simulate a live game, and failures can be
+injected at random:
+
+    python benchmarks/fake_yahoo_api.py --port 8765 --fail 429=0.05 --fail 401=0.02 --slow 0.1
+
+Then point the sensor at it with api_base_url: http://127.0.0.1:8765/fantasy/v2
+
+GET /_stats returns request counters, POST /_faults replaces the fault plan
+with a JSON body like {"fail": {"429": 0.1}, "slow": 0.2}, and POST /_reset
+clears the counters.
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+import fixtures
+
+API_PREFIX = "/fantasy/v2/"
+
+# Per-tick chance a player records something, and what it can be
+_PLAY_CHANCE = 0.35
+_YARDAGE_STATS = ("4", "9", "12")
+_SCORING_STATS = ("5", "10", "13")
+_MODIFIERS = {sid: mod for sid, _, _, mod in fixtures.STATS if mod is not None}
+
+
+class LiveGame:
+    """Player stats that keep changing while the fake server runs."""
+
+    def __init__(self, tick_seconds=30.0, seed=0):
+        self.tick_seconds = tick_seconds
+        self._rng = random.Random(seed)
+        self._started = time.time()
+        self._ticks = 0
+        self._stats = {}  # {player_id: {stat_id: int}}
+        self._lock = threading.Lock()
+
+    def _player(self, player_id):
+        stats = self._stats.get(player_id)
+        if stats is None:
+            rng = random.Random(int(player_id) * 31)
+            stats = {sid: int(value) for sid, value in fixtures.player_stat_values(rng)}
+            self._stats[player_id] = stats
+        return stats
+
+    def _advance(self):
+        due = int((time.time() - self._started) / self.tick_seconds) if self.tick_seconds > 0 else 0
+        while self._ticks < due:
+            self._ticks += 1
+            for stats in self._stats.values():
+                if self._rng.random() >= _PLAY_CHANCE:
+                    continue
+                stats[self._rng.choice(_YARDAGE_STATS)] += self._rng.randint(1, 15)
+                if self._rng.random() < 0.1:
+                    stats[self._rng.choice(_SCORING_STATS)] += 1
+                if self._rng.random() < 0.3:
+                    stats["11"] += 1
+
+    def stats(self, player_ids):
+        """Current {player_id: {stat_id: value}} for the given players."""
+        with self._lock:
+            self._advance()
+            return {pid: dict(self._player(pid)) for pid in player_ids}
+
+    def points(self, player_ids):
+        return sum(
+            value * _MODIFIERS.get(sid, 0.0)
+            for stats in self.stats(player_ids).values()
+            for sid, value in stats.items()
+        )
+
+
+class FakeYahooApi:
+    """Builds Yahoo-shaped responses for any league from the fixture generators."""
+
+    def __init__(self, size="standard", tick_seconds=30.0):
+        self.num_teams, self.positions = fixtures.SIZES[size]
+        self.game = LiveGame(tick_seconds)
+
+    def _starters(self, team_id):
+        return [
+            str(fixtures.player_id_for(team_id, slot))
+            for slot, position in enumerate(self.positions)
+            if position not in ("BN", "IR")
+        ]
+
+    def _player_record(self, player_id, stats):
+        return [
+            fixtures.player_meta(int(player_id), "WR"),
+            {"player_stats": {"0": {"coverage_type": "week", "week": str(fixtures.WEEK)},
+                              "stats": [{"stat": {"stat_id": sid, "value": str(value)}} for sid, value in stats.items()]},
+             "player_points": {"coverage_type": "week", "week": str(fixtures.WEEK),
+                               "total": f"{sum(v * _MODIFIERS.get(s, 0.0) for s, v in stats.items()):.2f}"}},
+        ]
+
+    def players(self, player_ids):
+        stats = self.game.stats(player_ids)
+        players = {str(i): {"player": self._player_record(pid, stats[pid])} for i, pid in enumerate(player_ids)}
+        players["count"] = len(player_ids)
+        return {"fantasy_content": {"players": players}}
+
+    def scoreboard(self, league_id):
+        response = fixtures.scoreboard_response(self.num_teams, league_id)
+        matchups = response["fantasy_content"]["league"][1]["scoreboard"]["0"]["matchups"]
+        for key, item in matchups.items():
+            if key == "count":
+                continue
+            teams = item["matchup"]["0"]["teams"]
+            points = {}
+            for slot in ("0", "1"):
+                team_id = int(teams[slot]["team"][0][1]["team_id"])
+                points[slot] = self.game.points(self._starters(team_id))
+                teams[slot]["team"][1]["team_points"]["total"] = f"{points[slot]:.2f}"
+            for slot, other in (("0", "1"), ("1", "0")):
+                probability = min(0.99, max(0.01, 0.5 + (points[slot] - points[other]) / 100))
+                teams[slot]["team"][1]["win_probability"] = round(probability, 2)
+        return response
+
+    def roster(self, league_id, team_id, with_stats=False):
+        response = fixtures.roster_response(team_id, self.positions, league_id)
+        if with_stats:
+            players = response["fantasy_content"]["team"][1]["roster"]["0"]["players"]
+            ids = [players[key]["player"][0][1]["player_id"] for key in players if key != "count"]
+            stats = self.game.stats(ids)
+            for key, item in players.items():
+                if key != "count":
+                    pid = item["player"][0][1]["player_id"]
+                    item["player"].append(self._player_record(pid, stats[pid])[1])
+        return response
+
+    def respond(self, path):
+        """Return the response body for an API path, or None for an unknown resource."""
+        path = unquote(path)
+        league = re.match(r"league/([^/;.]+)\.l\.(\d+)", path)
+        league_id = int(league.group(2)) if league else fixtures.LEAGUE_ID
+
+        if path.startswith("players;player_keys="):
+            keys = path.split("=", 1)[1].split("/", 1)[0].split(",")
+            return self.players([key.rsplit(".", 1)[-1] for key in keys])
+
+        if path.startswith("teams;team_keys="):
+            keys = path.split("=", 1)[1].split("/", 1)[0].split(",")
+            with_stats = "/stats" in path
+            teams = {}
+            for i, key in enumerate(keys):
+                match = re.match(r"[^.]+\.l\.(\d+)\.t\.(\d+)$", key)
+                if match:
+                    teams[str(i)] = {"team": self.roster(int(match.group(1)), int(match.group(2)), with_stats)
+                                     ["fantasy_content"]["team"]}
+            teams["count"] = len(teams)
+            return {"fantasy_content": {"teams": teams}}
+
+        if re.match(r"game/[^/]+/stat_categories$", path):
+            return fixtures.stat_categories_response()
+
+        team = re.match(r"team/[^/.]+\.l\.(\d+)\.t\.(\d+)/roster", path)
+        if team:
+            return self.roster(int(team.group(1)), int(team.group(2)))
+
+        if not league:
+            return None
+        rest = path[league.end():]
+        if rest == "":
+            return fixtures.league_response(self.num_teams, league_id)
+        if rest == "/settings":
+            return fixtures.settings_response(self.num_teams, self.positions, league_id)
+        if rest.startswith("/scoreboard"):
+            return self.scoreboard(league_id)
+        if rest.startswith(";out="):
+            parts = rest[len(";out="):].split(",")
+            body = [fixtures.league_meta(self.num_teams, league_id)]
+            if "settings" in parts:
+                body.append(fixtures.settings_response(self.num_teams, self.positions, league_id)
+                            ["fantasy_content"]["league"][1])
+            if "scoreboard" in parts:
+                body.append(self.scoreboard(league_id)["fantasy_content"]["league"][1])
+            return {"fantasy_content": {"league": body}}
+        return None
+
+
+class FaultPlan:
+    """Random failures to inject: status codes, slow responses and timeouts."""
+
+    def __init__(self, fail=None, slow=0.0, slow_delay=2.0, timeout=0.0, timeout_delay=35.0,
+                 latency=0.0, retry_after=1):
+        self.fail = {int(code): rate for code, rate in (fail or {}).items()}
+        self.slow = slow
+        self.slow_delay = slow_delay
+        self.timeout = timeout
+        self.timeout_delay = timeout_delay
+        self.latency = latency
+        self.retry_after = retry_after
+
+    def pick(self, rng):
+        """Return ("timeout", None), ("status", code) or ("ok", delay) for one request."""
+        if rng.random() < self.timeout:
+            return "timeout", None
+        roll = rng.random()
+        for code, rate in self.fail.items():
+            if roll < rate:
+                return "status", code
+            roll -= rate
+        delay = self.latency + (self.slow_delay if rng.random() < self.slow else 0.0)
+        return "ok", delay
+
+
+class FakeYahooServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, api, faults, verbose=False):
+        super().__init__(address, _Handler)
+        self.api = api
+        self.faults = faults
+        self.verbose = verbose
+        self.counters = Counter()
+        self.rng = random.Random()
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX.rstrip('/')}"
+
+    def count(self, *keys):
+        with self.lock:
+            for key in keys:
+                self.counters[key] += 1
+
+
+def _endpoint(path):
+    """Coarse resource name used for the request counters."""
+    for marker, name in (("players;", "players"), ("teams;", "teams"), (";out=", "snapshot"),
+                         ("stat_categories", "stat_categories"), ("settings", "settings"),
+                         ("scoreboard", "scoreboard"), ("roster", "roster")):
+        if marker in path:
+            return name
+    return "league" if path.startswith("league/") else "other"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, body, headers=None):
+        payload = json.dumps(body, separators=(",", ":")).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path.startswith("/_stats"):
+            with self.server.lock:
+                self._send_json(200, dict(self.server.counters))
+            return
+        if not self.path.startswith(API_PREFIX):
+            self._send_json(404, {"error": "not found"})
+            return
+
+        path = self.path[len(API_PREFIX):].split("?", 1)[0]
+        endpoint = _endpoint(path)
+        with self.server.lock:
+            outcome, value = self.server.faults.pick(self.server.rng)
+
+        if outcome == "timeout":
+            self.server.count("timeout", f"{endpoint}:timeout")
+            time.sleep(self.server.faults.timeout_delay)
+            self.close_connection = True
+            return
+        if outcome == "status":
+            self.server.count(str(value), f"{endpoint}:{value}")
+            headers = {"Retry-After": str(self.server.faults.retry_after)} if value == 429 else {}
+            if value == 401:
+                headers["WWW-Authenticate"] = 'OAuth oauth_problem="token_expired"'
+            self._send_json(value, {"error": {"description": f"injected {value}"}}, headers)
+            return
+        if value:
+            time.sleep(value)
+
+        body = self.server.api.respond(path)
+        if body is None:
+            self.server.count("404", f"{endpoint}:404")
+            self._send_json(404, {"error": {"description": f"unknown resource {path}"}})
+            return
+
+        etag = '"' + hashlib.md5(json.dumps(body, sort_keys=True).encode()).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.server.count("304", f"{endpoint}:304")
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.server.count("200", f"{endpoint}:200")
+        self._send_json(200, body, {"ETag": etag})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if self.path.startswith("/_faults"):
+            with self.server.lock:
+                self.server.faults = FaultPlan(**body)
+            self._send_json(200, {"ok": True})
+        elif self.path.startswith("/_reset"):
+            with self.server.lock:
+                self.server.counters.clear()
+            self._send_json(200, {"ok": True})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+
+def start_server(host="127.0.0.1", port=0, size="standard", tick_seconds=30.0, faults=None, verbose=False):
+    """Start the fake API on a background thread and return the server."""
+    server = FakeYahooServer((host, port), FakeYahooApi(size, tick_seconds), faults or FaultPlan(), verbose)
+    threading.Thread(target=server.serve_forever, name="fake-yahoo-api", daemon=True).start()
+    return server
+
+
+def parse_fail(values):
+    """Turn ["429=0.05", "401=0.01"] into {429: 0.05, 401: 0.01}."""
+    fail = {}
+    for value in values or []:
+        code, _, rate = value.partition("=")
+        fail[int(code)] = float(rate)
+    return fail
+
+
+def add_fault_arguments(parser):
+    parser.add_argument("--fail", action="append", metavar="CODE=RATE",
+                        help="answer this share of requests with an HTTP error, e.g. 429=0.05")
+    parser.add_argument("--slow", type=float, default=0.0, help="share of responses delayed by --slow-delay")
+    parser.add_argument("--slow-delay", type=float, default=2.0)
+    parser.add_argument("--timeout", type=float, default=0.0, help="share of requests that never get a response")
+    parser.add_argument("--timeout-delay", type=float, default=35.0,
+                        help="seconds to hold a timed-out request before closing it (the sensor gives up at 30)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+
+
+def fault_plan_from_args(args):
+    return FaultPlan(parse_fail(args.fail), args.slow, args.slow_delay, args.timeout, args.timeout_delay,
+                     args.latency, args.retry_after)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a fake Yahoo Fantasy v2 API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--size", choices=sorted(fixtures.SIZES), default="standard")
+    parser.add_argument("--tick", type=float, default=30.0, help="seconds between simulated plays")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    server = FakeYahooServer((args.host, args.port), FakeYahooApi(args.size, args.tick),
+                             fault_plan_from_args(args), args.verbose)
+    print(f"Serving fake Yahoo Fantasy API at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,421 @@
+"""Synthetic Yahoo Fantasy v2 responses used by the benchmarks.
+
+The JSON files under benchmarks/fixtures/<size>/ are generated from a fixed
+seed and follow the shape of the real API responses the sensor parses. They
+can be regenerated with
+
+    python benchmarks/fixtures.py generate
+
+and a response recorded from the live API can be scrubbed before it is
+committed in their place with
+
+    python benchmarks/fixtures.py anonymize raw.json benchmarks/fixtures/<size>/<name>.json
+"""
+import argparse
+import copy
+import json
+import os
+import random
+import re
+import sys
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+GAME_KEY = "449"
+LEAGUE_ID = 123456
+WEEK = 5
+OUR_TEAM_ID = 1
+OPPONENT_TEAM_ID = 2
+
+# name: (number of teams, roster slots)
+SIZES = {
+    "small": (8, ["QB", "WR", "WR", "RB", "RB", "TE", "W/R/T", "K", "DEF"] + ["BN"] * 6),
+    "standard": (12, ["QB", "WR", "WR", "WR", "RB", "RB", "TE", "W/R/T", "K", "DEF"] + ["BN"] * 6),
+    "large": (16, ["QB", "WR", "WR", "WR", "RB", "RB", "TE", "W/R/T", "W/R/T", "Q/W/R/T", "K", "DEF"]
+              + ["BN"] * 9 + ["IR", "IR"]),
+}
+
+# stat_id, name, display name, league modifier (None = not scored)
+STATS = [
+    ("4", "Passing Yards", "Pass Yds", 0.04),
+    ("5", "Passing Touchdowns", "Pass TD", 4.0),
+    ("6", "Interceptions", "Int", -1.0),
+    ("9", "Rushing Yards", "Rush Yds", 0.1),
+    ("10", "Rushing Touchdowns", "Rush TD", 6.0),
+    ("11", "Receptions", "Rec", 0.5),
+    ("12", "Receiving Yards", "Rec Yds", 0.1),
+    ("13", "Receiving Touchdowns", "Rec TD", 6.0),
+    ("15", "Return Touchdowns", "Ret TD", 6.0),
+    ("16", "2-Point Conversions", "2-PT", 2.0),
+    ("18", "Fumbles Lost", "Fum Lost", -2.0),
+    ("57", "Offensive Fumble Return TD", "Fum Ret TD", 6.0),
+    ("19", "Field Goals 0-19 Yards", "FG 0-19", 3.0),
+    ("20", "Field Goals 20-29 Yards", "FG 20-29", 3.0),
+    ("29", "Point After Attempt Made", "PAT Made", 1.0),
+    ("32", "Sack", "Sack", 1.0),
+    ("33", "Interception", "Int", 2.0),
+    ("35", "Touchdown", "TD", 6.0),
+    ("0", "Games Played", "GP", None),
+]
+NFL_TEAMS = ["KC", "BUF", "PHI", "SF", "DAL", "MIA", "DET", "BAL", "CIN", "GB"]
+
+
+def league_key(league_id=LEAGUE_ID):
+    return f"{GAME_KEY}.l.{league_id}"
+
+
+def league_meta(num_teams, league_id=LEAGUE_ID):
+    return {
+        "league_key": league_key(league_id),
+        "league_id": str(league_id),
+        "name": "Benchmark League",
+        "url": f"https://football.fantasysports.yahoo.com/f1/{league_id}",
+        "draft_status": "postdraft",
+        "num_teams": num_teams,
+        "league_update_timestamp": "1760000000",
+        "scoring_type": "head",
+        "current_week": WEEK,
+        "start_week": "1",
+        "end_week": "17",
+        "is_finished": 0,
+    }
+
+
+def league_response(num_teams, league_id=LEAGUE_ID):
+    return {"fantasy_content": {"league": [league_meta(num_teams, league_id)], "time": "12ms"}}
+
+
+def settings_response(num_teams, positions, league_id=LEAGUE_ID):
+    settings = {
+        "draft_type": "live",
+        "scoring_type": "head",
+        "roster_positions": [
+            {"roster_position": {"position": pos, "position_type": "O", "count": positions.count(pos)}}
+            for pos in dict.fromkeys(positions)
+        ],
+        "stat_categories": {
+            "stats": [
+                {"stat": {"stat_id": int(sid), "enabled": "1", "name": name, "display_name": abbr,
+                          "sort_order": "1", "position_type": "O",
+                          "stat_position_types": [{"stat_position_type": {"position_type": "O"}}]}}
+                for sid, name, abbr, _ in STATS
+            ]
+        },
+        "stat_modifiers": {
+            "stats": [{"stat": {"stat_id": int(sid), "value": str(mod)}} for sid, _, _, mod in STATS if mod is not None]
+        },
+    }
+    return {"fantasy_content": {"league": [league_meta(num_teams, league_id), {"settings": [settings]}]}}
+
+
+def stat_categories_response():
+    return {"fantasy_content": {"game": [
+        {"game_key": GAME_KEY, "game_id": GAME_KEY, "name": "Football", "code": "nfl", "season": "2024"},
+        {"stat_categories": {"stats": [
+            {"stat": {"stat_id": int(sid), "name": name, "display_name": abbr, "abbr": abbr, "sort_order": "1",
+                      "position_types": [{"position_type": "O"}]}}
+            for sid, name, abbr, _ in STATS
+        ]}},
+    ]}}
+
+
+def team_meta(team_id, league_id=LEAGUE_ID):
+    return [
+        {"team_key": f"{league_key(league_id)}.t.{team_id}"},
+        {"team_id": str(team_id)},
+        {"name": f"Team {team_id}"},
+        [],
+        {"url": f"https://football.fantasysports.yahoo.com/f1/{league_id}/{team_id}"},
+        {"team_logos": [{"team_logo": {"size": "large", "url": f"https://example.invalid/logo/{team_id}.png"}}]},
+        [],
+        {"waiver_priority": team_id},
+        [],
+        {"number_of_moves": 3},
+        {"number_of_trades": 0},
+        {"roster_adds": {"coverage_type": "week", "coverage_value": WEEK, "value": "1"}},
+        [],
+        {"league_scoring_type": "head"},
+        [],
+        [],
+        {"has_draft_grade": 1},
+        [],
+        [],
+        {"managers": [{"manager": {"manager_id": str(team_id), "nickname": f"Manager {team_id}",
+                                   "guid": f"GUID{team_id:04d}", "is_comanager": "0"}}]},
+    ]
+
+
+def scoreboard_response(num_teams, league_id=LEAGUE_ID, seed=0):
+    rng = random.Random(league_id + seed)
+    matchups = {}
+    for m in range(num_teams // 2):
+        teams = {}
+        for slot, team_id in enumerate((2 * m + 1, 2 * m + 2)):
+            teams[str(slot)] = {"team": [
+                team_meta(team_id, league_id),
+                {
+                    "team_points": {"coverage_type": "week", "week": str(WEEK), "total": f"{rng.uniform(40, 130):.2f}"},
+                    "team_projected_points": {"coverage_type": "week", "week": str(WEEK),
+                                              "total": f"{rng.uniform(80, 120):.2f}"},
+                    "win_probability": round(rng.random(), 2),
+                },
+            ]}
+        teams["count"] = 2
+        matchups[str(m)] = {"matchup": {
+            "week": str(WEEK), "week_start": "2024-10-03", "week_end": "2024-10-07",
+            "status": "midevent", "is_playoffs": "0", "is_consolation": "0", "is_tied": 0,
+            "0": {"teams": teams},
+        }}
+    matchups["count"] = num_teams // 2
+    return {"fantasy_content": {"league": [
+        league_meta(num_teams, league_id),
+        {"scoreboard": {"week": str(WEEK), "0": {"matchups": matchups}}},
+    ]}}
+
+
+def player_id_for(team_id, slot):
+    return 1000 + team_id * 100 + slot
+
+
+def player_meta(player_id, position):
+    team = NFL_TEAMS[player_id % len(NFL_TEAMS)]
+    return [
+        {"player_key": f"{GAME_KEY}.p.{player_id}"},
+        {"player_id": str(player_id)},
+        {"name": {"full": f"Player{player_id} Surname{player_id}", "first": f"Player{player_id}",
+                  "last": f"Surname{player_id}", "ascii_first": f"Player{player_id}",
+                  "ascii_last": f"Surname{player_id}"}},
+        {"editorial_player_key": f"nfl.p.{player_id}"},
+        {"editorial_team_key": f"nfl.t.{player_id % 32}"},
+        {"editorial_team_full_name": f"{team} Football Club"},
+        {"editorial_team_abbr": team},
+        {"bye_weeks": {"week": "10"}},
+        {"uniform_number": str(player_id % 99)},
+        {"display_position": position if position not in ("BN", "IR") and "/" not in position else "WR"},
+        {"headshot": {"url": f"https://example.invalid/headshot/{player_id}.png", "size": "small"}},
+        {"image_url": f"https://example.invalid/headshot/{player_id}.png"},
+        {"is_undroppable": "0"},
+        {"position_type": "O"},
+        {"primary_position": "WR"},
+        {"eligible_positions": [{"position": "WR"}, {"position": "W/R/T"}]},
+        {"has_player_notes": 1},
+    ]
+
+
+def roster_response(team_id, positions, league_id=LEAGUE_ID):
+    players = {}
+    for slot, position in enumerate(positions):
+        players[str(slot)] = {"player": [
+            player_meta(player_id_for(team_id, slot), position),
+            {"selected_position": [{"coverage_type": "week", "week": str(WEEK)}, {"position": position},
+                                   {"is_flex": 1 if "/" in position else 0}]},
+            {"is_editable": 0},
+        ]}
+    players["count"] = len(positions)
+    return {"fantasy_content": {"team": [
+        team_meta(team_id, league_id),
+        {"roster": {"coverage_type": "week", "week": str(WEEK), "is_editable": 0, "0": {"players": players}}},
+    ]}}
+
+
+def player_stat_values(rng):
+    values = []
+    for sid, _, _, _ in STATS:
+        if sid == "0":
+            values.append((sid, "1"))
+        elif rng.random() < 0.3:
+            values.append((sid, str(rng.randint(1, 120) if sid in ("4", "9", "12") else rng.randint(1, 3))))
+        else:
+            values.append((sid, "0"))
+    return values
+
+
+def player_stats_response(player_ids, seed=0):
+    players = {}
+    for i, pid in enumerate(player_ids):
+        rng = random.Random(int(pid) * 31 + seed)
+        players[str(i)] = {"player": [
+            player_meta(int(pid), "WR"),
+            {"player_stats": {"0": {"coverage_type": "week", "week": str(WEEK)},
+                              "stats": [{"stat": {"stat_id": sid, "value": v}} for sid, v in player_stat_values(rng)]},
+             "player_points": {"coverage_type": "week", "week": str(WEEK), "total": f"{rng.uniform(0, 30):.2f}"}},
+        ]}
+    players["count"] = len(player_ids)
+    return {"fantasy_content": {"players": players}}
+
+
+def generate(size):
+    """Build the synthetic response set for one league size."""
+    num_teams, positions = SIZES[size]
+    player_ids = [
+        player_id_for(team_id, slot)
+        for team_id in (OUR_TEAM_ID, OPPONENT_TEAM_ID)
+        for slot in range(len(positions))
+    ]
+    return {
+        "league": league_response(num_teams),
+        "settings": settings_response(num_teams, positions),
+        "stat_categories": stat_categories_response(),
+        "scoreboard": scoreboard_response(num_teams),
+        f"roster_{OUR_TEAM_ID}": roster_response(OUR_TEAM_ID, positions),
+        f"roster_{OPPONENT_TEAM_ID}": roster_response(OPPONENT_TEAM_ID, positions),
+        "player_stats": player_stats_response(player_ids),
+    }
+
+
+def load(size):
+    """Load the fixture responses for one league size."""
+    directory = os.path.join(FIXTURES_DIR, size)
+    fixtures = {}
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith(".json"):
+            with open(os.path.join(directory, filename), "r") as f:
+                fixtures[filename[:-5]] = json.load(f)
+    return fixtures
+
+
+def route(fixtures, url):
+    """Return the fixture response for an API URL, or None if there is none.
+
+    Snapshot requests (league ;out= and teams;team_keys= collections) are
+    assembled from the same fixtures. Rosters only exist for our matchup's
+    two teams, so other team keys are left out of a teams collection.
+    """
+    path = url.split("/fantasy/v2/", 1)[-1].split("?", 1)[0]
+    if path.startswith("players;player_keys="):
+        wanted = set(path.split("=", 1)[1].split("/", 1)[0].split(","))
+        recorded = fixtures["player_stats"]["fantasy_content"]["players"]
+        players = {}
+        for key, item in recorded.items():
+            if key != "count" and f"{GAME_KEY}.p.{item['player'][0][1]['player_id']}" in wanted:
+                players[str(len(players))] = item
+        players["count"] = len(players)
+        return {"fantasy_content": {"players": players}}
+    if path.startswith("teams;team_keys="):
+        return teams_snapshot(fixtures, path.split("=", 1)[1].split("/", 1)[0].split(","), "/stats" in path)
+    match = re.fullmatch(r"league/[^/;]+;out=([\w,]+)", path)
+    if match:
+        body = [fixtures["league"]["fantasy_content"]["league"][0]]
+        for part in match.group(1).split(","):
+            if part not in ("settings", "scoreboard") or part not in fixtures:
+                return None
+            body.append(fixtures[part]["fantasy_content"]["league"][1])
+        return {"fantasy_content": {"league": body}}
+    if path.endswith("/settings"):
+        return fixtures.get("settings")
+    if path.endswith("/stat_categories"):
+        return fixtures.get("stat_categories")
+    if "/scoreboard" in path:
+        return fixtures.get("scoreboard")
+    match = re.search(r"\.t\.(\d+)/roster", path)
+    if match:
+        return fixtures.get(f"roster_{match.group(1)}")
+    if re.fullmatch(r"league/[^/;]+", path):
+        return fixtures.get("league")
+    return None
+
+
+def teams_snapshot(fixtures, team_keys, with_stats):
+    """Build a teams collection from the roster fixtures, with player stats chained in if asked."""
+    stats = {}
+    if with_stats:
+        for key, item in fixtures["player_stats"]["fantasy_content"]["players"].items():
+            if key != "count":
+                stats[item["player"][0][1]["player_id"]] = item["player"][1]
+    teams = {}
+    for team_key in team_keys:
+        roster = fixtures.get(f"roster_{team_key.rsplit('.', 1)[-1]}")
+        if roster is None:
+            continue
+        team = copy.deepcopy(roster["fantasy_content"]["team"])
+        for key, item in team[1]["roster"]["0"]["players"].items():
+            if key != "count" and item["player"][0][1]["player_id"] in stats:
+                item["player"].append(stats[item["player"][0][1]["player_id"]])
+        teams[str(len(teams))] = {"team": team}
+    teams["count"] = len(teams)
+    return {"fantasy_content": {"teams": teams}}
+
+
+def write(size, fixtures):
+    directory = os.path.join(FIXTURES_DIR, size)
+    os.makedirs(directory, exist_ok=True)
+    for name, data in fixtures.items():
+        with open(os.path.join(directory, f"{name}.json"), "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+            f.write("\n")
+
+
+# Keys whose values identify a real person, team or league
+_PERSONAL_KEYS = {"nickname", "guid", "email", "image_url", "felo_score", "felo_tier"}
+_URL_RE = re.compile(r"https?://[^\s\"]+")
+
+
+def anonymize(data):
+    """Scrub names, manager identities and URLs from a recorded response.
+
+    Replacements are derived from the IDs in the same record so that the
+    structure, key order and value types are kept intact.
+    """
+    data = copy.deepcopy(data)
+
+    def scrub(node, context):
+        if isinstance(node, dict):
+            if "player_id" in node:
+                context = dict(context, player=node["player_id"])
+            if "team_id" in node:
+                context = dict(context, team=node["team_id"])
+            if "manager_id" in node:
+                context = dict(context, manager=node["manager_id"])
+            for key, value in node.items():
+                if key == "name" and isinstance(value, dict):
+                    pid = context.get("player", "0")
+                    node[key] = {k: (f"Player{pid} Surname{pid}" if k == "full"
+                                     else f"Player{pid}" if "first" in k
+                                     else f"Surname{pid}" if "last" in k else v)
+                                 for k, v in value.items()}
+                elif key == "name" and isinstance(value, str) and "team" in context:
+                    node[key] = f"Team {context['team']}"
+                elif key in _PERSONAL_KEYS and isinstance(value, str):
+                    node[key] = f"{key.title()} {context.get('manager') or context.get('player') or 0}"
+                elif isinstance(value, str) and _URL_RE.match(value):
+                    node[key] = "https://example.invalid/" + key
+                else:
+                    scrub(value, context)
+        elif isinstance(node, list):
+            # Yahoo record metadata: earlier list items carry the IDs later ones need
+            for item in node:
+                if isinstance(item, dict):
+                    for id_key, ctx_key in (("player_id", "player"), ("team_id", "team"), ("manager_id", "manager")):
+                        if id_key in item:
+                            context = dict(context, **{ctx_key: item[id_key]})
+                scrub(item, context)
+
+    scrub(data, {})
+    return data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    gen = commands.add_parser("generate", help="regenerate the synthetic fixtures")
+    gen.add_argument("--size", action="append", choices=sorted(SIZES), help="league size (default: all)")
+    anon = commands.add_parser("anonymize", help="scrub a response recorded from the live API")
+    anon.add_argument("source")
+    anon.add_argument("destination")
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        for size in args.size or SIZES:
+            write(size, generate(size))
+            print(f"wrote {os.path.join(FIXTURES_DIR, size)}")
+    else:
+        with open(args.source, "r") as f:
+            data = json.load(f)
+        with open(args.destination, "w") as f:
+            json.dump(anonymize(data), f, separators=(",", ":"))
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Drive many matchup sensors against the fake Yahoo API and report latency.
+
+    python benchmarks/load_test.py --sensors 300 --leagues 25 --rounds 3
+    python benchmarks/load_test.py --mode sync --fail 429=0.05 --fail 401=0.02 --slow 0.1
+
+Each round updates every sensor once, concurrently, the way Home Assistant
+would: async_update on one event loop (default), or update() on a thread
+pool with --mode sync. The fake server runs in-process unless --base-url
+points at one started separately. Needs the same environment as the
+integration (homeassistant, yahoo_oauth, requests, aiohttp).
+"""
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import fake_yahoo_api
+import fixtures
+from run import load_sensor_module
+
+
+class LoadTestOAuth:
+    """Always-valid token holder; the fake API accepts any bearer token."""
+
+    def __init__(self):
+        self.access_token = "load-test-token-0"
+        self.token_time = time.time()
+        self.refreshes = 0
+
+    def token_is_valid(self):
+        return True
+
+    def refresh_access_token(self):
+        self.refreshes += 1
+        self.access_token = f"load-test-token-{self.refreshes}"
+        self.token_time = time.time()
+
+
+class LoadTestHass:
+    """The parts of hass the async update path uses."""
+
+    def __init__(self, loop, executor):
+        self.loop = loop
+        self.executor = executor
+        self.data = {}
+
+    def async_add_executor_job(self, target, *args):
+        return self.loop.run_in_executor(self.executor, target, *args)
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def make_sensors(sensor, oauth, base_url, count, leagues, num_teams, fetch_mode, interval):
+    sensors = []
+    for i in range(count):
+        league_id = fixtures.LEAGUE_ID + i % leagues
+        team_id = (i // leagues) % num_teams + 1
+        entity = sensor.YahooFantasyMatchupSensor(
+            oauth, fixtures.GAME_KEY, league_id, str(team_id), min_update_interval=interval,
+            fetch_mode=fetch_mode, adaptive_polling=False, api_base_url=base_url,
+        )
+        sensors.append(entity)
+    return sensors
+
+
+def timed_update(entity):
+    started = time.perf_counter()
+    entity._state = None
+    entity.update()
+    return time.perf_counter() - started, entity._state == "error"
+
+
+async def timed_async_update(entity):
+    started = time.perf_counter()
+    entity._state = None
+    await entity.async_update()
+    return time.perf_counter() - started, entity._state == "error"
+
+
+def run_sync_rounds(sensors, workers, rounds, begin_round, end_round):
+    with ThreadPoolExecutor(workers) as pool:
+        for round_number in range(1, rounds + 1):
+            started = begin_round()
+            end_round(round_number, started, list(pool.map(timed_update, sensors)))
+
+
+async def run_async_rounds(sensor, sensors, executor, rounds, begin_round, end_round):
+    import aiohttp
+
+    # One event loop and client session for every round, as in Home Assistant
+    async with aiohttp.ClientSession() as session:
+        # Sensors fetch through hass's shared client session; hand them ours
+        sensor.async_get_clientsession = lambda hass: session
+        hass = LoadTestHass(asyncio.get_running_loop(), executor)
+        for entity in sensors:
+            entity.hass = hass
+        for round_number in range(1, rounds + 1):
+            started = begin_round()
+            results = await asyncio.gather(*(timed_async_update(entity) for entity in sensors))
+            end_round(round_number, started, results)
+
+
+def server_request(base_url, path, body=None):
+    root = base_url.split(fake_yahoo_api.API_PREFIX.rstrip("/"), 1)[0]
+    data = json.dumps(body).encode() if body is not None else None
+    with urllib.request.urlopen(urllib.request.Request(root + path, data=data), timeout=10) as response:
+        return json.load(response)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the sensor against the fake Yahoo API.")
+    parser.add_argument("--sensors", type=int, default=200)
+    parser.add_argument("--leagues", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--mode", choices=("async", "sync"), default="async")
+    parser.add_argument("--fetch-mode", choices=("standard", "snapshot"), default="standard")
+    parser.add_argument("--interval", type=int, default=60, help="sensor update interval in seconds")
+    parser.add_argument("--workers", type=int, default=32, help="executor threads (sync updates, token refresh)")
+    parser.add_argument("--size", choices=sorted(fixtures.SIZES), default="standard")
+    parser.add_argument("--tick", type=float, default=5.0, help="seconds between simulated plays")
+    parser.add_argument("--base-url", help="use an already running fake API instead of starting one")
+    parser.add_argument("--rate-limit", type=float, default=1000.0,
+                        help="client-side requests per second (the integration defaults to 4)")
+    parser.add_argument("--burst", type=int, default=100, help="client-side rate limiter burst")
+    fake_yahoo_api.add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    sensor = load_sensor_module()
+
+    if args.base_url:
+        base_url = args.base_url.rstrip("/")
+        server_request(base_url, "/_faults", vars(fake_yahoo_api.fault_plan_from_args(args)))
+    else:
+        server = fake_yahoo_api.start_server(size=args.size, tick_seconds=args.tick,
+                                             faults=fake_yahoo_api.fault_plan_from_args(args))
+        base_url = server.base_url
+    print(f"fake API at {base_url}")
+
+    num_teams = fixtures.SIZES[args.size][0]
+    # Let every worker thread keep its own pooled connection
+    sensor.configure_transport(pool_size=args.workers)
+    sensor.configure_rate_limiter(args.rate_limit, args.burst)
+    oauth = LoadTestOAuth()
+    sensor.start_token_refresher(oauth)
+    sensors = make_sensors(sensor, oauth, base_url, args.sensors, args.leagues, num_teams, args.fetch_mode,
+                           args.interval)
+    executor = ThreadPoolExecutor(args.workers)
+
+    def begin_round():
+        server_request(base_url, "/_reset", {})
+        # Start each round with stale league data, as if the update interval had just passed
+        for coordinator in sensor._LEAGUE_COORDINATORS.values():
+            coordinator.last_refresh = 0
+        return time.perf_counter()
+
+    def end_round(round_number, started, results):
+        elapsed = time.perf_counter() - started
+        latencies = [latency for latency, _ in results]
+        errors = sum(1 for _, failed in results if failed)
+        counters = server_request(base_url, "/_stats")
+        requests_made = sum(v for k, v in counters.items() if ":" not in k)
+        print(
+            f"round {round_number}: {len(sensors)} sensors in {elapsed:.2f}s, "
+            f"update p50 {statistics.median(latencies):.3f}s p95 {percentile(latencies, 95):.3f}s "
+            f"max {max(latencies):.3f}s, {errors} errors, {requests_made} requests "
+            f"({', '.join(f'{k}: {v}' for k, v in sorted(counters.items()) if ':' not in k)})"
+        )
+
+    if args.mode == "sync":
+        run_sync_rounds(sensors, args.workers, args.rounds, begin_round, end_round)
+    else:
+        asyncio.run(run_async_rounds(sensor, sensors, executor, args.rounds, begin_round, end_round))
+
+    executor.shutdown(wait=False)
+    print(f"token refreshes: {oauth.refreshes}")
+    print(f"rate limiter: {json.dumps(sensor.get_rate_limiter().diagnostics())}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
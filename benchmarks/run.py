@@ -0,0 +1,229 @@
+"""Benchmarks for the sensor's parse and scoring hot paths.
+
+Runs every case against the synthetic fixtures for each league size, offline.
+Needs the same environment as the integration (homeassistant, yahoo_oauth).
+
+    python benchmarks/run.py                         # run and print
+    python benchmarks/run.py --save                  # also write the results file
+    python benchmarks/run.py --compare               # fail if slower than the baseline
+    python benchmarks/run.py --save benchmarks/baseline.json   # record a new baseline
+
+Times are CPU time per call. They depend on the machine, so compare against
+a baseline recorded on the same host that runs the comparison.
+"""
+import argparse
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+PACKAGE_DIR = os.path.join(os.path.dirname(BENCHMARKS_DIR), "yahoo-fantasy")
+RESULTS_FILE = os.path.join(BENCHMARKS_DIR, "results.json")
+BASELINE_FILE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+
+sys.path.insert(0, BENCHMARKS_DIR)
+import fixtures  # noqa: E402
+
+
+def load_sensor_module():
+    """Import yahoo-fantasy/sensor.py as the yahoo_fantasy package would be."""
+    spec = importlib.util.spec_from_file_location(
+        "yahoo_fantasy", os.path.join(PACKAGE_DIR, "__init__.py"), submodule_search_locations=[PACKAGE_DIR]
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules["yahoo_fantasy"] = package
+    spec.loader.exec_module(package)
+    sensor = importlib.import_module("yahoo_fantasy.sensor")
+    # Keep the persistent cache out of /config while benchmarking
+    sensor.PERSISTENT_CACHE_FILE = os.path.join(tempfile.mkdtemp(prefix="yahoo_fantasy_bench"), "cache")
+    return sensor
+
+
+def offline_sensor(sensor, responses):
+    """A matchup sensor that reads API responses from the benchmark fixtures."""
+    entity = sensor.YahooFantasyMatchupSensor(
+        None, fixtures.GAME_KEY, fixtures.LEAGUE_ID, str(fixtures.OUR_TEAM_ID), min_update_interval=0
+    )
+
+    def make_api_request(url, max_retries=3, priority=None, timing=None):
+        data = fixtures.route(responses, url)
+        if data is None:
+            raise Exception(f"No fixture for {url}")
+        # A fresh copy per request, as a decoded response would be
+        return json.loads(json.dumps(data))
+
+    entity._make_api_request = make_api_request
+    return entity
+
+
+def build_cases(sensor, size):
+    """Map case name to a zero-argument callable for one league size."""
+    responses = fixtures.load(size)
+    entity = offline_sensor(sensor, responses)
+
+    league_settings = entity._get_league_settings(fixtures.GAME_KEY, fixtures.LEAGUE_ID)
+    stat_categories = entity._get_stat_categories(fixtures.GAME_KEY)
+    stat_modifiers = league_settings.get("stat_modifiers", {})
+    player_stats = entity._extract_player_stats(responses["player_stats"])
+    roster = entity._extract_roster_data(
+        responses[f"roster_{fixtures.OUR_TEAM_ID}"], player_stats, stat_categories, stat_modifiers
+    )
+
+    # The entity memoizes scored players whose stats haven't changed since the
+    # last update. Cases reset that memo so every call does the full parse and
+    # scoring work; the *_warm cases measure the memoized path on purpose.
+    def forget_player_stats():
+        entity._player_stat_state = {}
+
+    def extract_roster_data():
+        forget_player_stats()
+        return entity._extract_roster_data(
+            responses[f"roster_{fixtures.OUR_TEAM_ID}"], player_stats, stat_categories, stat_modifiers
+        )
+
+    def roster_pipeline():
+        forget_player_stats()
+        return roster_pipeline_warm()
+
+    def roster_pipeline_warm():
+        # What an update does with the two matchup rosters: parse each once,
+        # collect player IDs for the stats request, then merge the stats in
+        rosters = [entity._parse_roster(responses[f"roster_{team_id}"])
+                   for team_id in (fixtures.OUR_TEAM_ID, fixtures.OPPONENT_TEAM_ID)]
+        entity._collect_player_ids(*rosters)
+        return [entity._attach_roster_stats(roster, player_stats, stat_categories, stat_modifiers) for roster in rosters]
+
+    # The chained teams collection a snapshot-mode refresh parses
+    teams_snapshot = fixtures.route(responses, (
+        f"{entity._api_base}/teams;team_keys={fixtures.league_key()}.t.{fixtures.OUR_TEAM_ID},"
+        f"{fixtures.league_key()}.t.{fixtures.OPPONENT_TEAM_ID}"
+        f"/roster;week={fixtures.WEEK}/players/stats;type=week;week={fixtures.WEEK}?format=json"
+    ))
+
+    def get_league_settings():
+        sensor.invalidate_league_cache(persist=False)
+        return entity._get_league_settings(fixtures.GAME_KEY, fixtures.LEAGUE_ID)
+
+    def update():
+        forget_player_stats()
+        update_warm()
+
+    def update_warm():
+        entity._state = None
+        entity.update()
+
+    def update_cold():
+        sensor.invalidate_league_cache(persist=False)
+        update()
+
+    return {
+        "find_key": lambda: sensor.find_key(responses["player_stats"], "no_such_key"),
+        "_get_league_settings": get_league_settings,
+        "_find_matchup_data": lambda: entity._find_matchup_data(responses["scoreboard"]),
+        "_extract_player_stats": lambda: entity._extract_player_stats(responses["player_stats"]),
+        "_extract_roster_data": extract_roster_data,
+        "roster_pipeline": roster_pipeline,
+        "roster_pipeline_warm": roster_pipeline_warm,
+        "_parse_snapshot_rosters": lambda: sensor.YahooFantasyLeagueCoordinator._parse_snapshot_rosters(
+            entity, teams_snapshot
+        ),
+        "score_player_stats": lambda: sensor.score_player_stats(player_stats, stat_modifiers),
+        "_get_touchdown_stats": lambda: entity._get_touchdown_stats(roster, stat_categories, str(fixtures.OUR_TEAM_ID)),
+        "update": update,
+        "update_warm": update_warm,
+        "update_cold": update_cold,
+    }
+
+
+# Whole-update cases get a fixed loop count; each call is slow enough that
+# autorange would spend most of the run on them
+FIXED_LOOPS = {"update": 3, "update_warm": 3, "update_cold": 3}
+
+
+def measure(func, repeat, number=None):
+    """Per-call CPU time in microseconds: best and median of repeat runs.
+
+    CPU time leaves out any waiting inside the sensor, so only parse and
+    scoring work is measured.
+    """
+    timer = timeit.Timer(func, timer=time.process_time)
+    if number is None:
+        number, _ = timer.autorange()
+    runs = [t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number)]
+    return {"min_us": round(min(runs), 2), "median_us": round(statistics.median(runs), 2), "loops": number}
+
+
+def run(sizes, only=None, repeat=5):
+    # The sensor logs every fixture parse at debug/info level; keep output readable
+    logging.getLogger("yahoo_fantasy").setLevel(logging.WARNING)
+    sensor = load_sensor_module()
+    results = {}
+    for size in sizes:
+        for name, func in build_cases(sensor, size).items():
+            if only and not any(pattern in name for pattern in only):
+                continue
+            key = f"{size}/{name}"
+            results[key] = measure(func, repeat, FIXED_LOOPS.get(name))
+            print(f"{key:36s} {results[key]['min_us']:>11.1f} us  (median {results[key]['median_us']:.1f})")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Return the cases that got slower than the baseline by more than tolerance."""
+    regressions = []
+    for key, result in results.items():
+        before = baseline.get("results", {}).get(key)
+        if not before:
+            continue
+        ratio = result["min_us"] / before["min_us"]
+        flag = "REGRESSION" if ratio > 1 + tolerance else ""
+        print(f"{key:36s} {before['min_us']:>11.1f} -> {result['min_us']:>11.1f} us  {ratio:5.2f}x {flag}")
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def machine_info():
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Yahoo Fantasy sensor hot paths offline.")
+    parser.add_argument("--size", action="append", choices=sorted(fixtures.SIZES), help="league size (default: all)")
+    parser.add_argument("-k", dest="only", action="append", help="only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", nargs="?", const=RESULTS_FILE, help=f"write results (default {RESULTS_FILE})")
+    parser.add_argument("--compare", nargs="?", const=BASELINE_FILE, help=f"compare with a baseline (default {BASELINE_FILE})")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing (default 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run(args.size or list(fixtures.SIZES), args.only, args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"machine": machine_info(), "recorded_at": int(time.time()), "results": results}, f, indent=2)
+            f.write("\n")
+        print(f"saved {args.save}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        if baseline.get("machine") != machine_info():
+            print(f"warning: baseline was recorded on {baseline.get('machine')}, timings may not be comparable")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} case(s) slower than baseline by more than {args.tolerance:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
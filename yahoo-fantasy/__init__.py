@@ -1,2 +1,224 @@
 """Yahoo Fantasy Football integration."""
+import io
+import logging
+from collections import OrderedDict
+from urllib.parse import urlparse
 
+import voluptuous as vol
+from aiohttp import web
+
+from homeassistant.components import websocket_api
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+try:
+    # Optional: shrink headshots to the size the card draws them at
+    from PIL import Image
+except ImportError:
+    Image = None
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "yahoo_fantasy"
+
+IMAGE_PROXY_URL = "/api/yahoo_fantasy/image"
+# Only Yahoo's image CDN is proxied
+_IMAGE_PROXY_HOSTS = ("yimg.com",)
+_IMAGE_PROXY_SIZES = (32, 64, 96, 128)
+_IMAGE_MAX_BYTES = 2 * 1024 * 1024  # Larger downloads are refused, not proxied
+_IMAGE_CACHE_SIZE = 300
+_IMAGE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_IMAGE_CACHE = OrderedDict()
+_IMAGE_CACHE_BYTES = 0
+
+
+async def async_setup(hass, config):
+    """Register the websocket command that serves full matchup data and the headshot proxy."""
+    hass.data.setdefault(DOMAIN, {}).setdefault("sensors", {})
+    websocket_api.async_register_command(hass, websocket_get_matchup)
+    websocket_api.async_register_command(hass, websocket_subscribe_matchup)
+    hass.http.register_view(YahooFantasyImageView(hass))
+    hass.http.register_view(YahooFantasyDebugCapturesView(hass))
+    return True
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "yahoo_fantasy/matchup",
+        vol.Required("entity_id"): str,
+    }
+)
+@callback
+def websocket_get_matchup(hass, connection, msg):
+    """Return a matchup sensor's state with every attribute, rosters and stats included."""
+    sensor = hass.data.get(DOMAIN, {}).get("sensors", {}).get(msg["entity_id"])
+    if sensor is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, f"No Yahoo Fantasy sensor {msg['entity_id']}")
+        return
+    connection.send_result(msg["id"], {"state": sensor.state, "attributes": sensor.full_attributes})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "yahoo_fantasy/matchup/subscribe",
+        vol.Required("entity_id"): str,
+    }
+)
+@callback
+def websocket_subscribe_matchup(hass, connection, msg):
+    """Stream a matchup sensor's full data: a snapshot, then only what each update changed."""
+    sensor = hass.data.get(DOMAIN, {}).get("sensors", {}).get(msg["entity_id"])
+    if sensor is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, f"No Yahoo Fantasy sensor {msg['entity_id']}")
+        return
+
+    @callback
+    def forward_delta(delta):
+        connection.send_message(websocket_api.event_message(msg["id"], {"type": "delta", **delta}))
+
+    connection.subscriptions[msg["id"]] = sensor.async_subscribe_matchup(forward_delta)
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(
+        msg["id"], {"type": "snapshot", "state": sensor.state, "attributes": sensor.full_attributes}
+    ))
+
+
+def _image_cache_store(key, entry):
+    """Cache a proxied image, evicting the least recently used past the count or byte limit."""
+    global _IMAGE_CACHE_BYTES
+
+    previous = _IMAGE_CACHE.pop(key, None)
+    if previous is not None:
+        _IMAGE_CACHE_BYTES -= len(previous[0])
+    _IMAGE_CACHE[key] = entry
+    _IMAGE_CACHE_BYTES += len(entry[0])
+    while len(_IMAGE_CACHE) > _IMAGE_CACHE_SIZE or _IMAGE_CACHE_BYTES > _IMAGE_CACHE_MAX_BYTES:
+        _, (body, _) = _IMAGE_CACHE.popitem(last=False)
+        _IMAGE_CACHE_BYTES -= len(body)
+
+
+def _resize_image(body, content_type, size):
+    """Scale an image down to fit size x size pixels, keeping it as is if that isn't possible."""
+    if Image is None:
+        return body, content_type
+    try:
+        with Image.open(io.BytesIO(body)) as image:
+            if max(image.size) <= size:
+                return body, content_type
+            image.thumbnail((size, size))
+            output = io.BytesIO()
+            image.save(output, format="PNG", optimize=True)
+            return output.getvalue(), "image/png"
+    except Exception as e:
+        _LOGGER.debug(f"Could not resize image, serving the original: {e}")
+        return body, content_type
+
+
+class YahooFantasyImageView(HomeAssistantView):
+    """Serve Yahoo player headshots resized and cached for the dashboard card."""
+
+    url = IMAGE_PROXY_URL
+    name = "api:yahoo_fantasy:image"
+
+    def __init__(self, hass):
+        self.hass = hass
+
+    async def get(self, request):
+        url = request.query.get("url", "")
+        host = urlparse(url).hostname or ""
+        if not any(host == allowed or host.endswith(f".{allowed}") for allowed in _IMAGE_PROXY_HOSTS):
+            return web.Response(status=400, text="Not a Yahoo image URL")
+
+        # Snap to a few sizes so the cache isn't split by every requested width
+        try:
+            requested = int(request.query.get("size", _IMAGE_PROXY_SIZES[-1]))
+        except ValueError:
+            requested = _IMAGE_PROXY_SIZES[-1]
+        size = next((s for s in _IMAGE_PROXY_SIZES if s >= requested), _IMAGE_PROXY_SIZES[-1])
+
+        key = (url, size)
+        cached = _IMAGE_CACHE.get(key)
+        if cached is not None:
+            _IMAGE_CACHE.move_to_end(key)
+        else:
+            try:
+                session = async_get_clientsession(self.hass)
+                # Redirects aren't followed: they could lead off the allowed hosts
+                async with session.get(url, timeout=10, allow_redirects=False) as response:
+                    if response.status != 200:
+                        return web.Response(status=502, text=f"Yahoo returned {response.status}")
+                    content_type = response.content_type
+                    if not content_type.startswith("image/"):
+                        return web.Response(status=502, text=f"Yahoo returned {content_type}, not an image")
+                    if (response.content_length or 0) > _IMAGE_MAX_BYTES:
+                        return web.Response(status=502, text="Image too large")
+                    body = bytearray()
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        body.extend(chunk)
+                        if len(body) > _IMAGE_MAX_BYTES:
+                            return web.Response(status=502, text="Image too large")
+                    body = bytes(body)
+            except Exception as e:
+                _LOGGER.debug(f"Could not fetch headshot {url}: {e}")
+                return web.Response(status=502, text="Could not fetch image")
+
+            cached = await self.hass.async_add_executor_job(_resize_image, body, content_type, size)
+            _image_cache_store(key, cached)
+
+        body, content_type = cached
+        return web.Response(body=body, content_type=content_type,
+                            headers={"Cache-Control": "private, max-age=86400"})
+
+
+class YahooFantasyDebugCapturesView(HomeAssistantView):
+    """List the debug mode captures, or download one as a .json.gz file.
+
+    With ?analysis=raw_structure,all_keys,... a capture's debug analyses are
+    returned as JSON instead, see YahooFantasyMatchupSensor.debug_analysis.
+    """
+
+    url = "/api/yahoo_fantasy/debug_captures"
+    extra_urls = ["/api/yahoo_fantasy/debug_captures/{name}"]
+    name = "api:yahoo_fantasy:debug_captures"
+
+    def __init__(self, hass):
+        self.hass = hass
+
+    async def get(self, request, name=None):
+        # Imported here so the integration can be set up before the sensor platform
+        from .sensor import get_debug_capture_store
+
+        store = get_debug_capture_store()
+        if name is None:
+            captures = await self.hass.async_add_executor_job(
+                store.list_captures, request.query.get("league_id"), request.query.get("team_id")
+            )
+            return self.json(captures)
+
+        if request.query.get("analysis"):
+            return await self._analysis(name, request.query["analysis"].split(","))
+
+        body = await self.hass.async_add_executor_job(store.read_capture, name)
+        if body is None:
+            return web.Response(status=404, text="No such capture")
+        return web.Response(body=body, content_type="application/gzip",
+                            headers={"Content-Disposition": f'attachment; filename="{name}"'})
+
+    async def _analysis(self, name, analyses):
+        sensors = list(self.hass.data.get(DOMAIN, {}).get("sensors", {}).values())
+        # Prefer the sensor that made the capture, for its stat categories; names are {time}_{league}_{team}_...
+        parts = name.split("_", 3)
+        owner = next((sensor for sensor in sensors
+                      if len(parts) > 2 and [str(sensor._league_id), str(sensor._team_id)] == parts[1:3]), None)
+        sensor = owner or (sensors[0] if sensors else None)
+        if sensor is None:
+            return web.Response(status=404, text="No Yahoo Fantasy sensor to analyze with")
+        try:
+            result = await self.hass.async_add_executor_job(sensor.debug_analysis, name, analyses)
+        except ServiceValidationError as e:
+            return web.Response(status=404, text=str(e))
+        except HomeAssistantError as e:
+            return web.Response(status=500, text=str(e))
+        return self.json(result)
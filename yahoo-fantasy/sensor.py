@@ -1,14 +1,59 @@
+import asyncio
+import bisect
+import functools
+import gzip
+import hashlib
+import itertools
 import logging
 import json
+import math
 import os
+import queue
+import random
+import re
 import time
-from threading import Lock, RLock
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from threading import Condition, Event, Lock, RLock, Thread
+from urllib.parse import urlparse
+from zoneinfo import ZoneInfo
 
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
 from yahoo_oauth import OAuth2
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_track_time_interval
+
+try:
+    # Optional: HTTP/2 transport, used when both are installed
+    import httpx
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
+try:
+    # Optional: vectorized fantasy scoring, see score_player_stats
+    import numpy as np
+except ImportError:
+    np = None
 
 _LOGGER = logging.getLogger(__name__)
 
+# Check often; each sensor decides in _should_update whether a refresh is actually due
+# and only writes its state when something it exposes changed
+SCAN_INTERVAL = timedelta(seconds=15)
+
+DOMAIN = "yahoo_fantasy"
+
+YAHOO_API_BASE = "https://fantasysports.yahooapis.com/fantasy/v2"
+
 OAUTH_FILE = "/config/oauth.json"
 _TOKEN_LOCK = RLock()
 _GLOBAL_OAUTH = None
@@ -18,12 +63,161 @@ _LAST_SESSION_RESET = 0
 # Global cache for stat categories and league settings
 _STAT_CATEGORIES_CACHE = {}
 _LEAGUE_SETTINGS_CACHE = {}
+_ROSTER_ENDPOINT_CACHE = {}  # {league_key: roster endpoint variant that returned a roster}
 _STAT_CACHE_LOCK = Lock()
 _SETTINGS_CACHE_LOCK = Lock()
 
-# Debug data storage
-_DEBUG_DATA_CACHE = {}
-_DEBUG_CACHE_LOCK = Lock()
+# On-disk copy of the caches above so a restart doesn't refetch them
+PERSISTENT_CACHE_FILE = "/config/.storage/yahoo_fantasy.cache"
+_PERSISTENT_CACHE_VERSION = 1
+_PERSISTENT_CACHE_TTL = 7 * 24 * 3600  # Settings rarely change mid-season; league edits invalidate early
+_PERSISTENT_CACHE_SECTIONS = {
+    "league_settings": _LEAGUE_SETTINGS_CACHE,  # keyed by league_key
+    "stat_categories": _STAT_CATEGORIES_CACHE,  # keyed by game_key
+    "roster_endpoints": _ROSTER_ENDPOINT_CACHE,  # keyed by league_key
+}
+_CACHE_ENTRY_META = {}  # {(section, key): {"saved_at": ts, ...}}
+_PERSISTENT_CACHE_LOCK = Lock()
+_PERSISTENT_CACHE_LOADED = False
+
+# Debug mode captures raw responses to a gzipped ring buffer on disk, see DebugCaptureStore
+DEBUG_CAPTURE_DIR = "/config/.storage/yahoo_fantasy_debug"
+_DEBUG_CAPTURE_MAX_BYTES = 50 * 1024 * 1024
+_DEBUG_CAPTURE_MAX_AGE = 24 * 3600
+_DEBUG_CAPTURE_QUEUE_SIZE = 256  # Captures waiting for the writer; more are dropped, not waited on
+_DEBUG_CAPTURE_STORE = None
+_DEBUG_CAPTURE_LOCK = Lock()
+
+# Debug analyses run only when asked for, through the debug_analysis service or
+# the capture download view, and are memoized by response content hash
+DEBUG_ANALYSES = ("raw_structure", "all_keys", "translated_data", "found_patterns")
+# LRU of {(response hash, analysis, stat categories hash): (result, size)}, bounded by entries and bytes
+_DEBUG_ANALYSIS_CACHE = OrderedDict()
+_DEBUG_ANALYSIS_CACHE_SIZE = 64
+_DEBUG_ANALYSIS_CACHE_MAX_BYTES = 16 * 1024 * 1024  # Estimated from each result's JSON size
+_DEBUG_ANALYSIS_CACHE_BYTES = 0
+_DEBUG_ANALYSIS_LOCK = Lock()
+
+# Parsed Yahoo responses keyed by URL, revalidated with ETag/Last-Modified
+_RESPONSE_CACHE = OrderedDict()
+_RESPONSE_CACHE_LOCK = Lock()
+_RESPONSE_CACHE_MAX_ENTRIES = 128
+_CURRENT_WEEKS = {}  # {game_key: current week}, used to tell past weeks from live ones
+
+# Background OAuth token refresh; see YahooTokenRefresher
+_TOKEN_REFRESHER = None
+_TOKEN_LIFETIME = 3600  # Yahoo access tokens expire an hour after issue
+_TOKEN_REFRESH_MARGIN = 5 * 60
+_TOKEN_REFRESH_RETRY = 30  # Wait after a failed refresh before trying again
+_TOKEN_REFRESH_POLL = 60  # Longest sleep between expiry checks
+
+# Shared HTTP client for the sync request path; the OAuth token travels in per-request headers
+_TRANSPORT = None
+_TRANSPORT_LOCK = Lock()
+_TRANSPORT_OPTIONS = {"pool_size": None, "http2": True}
+_TRANSPORT_DEFAULT_POOL_SIZE = 10
+
+# Retry policy for API requests: full-jitter exponential backoff, capped by a per-endpoint budget
+_RETRY_BASE_DELAY = 1
+_RETRY_MAX_DELAY = 30
+_RETRY_AFTER_MAX = 60  # Asked to wait longer than this, give up and leave it to the next update
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504, 999}  # Yahoo answers 999 when it throttles a client
+_RETRY_BUDGET_RATIO = 0.2  # Each request earns a fifth of a retry
+_RETRY_BUDGET_INITIAL = 3
+_RETRY_BUDGET_MAX = 10
+_RETRY_BUDGETS = {}  # {endpoint kind: RetryBudget}
+_RETRY_STATS = {"requests": 0, "retries": 0, "rate_limited": 0, "budget_exhausted": 0, "served_stale": 0}
+_RETRY_LOCK = Lock()
+
+# Circuit breaker per API host
+_BREAKER_FAILURE_THRESHOLD = 5
+_BREAKER_COOLDOWN = 60
+_BREAKER_MAX_COOLDOWN = 10 * 60
+_BREAKER_PROBE_TIMEOUT = 90  # A half-open probe that never reports back frees the slot after this
+_CIRCUIT_BREAKERS = {}  # {host: CircuitBreaker}
+
+# Client-side rate limit shared by every request to Yahoo; the lowest configured rate wins
+_RATE_LIMITER = None
+_RATE_LIMITER_LOCK = Lock()
+_RATE_LIMIT_DEFAULT = 4.0  # Requests per second
+_RATE_LIMIT_DEFAULT_BURST = 20
+# Coroutines retry a lock held by a thread after this long, doubling up to the max
+_RATE_LIMIT_LOCK_RETRY = 0.001
+_RATE_LIMIT_LOCK_RETRY_MAX = 0.02
+
+# Request priorities, most urgent first: waiting requests are served in this order
+PRIORITY_LIVE = 0  # Scoreboard, rosters and player stats
+PRIORITY_METADATA = 1  # League and team metadata
+PRIORITY_SETTINGS = 2  # League settings and stat categories, cached for a day
+PRIORITY_DEBUG = 3  # Debug mode fan-out
+_PRIORITY_NAMES = {PRIORITY_LIVE: "live", PRIORITY_METADATA: "metadata", PRIORITY_SETTINGS: "settings", PRIORITY_DEBUG: "debug"}
+
+# Player stats batches: fetched concurrently, sized from recent response times
+_STATS_FETCH_WORKERS = 4
+_STATS_EXECUTOR = None
+_STATS_EXECUTOR_LOCK = Lock()
+_STATS_BATCH_MAX = 25  # Yahoo returns at most 25 players per request
+_STATS_BATCH_MIN = 5
+_STATS_BATCH_STEP = 5
+_STATS_BATCH_FAST = 1.0  # Full batches answered quicker than this grow the batch size
+_STATS_BATCH_SLOW = 3.0  # Batches slower than this, or failing, halve it
+_STATS_MAX_URL_LENGTH = 2000
+
+# Response TTLs in seconds; a TTL of 0 means always revalidate with a conditional request
+_RESPONSE_TTL_PAST_WEEK = 7 * 24 * 3600
+_RESPONSE_TTL_SETTINGS = 24 * 3600
+_RESPONSE_TTL_LIVE = 0
+
+# Adaptive polling intervals in seconds, picked from matchup status and NFL game windows
+_INTERVAL_GAME_WINDOW = 120
+_INTERVAL_BETWEEN_WINDOWS = 30 * 60
+_INTERVAL_PREEVENT = 60 * 60
+_INTERVAL_POSTEVENT = 6 * 60 * 60
+_LIVE_ACTIVITY_GRACE = 10 * 60  # Keep live polling through short lulls like halftime
+
+# NFL kickoff windows in US/Eastern: {weekday (Mon=0): [(start_hour, end_hour)]}
+_NFL_TIMEZONE = ZoneInfo("America/New_York")
+_NFL_GAME_WINDOWS = {
+    0: [(0, 1), (19, 24)],  # Sunday night spillover, Monday night
+    1: [(0, 1)],            # Monday night spillover
+    3: [(19, 24)],          # Thursday night
+    4: [(0, 1)],            # Thursday night spillover
+    5: [(12, 24)],          # Late-season Saturday games
+    6: [(9, 24)],           # Sunday, including international morning games
+}
+
+def in_nfl_game_window(now=None):
+    """Check whether NFL games are likely being played at the given time."""
+    now = (now or datetime.now(_NFL_TIMEZONE)).astimezone(_NFL_TIMEZONE)
+    hour = now.hour + now.minute / 60
+    return any(start <= hour < end for start, end in _NFL_GAME_WINDOWS.get(now.weekday(), []))
+
+def seconds_until_nfl_game_window(now=None):
+    """Seconds until the next NFL game window opens, or 0 inside one."""
+    now = (now or datetime.now(_NFL_TIMEZONE)).astimezone(_NFL_TIMEZONE)
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    for days in range(8):
+        day = midnight + timedelta(days=days)
+        for start, end in _NFL_GAME_WINDOWS.get(day.weekday(), []):
+            if now < day + timedelta(hours=end):
+                return max(0, int((day + timedelta(hours=start) - now).total_seconds()))
+    return _INTERVAL_PREEVENT
+
+# Shared league-wide data coordinators, keyed by league key
+_LEAGUE_COORDINATORS = {}
+_COORDINATORS_LOCK = Lock()
+
+# Bound on concurrent Yahoo requests made by the async update path
+_ASYNC_FETCH_LIMIT = 4
+_ASYNC_FETCH_SEMAPHORE = None
+
+def _get_async_fetch_semaphore():
+    """Get or create the semaphore bounding concurrent async Yahoo requests."""
+    global _ASYNC_FETCH_SEMAPHORE
+
+    if _ASYNC_FETCH_SEMAPHORE is None:
+        _ASYNC_FETCH_SEMAPHORE = asyncio.Semaphore(_ASYNC_FETCH_LIMIT)
+    return _ASYNC_FETCH_SEMAPHORE
 
 def find_key(data, key):
     """Recursively find first occurrence of key in nested dict/list."""
@@ -41,6 +235,258 @@ def find_key(data, key):
                 return result
     return None
 
+def find_all_keys(data, key, results=None):
+    """Recursively collect every occurrence of key in nested dict/list."""
+    if results is None:
+        results = []
+    if isinstance(data, dict):
+        if key in data:
+            results.append(data[key])
+        for v in data.values():
+            find_all_keys(v, key, results)
+    elif isinstance(data, list):
+        for item in data:
+            find_all_keys(item, key, results)
+    return results
+
+def index_keys(data, keys):
+    """Map each of keys to its first non-null value in nested dict/list, in one pass.
+
+    Visits nodes in the same order as find_key and stops as soon as every key
+    has been found.
+    """
+    index = {}
+    remaining = set(keys)
+
+    def walk(node):
+        if isinstance(node, dict):
+            if not remaining.isdisjoint(node):
+                for k in remaining.intersection(node):
+                    if node[k] is not None:
+                        index[k] = node[k]
+                remaining.difference_update(index)
+                if not remaining:
+                    return True
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            return False
+        for child in children:
+            if isinstance(child, (dict, list)) and walk(child):
+                return True
+        return False
+
+    walk(data)
+    return index
+
+def flatten_record(record):
+    """Merge a Yahoo list-of-dicts record into a single key->value map.
+
+    Yahoo returns each entity as a list of one-key dicts, with the metadata
+    block nested one list deeper (e.g. [[{"player_id": ...}, {"name": ...}],
+    {"selected_position": ...}]). The first non-null value for a key wins.
+    """
+    flat = {}
+    items = record if isinstance(record, list) else [record]
+    for item in items:
+        parts = item if isinstance(item, list) else [item]
+        for part in parts:
+            if isinstance(part, dict):
+                for key, value in part.items():
+                    if value is not None and key not in flat:
+                        flat[key] = value
+    return flat
+
+# Where Yahoo nests a field below the top level of its record
+_RECORD_PATHS = {
+    "nickname": ("managers", 0, "manager", "nickname"),
+    "team_logo": ("team_logos", 0, "team_logo"),
+    "teams": ("0", "teams"),
+}
+
+def compile_record_fields(*keys):
+    """Precompute the accessor path for each field read from a record type.
+
+    The first key identifies the entity and is used to detect records that
+    are not in the usual shape.
+    """
+    return tuple((key, _RECORD_PATHS.get(key, (key,))) for key in keys)
+
+_PLAYER_RECORD_FIELDS = compile_record_fields(
+    "player_id", "name", "display_position", "position", "editorial_team_abbr",
+    "team_abbr", "image_url", "uniform_number", "selected_position", "is_editable",
+)
+_PLAYER_STATS_RECORD_FIELDS = compile_record_fields("player_id", "player_stats")
+_TEAM_RECORD_FIELDS = compile_record_fields(
+    "team_id", "name", "nickname", "manager", "team_logo", "team_points", "team_projected_points",
+)
+_MATCHUP_RECORD_FIELDS = compile_record_fields("week", "status", "is_tied", "winner_team_key", "teams")
+
+def read_record(record, fields):
+    """Read compiled fields from a Yahoo record without re-walking it per field.
+
+    Records that don't flatten to their identifying key fall back to a single
+    index_keys walk, which finds the same values find_key would.
+    """
+    flat = flatten_record(record)
+    if flat.get(fields[0][0]) is None:
+        return index_keys(record, [key for key, _ in fields])
+
+    values = {}
+    for key, path in fields:
+        value = flat.get(path[0])
+        for step in path[1:]:
+            if isinstance(value, dict):
+                value = value.get(step)
+            elif isinstance(value, list) and isinstance(step, int) and step < len(value):
+                value = value[step]
+            else:
+                value = None
+                break
+        if value is not None:
+            values[key] = value
+    return values
+
+def split_teams_collection(data):
+    """Map team ID to team data for each team in a teams collection response."""
+    teams_data = find_key(data, "teams")
+    if not teams_data:
+        return {}
+
+    team_items = []
+    if isinstance(teams_data, dict):
+        team_items = [v for k, v in teams_data.items() if k != "count"]
+    elif isinstance(teams_data, list):
+        team_items = teams_data
+
+    teams = {}
+    for team_item in team_items:
+        if not isinstance(team_item, dict):
+            continue
+        team_info = team_item.get("team", team_item)
+        team_id = find_key(team_info, "team_id")
+        if team_id is not None:
+            teams[str(team_id)] = team_info
+    return teams
+
+def scoreboard_matchup_team_ids(scoreboard_data):
+    """List the team IDs taking part in each matchup of a scoreboard response."""
+    matchups = find_key(scoreboard_data, "matchups")
+    if not matchups:
+        return []
+
+    matchup_items = []
+    if isinstance(matchups, dict):
+        matchup_items = [v for k, v in matchups.items() if k != "count"]
+    elif isinstance(matchups, list):
+        matchup_items = matchups
+
+    team_ids = []
+    for matchup_item in matchup_items:
+        if not isinstance(matchup_item, dict):
+            continue
+        matchup_info = matchup_item.get("matchup", matchup_item)
+        ids = [str(team_id) for team_id in find_all_keys(find_key(matchup_info, "teams"), "team_id")]
+        if ids:
+            team_ids.append(ids)
+    return team_ids
+
+def _stat_float(value):
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+def score_player_stats(player_stats, stat_modifiers):
+    """Score many players against a league's stat modifiers in one batch.
+
+    player_stats maps any key, e.g. player_id or (week, player_id) for
+    history, to _extract_player_stats output. Returns {key: {"points_total":
+    total, "stat_points": {stat_id: points}}} with the same rounding as
+    _calculate_projected_points. With NumPy installed the stats become a
+    players x stat_id matrix scored with one product against the modifier
+    vector; otherwise each player is scored in Python.
+    """
+    modifiers = {}
+    for stat_id, modifier in (stat_modifiers or {}).items():
+        modifier = _stat_float(modifier)
+        if modifier is not None:
+            modifiers[stat_id] = modifier
+    if not player_stats or not modifiers:
+        return {}
+
+    keys = list(player_stats)
+    if np is None:
+        scores = {}
+        for key in keys:
+            total = 0.0
+            stat_points = {}
+            for stat_id, value in (player_stats[key].get("stats_by_id") or {}).items():
+                modifier = modifiers.get(stat_id)
+                value = _stat_float(value) if modifier is not None else None
+                if value is not None:
+                    total += value * modifier
+                    stat_points[stat_id] = round(value * modifier, 2)
+            scores[key] = {"points_total": round(total, 2), "stat_points": stat_points}
+        return scores
+
+    # Build the players x stat_id matrix row by row in Python and convert once;
+    # NaN marks stats a player doesn't have, or non-numeric ones, which score nothing
+    stat_ids = list(modifiers)
+    columns = {stat_id: j for j, stat_id in enumerate(stat_ids)}
+    rows = []
+    for key in keys:
+        row = [math.nan] * len(stat_ids)
+        for stat_id, value in (player_stats[key].get("stats_by_id") or {}).items():
+            j = columns.get(stat_id)
+            if j is not None:
+                try:
+                    row[j] = float(value)
+                except (ValueError, TypeError):
+                    pass
+        rows.append(row)
+
+    values = np.array(rows, dtype=float)
+    present = ~np.isnan(values)
+    points = np.where(present, values * np.array([modifiers[stat_id] for stat_id in stat_ids]), 0.0)
+    totals = points.sum(axis=1).tolist()
+
+    scores = {}
+    for key, total, row, row_present in zip(keys, totals, points.tolist(), present.tolist()):
+        scores[key] = {
+            "points_total": round(total, 2),
+            "stat_points": {stat_ids[j]: round(row[j], 2) for j, has in enumerate(row_present) if has},
+        }
+    return scores
+
+def _debug_analysis_cache_get(key):
+    """A memoized analysis result, marked as most recently used, or None."""
+    with _DEBUG_ANALYSIS_LOCK:
+        entry = _DEBUG_ANALYSIS_CACHE.get(key)
+        if entry is None:
+            return None
+        _DEBUG_ANALYSIS_CACHE.move_to_end(key)
+        return entry[0]
+
+def _debug_analysis_cache_store(key, result):
+    """Memoize an analysis result, evicting the least recently used past either limit."""
+    global _DEBUG_ANALYSIS_CACHE_BYTES
+
+    size = len(json.dumps(result, default=str))
+    if size > _DEBUG_ANALYSIS_CACHE_MAX_BYTES:
+        return
+    with _DEBUG_ANALYSIS_LOCK:
+        previous = _DEBUG_ANALYSIS_CACHE.pop(key, None)
+        if previous is not None:
+            _DEBUG_ANALYSIS_CACHE_BYTES -= previous[1]
+        _DEBUG_ANALYSIS_CACHE[key] = (result, size)
+        _DEBUG_ANALYSIS_CACHE_BYTES += size
+        while (len(_DEBUG_ANALYSIS_CACHE) > _DEBUG_ANALYSIS_CACHE_SIZE
+               or _DEBUG_ANALYSIS_CACHE_BYTES > _DEBUG_ANALYSIS_CACHE_MAX_BYTES):
+            _, (_, evicted_size) = _DEBUG_ANALYSIS_CACHE.popitem(last=False)
+            _DEBUG_ANALYSIS_CACHE_BYTES -= evicted_size
+
 def explore_data_structure(data, path="", max_depth=10, current_depth=0):
     """Recursively explore data structure to find all keys and sample values."""
     if current_depth > max_depth:
@@ -129,6 +575,952 @@ CONF_LEAGUE_ID = "league_id"
 CONF_TEAM_ID = "team_id"
 CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
 CONF_DEBUG_MODE = "debug_mode"  # New debug configuration
+CONF_FETCH_MODE = "fetch_mode"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_LIVE_UPDATE_INTERVAL = "live_update_interval"
+CONF_API_BASE_URL = "api_base_url"  # Point at a local stand-in for load testing
+CONF_CONNECTION_POOL_SIZE = "connection_pool_size"
+CONF_HTTP2 = "http2"
+CONF_TOKEN_REFRESH_MARGIN = "token_refresh_margin"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_LIMIT_BURST = "rate_limit_burst"
+CONF_PARALLEL_STATS = "parallel_stats"
+CONF_ATTRIBUTE_MODE = "attribute_mode"
+
+FETCH_MODE_STANDARD = "standard"
+FETCH_MODE_SNAPSHOT = "snapshot"  # Chained collection requests, see YahooFantasyLeagueCoordinator
+# After a failed snapshot the league uses standard requests for a while, doubling up to the max
+_SNAPSHOT_RETRY_BACKOFF = 5 * 60
+_SNAPSHOT_RETRY_BACKOFF_MAX = 60 * 60
+# A failed league refresh is handed to every sensor asking within this window instead of being repeated
+_COORDINATOR_FAILURE_TTL = 60
+
+ATTRIBUTE_MODE_FULL = "full"
+ATTRIBUTE_MODE_COMPACT = "compact"  # Scalars only on the entity; the rest through the yahoo_fantasy/matchup websocket command
+
+# Attributes kept out of the recorder database: rosters, scorer lists and diagnostics are rewritten every update
+_UNRECORDED_ATTRIBUTES = frozenset({
+    "our_roster",
+    "opponent_roster",
+    "changed_players",
+    "league_info",
+    "our_touchdown_scorers",
+    "opponent_touchdown_scorers",
+    "token_refresh",
+    "api_health",
+    "_matchup_teams",
+    "debug_matchup_teams",
+    "debug_captures",
+    "debug_analysis",
+})
+
+# Diagnostics that move on every update; they alone don't warrant a state write
+_VOLATILE_ATTRIBUTES = frozenset({"token_refresh", "api_health"})
+
+# Roster lists that matchup deltas diff player by player
+_ROSTER_ATTRIBUTES = ("our_roster", "opponent_roster")
+
+# Player fields that make a state write necessary when they change; stats are
+# covered by the sensor's stats revision instead
+_FINGERPRINT_PLAYER_FIELDS = (
+    "player_id", "name", "position", "selected_position", "team", "is_starting",
+    "image_url", "uniform_number", "points_total",
+)
+
+def _roster_player_key(player):
+    return str(player.get("player_id") or player.get("name"))
+
+def roster_delta(previous, current):
+    """Players added or changed, players removed, and the new order if it moved."""
+    previous = previous or []
+    current = current or []
+    before = {_roster_player_key(player): player for player in previous}
+    order = [_roster_player_key(player) for player in current]
+
+    delta = {}
+    changed = [player for key, player in zip(order, current) if before.get(key) != player]
+    if changed:
+        delta["changed"] = changed
+    remaining = set(order)
+    removed = [key for key in before if key not in remaining]
+    if removed:
+        delta["removed"] = removed
+    if order != list(before):
+        delta["order"] = order
+    return delta
+
+def matchup_delta(previous, current):
+    """What changed between two versions of a sensor's full attributes, or None if nothing did.
+
+    Rosters are diffed per player, see roster_delta; every other attribute is
+    sent whole when it changes. Diagnostics that change on every update are
+    carried along but don't make a delta on their own.
+    """
+    attributes = {}
+    for key, value in current.items():
+        if key not in _ROSTER_ATTRIBUTES and (key not in previous or previous[key] != value):
+            attributes[key] = value
+    removed = [key for key in previous if key not in current and key not in _ROSTER_ATTRIBUTES]
+
+    rosters = {}
+    for name in _ROSTER_ATTRIBUTES:
+        if name in previous or name in current:
+            changes = roster_delta(previous.get(name), current.get(name))
+            if changes:
+                rosters[name] = changes
+
+    if not rosters and not removed and _VOLATILE_ATTRIBUTES.issuperset(attributes):
+        return None
+    return {"attributes": attributes, "removed": removed, "rosters": rosters}
+
+def load_persistent_cache():
+    """Load unexpired cache entries from disk into the in-memory caches (once per process)."""
+    global _PERSISTENT_CACHE_LOADED
+
+    with _PERSISTENT_CACHE_LOCK:
+        if _PERSISTENT_CACHE_LOADED:
+            return
+        _PERSISTENT_CACHE_LOADED = True
+
+        if not os.path.exists(PERSISTENT_CACHE_FILE):
+            return
+
+        try:
+            with open(PERSISTENT_CACHE_FILE, "r") as f:
+                stored = json.load(f)
+        except Exception as e:
+            _LOGGER.warning(f"Could not read cache file {PERSISTENT_CACHE_FILE}: {e}")
+            return
+
+        if stored.get("version") != _PERSISTENT_CACHE_VERSION:
+            _LOGGER.info(f"Ignoring cache file with schema version {stored.get('version')}")
+            return
+
+        now = time.time()
+        loaded = 0
+        for section, entries in stored.get("data", {}).items():
+            cache = _PERSISTENT_CACHE_SECTIONS.get(section)
+            if cache is None:
+                continue
+            for key, entry in entries.items():
+                meta = {k: v for k, v in entry.items() if k != "data"}
+                if now - meta.get("saved_at", 0) >= _PERSISTENT_CACHE_TTL:
+                    continue
+                cache[key] = entry["data"]
+                _CACHE_ENTRY_META[(section, key)] = meta
+                loaded += 1
+
+        _LOGGER.info(f"Loaded {loaded} cached entries from {PERSISTENT_CACHE_FILE}")
+
+def save_persistent_cache():
+    """Write the in-memory caches to disk in a compact form."""
+    with _PERSISTENT_CACHE_LOCK:
+        data = {}
+        for section, cache in _PERSISTENT_CACHE_SECTIONS.items():
+            data[section] = {
+                key: {**_CACHE_ENTRY_META.get((section, key), {"saved_at": time.time()}), "data": value}
+                for key, value in list(cache.items())
+            }
+
+        try:
+            os.makedirs(os.path.dirname(PERSISTENT_CACHE_FILE), exist_ok=True)
+            temp_file = f"{PERSISTENT_CACHE_FILE}.tmp"
+            with open(temp_file, "w") as f:
+                json.dump({"version": _PERSISTENT_CACHE_VERSION, "data": data}, f, separators=(",", ":"))
+            os.replace(temp_file, PERSISTENT_CACHE_FILE)
+        except Exception as e:
+            _LOGGER.warning(f"Could not write cache file {PERSISTENT_CACHE_FILE}: {e}")
+
+def _remember_cache_entry(section, key, **meta):
+    """Record when a cache entry was stored, plus any versioning info."""
+    _CACHE_ENTRY_META[(section, key)] = {"saved_at": time.time(), **meta}
+
+def _get_cache_entry(section, key):
+    """Return a cached entry if present and within its TTL."""
+    value = _PERSISTENT_CACHE_SECTIONS[section].get(key)
+    if value is None:
+        return None
+
+    meta = _CACHE_ENTRY_META.get((section, key), {})
+    if time.time() - meta.get("saved_at", time.time()) >= _PERSISTENT_CACHE_TTL:
+        return None
+    return value
+
+def invalidate_league_cache(league_key=None, game_key=None, persist=True):
+    """Drop cached league settings and/or stat categories, e.g. after a mid-season settings change.
+
+    With no arguments every entry is dropped.
+    """
+    targets = []
+    if league_key is None and game_key is None:
+        targets = [(section, key) for section, cache in _PERSISTENT_CACHE_SECTIONS.items() for key in list(cache)]
+    if league_key is not None:
+        targets.append(("league_settings", league_key))
+    if game_key is not None:
+        targets.append(("stat_categories", game_key))
+
+    for section, key in targets:
+        _PERSISTENT_CACHE_SECTIONS[section].pop(key, None)
+        _CACHE_ENTRY_META.pop((section, key), None)
+        _LOGGER.info(f"Invalidated cached {section} for {key}")
+
+    if persist:
+        save_persistent_cache()
+
+def check_league_settings_version(league_key, league_data):
+    """Invalidate cached league settings if Yahoo reports the league changed since they were stored.
+
+    Returns True when the cached settings were dropped.
+    """
+    timestamp = find_key(league_data, "league_update_timestamp")
+    meta = _CACHE_ENTRY_META.get(("league_settings", league_key))
+    if timestamp is None or not meta or meta.get("league_update_timestamp") in (None, str(timestamp)):
+        return False
+
+    _LOGGER.info(f"League {league_key} was updated since its settings were cached, refetching")
+    # The next successful fetch rewrites the file, so don't block on disk here
+    invalidate_league_cache(league_key=league_key, persist=False)
+    return True
+
+def note_current_week(game_key, week):
+    """Remember a game's current week so past-week responses can be cached as immutable."""
+    if week:
+        _CURRENT_WEEKS[str(game_key)] = week
+
+def _response_ttl(url):
+    """How long a response for this URL can be served without revalidating."""
+    path = url.split("/fantasy/v2/", 1)[-1].split("?")[0]
+
+    week_match = re.search(r"week=(\d+)", path)
+    if week_match:
+        game_match = re.search(r"(\w+)\.[lpt]\.\d+", path)
+        current_week = _CURRENT_WEEKS.get(game_match.group(1)) if game_match else None
+        try:
+            if current_week and int(week_match.group(1)) < int(current_week):
+                return _RESPONSE_TTL_PAST_WEEK
+        except (ValueError, TypeError):
+            pass
+        return _RESPONSE_TTL_LIVE
+
+    # Snapshot league requests carry the live scoreboard even when they include settings
+    if "scoreboard" not in path and (path.endswith("/settings") or path.endswith("/stat_categories")):
+        return _RESPONSE_TTL_SETTINGS
+
+    return _RESPONSE_TTL_LIVE
+
+def _response_cache_get(url):
+    """Return the cached entry for a URL, if any."""
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(url)
+        if entry is not None:
+            _RESPONSE_CACHE.move_to_end(url)
+        return entry
+
+def _response_cache_is_fresh(entry):
+    """Check whether a cached entry can be served without asking Yahoo."""
+    return entry is not None and time.time() < entry["expires_at"]
+
+def _conditional_headers(entry):
+    """Build If-None-Match / If-Modified-Since headers for revalidating a cached entry."""
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+def _response_cache_store(url, response_headers, data):
+    """Cache a parsed response along with its validators."""
+    entry = {
+        "data": data,
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+        "expires_at": time.time() + _response_ttl(url),
+    }
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[url] = entry
+        _RESPONSE_CACHE.move_to_end(url)
+        while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX_ENTRIES:
+            _RESPONSE_CACHE.popitem(last=False)
+
+def _response_cache_revalidated(url, entry):
+    """Extend a cached entry after a 304 and return its parsed data."""
+    entry["expires_at"] = time.time() + _response_ttl(url)
+    return entry["data"]
+
+def configure_transport(pool_size=None, http2=None):
+    """Set options for the shared transport; they apply when it is next created."""
+    with _TRANSPORT_LOCK:
+        if pool_size:
+            # Sensors may ask for different sizes; the shared pool serves the largest
+            _TRANSPORT_OPTIONS["pool_size"] = max(_TRANSPORT_OPTIONS["pool_size"] or 0, int(pool_size))
+        if http2 is not None:
+            _TRANSPORT_OPTIONS["http2"] = http2
+
+def get_transport():
+    """Return the HTTP client shared by every sensor, creating it on first use.
+
+    Connections are pooled and kept alive across updates, and token refreshes
+    don't touch them. With httpx and h2 installed the client speaks HTTP/2,
+    so concurrent requests can share one connection to Yahoo.
+    """
+    global _TRANSPORT
+
+    transport = _TRANSPORT
+    if transport is not None:
+        return transport
+
+    with _TRANSPORT_LOCK:
+        if _TRANSPORT is None:
+            pool_size = _TRANSPORT_OPTIONS["pool_size"] or _TRANSPORT_DEFAULT_POOL_SIZE
+            if _TRANSPORT_OPTIONS["http2"] and httpx is not None:
+                _TRANSPORT = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+                )
+                _LOGGER.debug(f"Created HTTP/2 transport with {pool_size} connections")
+            else:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _TRANSPORT = session
+                _LOGGER.debug(f"Created HTTP/1.1 transport with {pool_size} pooled connections")
+        return _TRANSPORT
+
+def close_transport():
+    """Close the shared transport and its pooled connections."""
+    global _TRANSPORT
+
+    with _TRANSPORT_LOCK:
+        if _TRANSPORT is not None:
+            try:
+                _TRANSPORT.close()
+            except Exception as e:
+                _LOGGER.debug(f"Error closing HTTP transport: {e}")
+            _TRANSPORT = None
+
+class YahooApiError(Exception):
+    """An HTTP error answer from the Yahoo API."""
+
+    def __init__(self, status, retry_after=None, message=None):
+        super().__init__(message or f"Yahoo API returned HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self):
+        return self.status in _RETRYABLE_STATUSES
+
+class YahooAuthError(Exception):
+    """The OAuth token could not be refreshed; says nothing about the API host's health."""
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+def raise_for_api_status(status, headers):
+    """Raise YahooApiError for an HTTP error status, carrying any Retry-After."""
+    if status >= 400:
+        raise YahooApiError(status, parse_retry_after(headers.get("Retry-After")))
+
+def retry_delay(attempt, retry_after=None):
+    """Seconds to wait before retry number attempt + 1.
+
+    Full jitter: a random delay up to the exponential backoff ceiling, so
+    sensors that failed together don't retry together. A Retry-After from
+    Yahoo sets the floor.
+    """
+    delay = random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+def _endpoint_kind(url):
+    """Resource path of a URL without keys or parameters, e.g. 'league/scoreboard'."""
+    path = urlparse(url).path.split("/fantasy/v2/", 1)[-1]
+    segments = (segment.split(";")[0] for segment in path.split("/"))
+    return "/".join(segment for segment in segments if segment and "." not in segment)
+
+class RetryBudget:
+    """Limit retries for one kind of endpoint to a share of its requests.
+
+    Every request deposits a fraction of a retry and every retry spends a
+    whole one, so a degraded endpoint can't multiply its own load.
+    """
+
+    def __init__(self):
+        self.tokens = _RETRY_BUDGET_INITIAL
+
+    def record_request(self):
+        with _RETRY_LOCK:
+            self.tokens = min(_RETRY_BUDGET_MAX, self.tokens + _RETRY_BUDGET_RATIO)
+
+    def try_spend(self):
+        with _RETRY_LOCK:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+class CircuitBreaker:
+    """Fail fast against an API host after repeated failures.
+
+    Closed: requests flow. Open: requests are refused until the cooldown
+    passes. Half-open: a single probe request decides whether to close again
+    or reopen with a doubled cooldown.
+    """
+
+    def __init__(self, host):
+        self.host = host
+        self.state = "closed"
+        self.failures = 0
+        self.trips = 0
+        self.cooldown = _BREAKER_COOLDOWN
+        self.opened_at = None
+        self.probe_started = None
+        self.last_error = None
+        self._lock = Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.state == "closed":
+                return True
+            now = time.time()
+            if self.state == "open":
+                if now < self.opened_at + self.cooldown:
+                    return False
+                self.state = "half_open"
+            elif self.probe_started is not None and now - self.probe_started < _BREAKER_PROBE_TIMEOUT:
+                return False
+            self.probe_started = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self.state != "closed":
+                _LOGGER.info(f"Yahoo API at {self.host} recovered, closing circuit")
+            self.state = "closed"
+            self.failures = 0
+            self.cooldown = _BREAKER_COOLDOWN
+            self.probe_started = None
+
+    def record_failure(self, error):
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error)
+            if self.state == "half_open":
+                self.cooldown = min(self.cooldown * 2, _BREAKER_MAX_COOLDOWN)
+            elif self.state == "open" or self.failures < _BREAKER_FAILURE_THRESHOLD:
+                return
+            self.state = "open"
+            self.opened_at = time.time()
+            self.probe_started = None
+            self.trips += 1
+            _LOGGER.warning(
+                f"Yahoo API at {self.host} failed {self.failures} times in a row, "
+                f"pausing requests for {self.cooldown}s: {error}"
+            )
+
+    def diagnostics(self):
+        retry_in = None
+        if self.state == "open":
+            retry_in = max(0, round(self.opened_at + self.cooldown - time.time()))
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "retry_in": retry_in,
+            "last_error": self.last_error,
+        }
+
+def _count_retry_stat(name):
+    with _RETRY_LOCK:
+        _RETRY_STATS[name] += 1
+
+def get_circuit_breaker(url):
+    """Return the shared circuit breaker for a URL's host."""
+    host = urlparse(url).netloc
+    with _RETRY_LOCK:
+        if host not in _CIRCUIT_BREAKERS:
+            _CIRCUIT_BREAKERS[host] = CircuitBreaker(host)
+        return _CIRCUIT_BREAKERS[host]
+
+def get_retry_budget(url):
+    """Return the shared retry budget for a URL's kind of endpoint."""
+    kind = _endpoint_kind(url)
+    with _RETRY_LOCK:
+        if kind not in _RETRY_BUDGETS:
+            _RETRY_BUDGETS[kind] = RetryBudget()
+        return _RETRY_BUDGETS[kind]
+
+def next_retry_delay(error, attempt, max_retries, budget):
+    """Seconds to wait before retrying after error, or None to give up."""
+    if isinstance(error, YahooApiError):
+        if not error.retryable:
+            return None
+        if error.status in (429, 999):
+            _count_retry_stat("rate_limited")
+    if attempt >= max_retries - 1:
+        return None
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None and retry_after > _RETRY_AFTER_MAX:
+        _LOGGER.warning(f"Yahoo asked to wait {round(retry_after)}s before retrying, giving up for this update")
+        return None
+    if not budget.try_spend():
+        _count_retry_stat("budget_exhausted")
+        return None
+    _count_retry_stat("retries")
+    return retry_delay(attempt, retry_after)
+
+def record_request_outcome(breaker, error=None):
+    """Feed a request attempt's outcome to the host's circuit breaker.
+
+    Any answer from Yahoo other than a throttle or server error shows the
+    host is up, even a 404.
+    """
+    if isinstance(error, YahooAuthError):
+        return
+    if error is None or (isinstance(error, YahooApiError) and not error.retryable):
+        breaker.record_success()
+    else:
+        breaker.record_failure(error)
+
+def api_health_diagnostics(url):
+    """Retry counters, the circuit breaker state of url's host and rate limiter waits, for entity attributes."""
+    host = urlparse(url).netloc
+    breaker = _CIRCUIT_BREAKERS.get(host)
+    return {
+        **_RETRY_STATS,
+        "circuit": breaker.diagnostics() if breaker is not None else {"state": "closed"},
+        "rate_limit": get_rate_limiter().diagnostics(),
+    }
+
+class YahooRateLimiter:
+    """Token bucket pacing requests to Yahoo across every sensor.
+
+    Tokens accrue at rate per second up to burst. A request takes one token;
+    when none is left it queues, and queued requests are served by priority,
+    then arrival. Threads block on a condition while coroutines sleep, so
+    sync and async requests share one bucket. The event loop never blocks on
+    the lock: coroutines only try to take it, see _async_locked_call.
+    """
+
+    def __init__(self, rate=_RATE_LIMIT_DEFAULT, burst=_RATE_LIMIT_DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters = []  # Sorted (priority, sequence) of queued requests
+        self._sequence = itertools.count()
+        self._lock = Lock()
+        self._condition = Condition(self._lock)
+        self._configured = set()
+        self._stats = {
+            name: {"requests": 0, "queued": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for name in _PRIORITY_NAMES.values()
+        }
+
+    def configure(self, rate=None, burst=None):
+        """Apply configured limits; when several sensors set one, the lowest wins."""
+        with self._condition:
+            if rate:
+                self.rate = min(self.rate, float(rate)) if "rate" in self._configured else float(rate)
+                self._configured.add("rate")
+            if burst:
+                self.burst = min(self.burst, int(burst)) if "burst" in self._configured else int(burst)
+                self._configured.add("burst")
+                self._tokens = min(self._tokens, self.burst)
+            self._condition.notify_all()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _try_take(self, waiter):
+        """Take a token for waiter if it's first in line; otherwise return seconds to wait."""
+        self._refill(time.monotonic())
+        if self._waiters[0] == waiter and self._tokens >= 1:
+            self._tokens -= 1
+            self._waiters.pop(0)
+            self._condition.notify_all()
+            return 0
+        # Not first in line: look again once the next token has had time to arrive
+        return (1 - self._tokens) / self.rate if self._tokens < 1 else 1 / self.rate
+
+    def _enqueue(self, priority):
+        waiter = (priority, next(self._sequence))
+        bisect.insort(self._waiters, waiter)
+        return waiter
+
+    def _dequeue(self, waiter):
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+            self._condition.notify_all()
+
+    def _record(self, priority, waited, queued):
+        stats = self._stats[_PRIORITY_NAMES.get(priority, "live")]
+        stats["requests"] += 1
+        if queued:
+            stats["queued"] += 1
+            stats["total_wait"] += waited
+            stats["max_wait"] = max(stats["max_wait"], waited)
+
+    def acquire(self, priority=PRIORITY_LIVE):
+        """Block until a request may be sent. Returns the seconds spent waiting."""
+        started = time.monotonic()
+        with self._condition:
+            waiter = self._enqueue(priority)
+            queued = False
+            try:
+                while True:
+                    delay = self._try_take(waiter)
+                    if not delay:
+                        break
+                    queued = True
+                    self._condition.wait(delay)
+            finally:
+                self._dequeue(waiter)
+            waited = time.monotonic() - started if queued else 0
+            self._record(priority, waited, queued)
+            return waited
+
+    async def async_acquire(self, priority=PRIORITY_LIVE):
+        """Coroutine version of acquire; sleeps on the event loop instead of blocking it."""
+        started = time.monotonic()
+        waiter = await self._async_locked_call(self._enqueue, priority)
+        queued = False
+        try:
+            while True:
+                delay = await self._async_locked_call(self._try_take, waiter)
+                if not delay:
+                    break
+                queued = True
+                await asyncio.sleep(delay)
+        finally:
+            waited = time.monotonic() - started if queued else 0
+            await self._async_locked_call(self._finish_async, waiter, priority, waited, queued)
+        return waited
+
+    def _finish_async(self, waiter, priority, waited, queued):
+        self._dequeue(waiter)
+        self._record(priority, waited, queued)
+
+    async def _async_locked_call(self, func, *args):
+        """Call func holding the lock, without blocking the event loop on it.
+
+        Threads hold the lock only for bookkeeping (waiting on the condition
+        releases it), so when a thread has it the coroutine sleeps briefly and
+        tries again, backing off rather than spinning the loop.
+        """
+        retry = _RATE_LIMIT_LOCK_RETRY
+        while not self._lock.acquire(blocking=False):
+            await asyncio.sleep(retry)
+            retry = min(retry * 2, _RATE_LIMIT_LOCK_RETRY_MAX)
+        try:
+            return func(*args)
+        finally:
+            self._lock.release()
+
+    def diagnostics(self):
+        with self._condition:
+            self._refill(time.monotonic())
+            by_priority = {
+                name: {
+                    "requests": stats["requests"],
+                    "queued": stats["queued"],
+                    "avg_wait_ms": round(stats["total_wait"] / stats["queued"] * 1000) if stats["queued"] else 0,
+                    "max_wait_ms": round(stats["max_wait"] * 1000),
+                }
+                for name, stats in self._stats.items()
+            }
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "tokens": round(self._tokens, 1),
+                "waiting": len(self._waiters),
+                "wait": by_priority,
+            }
+
+def configure_rate_limiter(rate=None, burst=None):
+    """Set the shared request rate (per second) and burst."""
+    get_rate_limiter().configure(rate, burst)
+
+def get_rate_limiter():
+    """Return the process-wide rate limiter, creating it on first use."""
+    global _RATE_LIMITER
+
+    limiter = _RATE_LIMITER
+    if limiter is not None:
+        return limiter
+
+    with _RATE_LIMITER_LOCK:
+        if _RATE_LIMITER is None:
+            _RATE_LIMITER = YahooRateLimiter()
+        return _RATE_LIMITER
+
+def request_priority(url):
+    """Default rate limiter priority for a request, from what it fetches."""
+    path = url.split("/fantasy/v2/", 1)[-1].split("?")[0]
+    if "scoreboard" in path or "roster" in path or "stats" in path:
+        return PRIORITY_LIVE
+    if path.endswith("/settings") or path.endswith("/stat_categories") or ";out=settings" in path:
+        return PRIORITY_SETTINGS
+    return PRIORITY_METADATA
+
+class PlayerStatsBatchSizer:
+    """Choose how many players to request per stats batch from recent responses.
+
+    Grows by a step while full batches come back quickly and halves when a
+    batch is slow or fails, within Yahoo's 25 player limit.
+    """
+
+    def __init__(self):
+        self.size = _STATS_BATCH_MAX
+        self._lock = Lock()
+
+    def record(self, batch_len, latency, failed=False):
+        with self._lock:
+            if failed or latency > _STATS_BATCH_SLOW:
+                self.size = max(_STATS_BATCH_MIN, self.size // 2)
+            elif batch_len >= self.size and latency < _STATS_BATCH_FAST:
+                self.size = min(_STATS_BATCH_MAX, self.size + _STATS_BATCH_STEP)
+
+_STATS_BATCH_SIZER = PlayerStatsBatchSizer()
+
+def _note_transport_time(timing, started):
+    """Report how long an HTTP exchange took to a caller that passed a timing dict."""
+    if timing is not None:
+        timing["transport"] = time.monotonic() - started
+
+def get_stats_executor():
+    """Return the thread pool that fetches player stats batches concurrently."""
+    global _STATS_EXECUTOR
+
+    with _STATS_EXECUTOR_LOCK:
+        if _STATS_EXECUTOR is None:
+            _STATS_EXECUTOR = ThreadPoolExecutor(_STATS_FETCH_WORKERS, thread_name_prefix="yahoo_fantasy_stats")
+        return _STATS_EXECUTOR
+
+def close_stats_executor():
+    global _STATS_EXECUTOR
+
+    with _STATS_EXECUTOR_LOCK:
+        if _STATS_EXECUTOR is not None:
+            _STATS_EXECUTOR.shutdown(wait=False)
+            _STATS_EXECUTOR = None
+
+class DebugCaptureStore:
+    """Ring buffer of gzipped debug captures on disk, bounded by total size and age.
+
+    The update path only queues a response; a background thread serializes,
+    compresses and writes it, then deletes the oldest captures until the
+    buffer is back under both limits. The index of captures lives in memory
+    and is maintained by that thread, so summaries never touch the disk.
+    """
+
+    def __init__(self, directory, max_bytes=_DEBUG_CAPTURE_MAX_BYTES, max_age=_DEBUG_CAPTURE_MAX_AGE):
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._queue = queue.Queue(_DEBUG_CAPTURE_QUEUE_SIZE)
+        self._lock = Lock()  # Guards the in-memory index only; never held during disk I/O
+        self._load_lock = Lock()
+        self._index = OrderedDict()  # {name: {"size", "saved_at", ...}}, oldest first
+        self._index_loaded = False
+        self._total_bytes = 0
+        self._thread = None
+        self._sequence = itertools.count()  # Keeps names unique within a millisecond
+        self.dropped = 0
+
+    def capture(self, league_id, team_id, data_type, week, data):
+        """Queue a response for writing. Never blocks the update."""
+        saved_at = time.time()
+        label = re.sub(r"[^\w.-]", "_", f"{data_type}_week_{week}" if week else str(data_type))
+        entry = {
+            "name": f"{int(saved_at * 1000)}-{next(self._sequence)}_{league_id}_{team_id}_{label}.json.gz",
+            "saved_at": saved_at,
+            "league_id": str(league_id),
+            "team_id": str(team_id),
+            "data_type": data_type,
+            "week": str(week) if week else None,
+        }
+        try:
+            self._queue.put_nowait((entry, data))
+        except queue.Full:
+            self.dropped += 1
+            return
+        self._start()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, name="yahoo_fantasy_debug_capture", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def _run(self):
+        try:
+            self._load_index()
+            self._remove(self._prune())
+        except Exception as e:
+            _LOGGER.warning(f"Debug: could not load debug captures from {self._directory}: {e}")
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self._write(*item)
+            except Exception as e:
+                _LOGGER.warning(f"Debug: could not write capture {item[0]['name']}: {e}")
+
+    def _write(self, entry, data):
+        payload = json.dumps({**entry, "data": data}, default=str)
+        body = gzip.compress(payload.encode(), compresslevel=6)
+        path = os.path.join(self._directory, entry["name"])
+        os.makedirs(self._directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._index[entry["name"]] = {**entry, "size": len(body)}
+            self._total_bytes += len(body)
+        self._remove(self._prune())
+
+    def _remove(self, names):
+        for name in names:
+            try:
+                os.remove(os.path.join(self._directory, name))
+            except OSError:
+                pass
+
+    def _load_index(self):
+        """Pick up captures left by a previous run, once. Scans the disk outside self._lock."""
+        with self._load_lock:
+            if self._index_loaded:
+                return
+            found = OrderedDict()
+            try:
+                names = sorted(name for name in os.listdir(self._directory) if name.endswith(".json.gz"))
+            except OSError:
+                names = []
+            for name in names:
+                # {saved_at ms}-{sequence}_{league_id}_{team_id}_{label}.json.gz
+                parts = name[:-len(".json.gz")].split("_", 3)
+                try:
+                    size = os.path.getsize(os.path.join(self._directory, name))
+                    saved_at = int(parts[0].split("-")[0]) / 1000
+                except (OSError, ValueError):
+                    continue
+                if len(parts) < 4:
+                    continue
+                data_type, _, week = parts[3].partition("_week_")
+                found[name] = {
+                    "name": name, "saved_at": saved_at, "league_id": parts[1], "team_id": parts[2],
+                    "data_type": data_type, "week": week or None, "size": size,
+                }
+
+            with self._lock:
+                # Anything written since startup is newer than what was left on disk
+                found.update(self._index)
+                self._index = found
+                self._total_bytes = sum(capture["size"] for capture in found.values())
+                self._index_loaded = True
+
+    def _prune(self):
+        """Drop the oldest captures past the size or age limit from the index; returns their names."""
+        expired = []
+        now = time.time()
+        with self._lock:
+            while self._index:
+                name, oldest = next(iter(self._index.items()))
+                if self._total_bytes <= self._max_bytes and now - oldest["saved_at"] <= self._max_age:
+                    break
+                del self._index[name]
+                self._total_bytes -= oldest["size"]
+                expired.append(name)
+        return expired
+
+    def list_captures(self, league_id=None, team_id=None):
+        """Metadata of the captures on disk, newest first."""
+        self._load_index()
+        with self._lock:
+            captures = [
+                dict(capture) for capture in reversed(self._index.values())
+                if (league_id is None or capture["league_id"] == str(league_id))
+                and (team_id is None or capture["team_id"] == str(team_id))
+            ]
+        return captures
+
+    def summary(self, league_id, team_id):
+        """Small overview for the entity: what one sensor has captured and where to download it.
+
+        Reads the in-memory index only; captures from a previous run show up
+        once the writer thread has loaded them.
+        """
+        if not self._index_loaded:
+            self._start()
+        latest = {}
+        count = 0
+        size = 0
+        with self._lock:
+            for capture in self._index.values():
+                if capture["league_id"] == str(league_id) and capture["team_id"] == str(team_id):
+                    count += 1
+                    size += capture["size"]
+                    latest[capture["data_type"]] = datetime.fromtimestamp(capture["saved_at"]).isoformat()
+            total_bytes = self._total_bytes
+        return {
+            "count": count,
+            "bytes": size,
+            "buffer_bytes": total_bytes,
+            "dropped": self.dropped,
+            "latest": latest,
+            "download": f"/api/yahoo_fantasy/debug_captures?league_id={league_id}&team_id={team_id}",
+        }
+
+    def read_capture(self, name):
+        """The gzipped bytes of one capture, or None if it isn't in the buffer."""
+        self._load_index()
+        with self._lock:
+            if name not in self._index:
+                return None
+        try:
+            with open(os.path.join(self._directory, name), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+def get_debug_capture_store():
+    """Return the shared debug capture ring buffer."""
+    global _DEBUG_CAPTURE_STORE
+
+    with _DEBUG_CAPTURE_LOCK:
+        if _DEBUG_CAPTURE_STORE is None:
+            _DEBUG_CAPTURE_STORE = DebugCaptureStore(DEBUG_CAPTURE_DIR)
+        return _DEBUG_CAPTURE_STORE
+
+def close_debug_capture_store():
+    with _DEBUG_CAPTURE_LOCK:
+        if _DEBUG_CAPTURE_STORE is not None:
+            _DEBUG_CAPTURE_STORE.stop()
 
 def get_global_oauth():
     """Get or create the global OAuth instance."""
@@ -142,45 +1534,404 @@ def get_global_oauth():
             with open(OAUTH_FILE, "r") as f:
                 creds = json.load(f)
 
-            consumer_key = creds.get("consumer_key")
-            consumer_secret = creds.get("consumer_secret")
+            consumer_key = creds.get("consumer_key")
+            consumer_secret = creds.get("consumer_secret")
+
+            if not consumer_key or not consumer_secret:
+                raise ValueError("consumer_key and consumer_secret must be in oauth.json")
+
+            _GLOBAL_OAUTH = OAuth2(
+                consumer_key=consumer_key,
+                consumer_secret=consumer_secret,
+                from_file=OAUTH_FILE,
+            )
+            
+        return _GLOBAL_OAUTH
+
+def reset_oauth_session():
+    """Reset the OAuth session completely.
+
+    API requests go through the shared transport, so its pooled connections
+    survive a reset.
+    """
+    global _GLOBAL_OAUTH, _LAST_SESSION_RESET
+    
+    with _TOKEN_LOCK:
+        current_time = time.time()
+        
+        # Prevent too frequent resets
+        if current_time - _LAST_SESSION_RESET < 5:
+            return
+        
+        if _GLOBAL_OAUTH:
+            try:
+                # Close existing session
+                if hasattr(_GLOBAL_OAUTH, 'session') and _GLOBAL_OAUTH.session:
+                    _GLOBAL_OAUTH.session.close()
+                    
+                # Clear the session
+                _GLOBAL_OAUTH.session = None
+                
+                # Force new session creation on next request
+                _LAST_SESSION_RESET = current_time
+                
+            except Exception as e:
+                _LOGGER.error(f"Error resetting OAuth session: {e}")
+
+class YahooTokenRefresher:
+    """Renew the shared OAuth token from a background thread ahead of its expiry.
+
+    The current token is published as an (access_token, expires_at) tuple in
+    a single assignment, so request paths read it without taking _TOKEN_LOCK.
+    """
+
+    def __init__(self, oauth, margin=_TOKEN_REFRESH_MARGIN):
+        self._oauth = oauth
+        self._margin = margin
+        self._refresh_lock = Lock()
+        self._stop = Event()
+        self._thread = None
+        self.token = None
+        self.diagnostics = {
+            "refresh_count": 0,
+            "failure_count": 0,
+            "last_refresh": None,
+            "last_refresh_ms": None,
+            "last_error": None,
+            "last_error_at": None,
+        }
+        self._publish()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if not self.running:
+            self._stop.clear()
+            self._thread = Thread(target=self._run, name="yahoo_fantasy_token_refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def oauth(self):
+        """The shared OAuth instance every sensor sends requests with."""
+        return self._oauth
+
+    def set_oauth(self, oauth):
+        """Switch to a recreated OAuth instance and publish its token."""
+        if oauth is self._oauth:
+            return
+        self._oauth = oauth
+        self._publish()
+
+    def set_margin(self, margin):
+        """Renew tokens this many seconds before they expire."""
+        self._margin = margin
+
+    def _publish(self):
+        token_time = getattr(self._oauth, "token_time", None)
+        try:
+            expires_at = float(token_time) + _TOKEN_LIFETIME
+        except (TypeError, ValueError):
+            # Unknown issue time: trust the library's own validity check
+            expires_at = time.time() + self._margin + _TOKEN_REFRESH_POLL if self._oauth.token_is_valid() else 0
+        self.token = (self._oauth.access_token, expires_at)
+
+    def needs_refresh(self):
+        """Lock-free check whether the published token is due for renewal."""
+        token = self.token
+        return token is None or time.time() >= token[1] - self._margin
+
+    def refresh(self, stale_token=None):
+        """Refresh the token now. Returns True on success.
+
+        If stale_token is given and a newer token has already been published,
+        e.g. by another sensor reacting to the same 401, no refresh is made.
+        """
+        with self._refresh_lock:
+            if stale_token is not None and self.token and self.token[0] != stale_token:
+                return True
+
+            started = time.monotonic()
+            try:
+                with _TOKEN_LOCK:
+                    self._oauth.refresh_access_token()
+            except Exception as e:
+                self.diagnostics["failure_count"] += 1
+                self.diagnostics["last_error"] = str(e)
+                self.diagnostics["last_error_at"] = datetime.now().isoformat()
+                _LOGGER.error(f"Failed to refresh OAuth token: {e}")
+                return False
+
+            self._publish()
+            self.diagnostics["refresh_count"] += 1
+            self.diagnostics["last_refresh"] = datetime.now().isoformat()
+            self.diagnostics["last_refresh_ms"] = round((time.monotonic() - started) * 1000)
+            _LOGGER.debug(f"Refreshed OAuth token in {self.diagnostics['last_refresh_ms']} ms")
+            return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            if getattr(self._oauth, "token_time", None) is None:
+                self._publish()
+            token = self.token
+            delay = (token[1] - self._margin - time.time()) if token else 0
+            if delay > 0:
+                self._stop.wait(min(delay, _TOKEN_REFRESH_POLL))
+                continue
+            if not self.refresh():
+                self._stop.wait(_TOKEN_REFRESH_RETRY)
+
+def start_token_refresher(oauth, margin=None):
+    """Start the shared background token refresher, or point it at a new OAuth instance."""
+    global _TOKEN_REFRESHER
+
+    with _TOKEN_LOCK:
+        if _TOKEN_REFRESHER is None:
+            _TOKEN_REFRESHER = YahooTokenRefresher(oauth, margin or _TOKEN_REFRESH_MARGIN)
+        else:
+            if margin:
+                _TOKEN_REFRESHER.set_margin(margin)
+            _TOKEN_REFRESHER.set_oauth(oauth)
+        _TOKEN_REFRESHER.start()
+        return _TOKEN_REFRESHER
+
+def stop_token_refresher():
+    if _TOKEN_REFRESHER is not None:
+        _TOKEN_REFRESHER.stop()
+
+def token_refresh_diagnostics():
+    """Token refresh state for entity attributes, or None when no refresher runs."""
+    refresher = _TOKEN_REFRESHER
+    if refresher is None:
+        return None
+    token = refresher.token
+    return {
+        **refresher.diagnostics,
+        "expires_in": round(token[1] - time.time()) if token else None,
+        "running": refresher.running,
+    }
+
+def get_league_coordinator(game_key, league_id, fetch_mode=FETCH_MODE_STANDARD):
+    """Get or create the shared coordinator for a league."""
+    league_key = f"{game_key}.l.{league_id}"
+
+    with _COORDINATORS_LOCK:
+        if league_key not in _LEAGUE_COORDINATORS:
+            _LEAGUE_COORDINATORS[league_key] = YahooFantasyLeagueCoordinator(league_key, fetch_mode)
+        elif _LEAGUE_COORDINATORS[league_key].fetch_mode != fetch_mode:
+            _LOGGER.warning(
+                f"League {league_key} already uses fetch_mode '{_LEAGUE_COORDINATORS[league_key].fetch_mode}', "
+                f"ignoring '{fetch_mode}'"
+            )
+        return _LEAGUE_COORDINATORS[league_key]
+
+def _parse_rosters(sensor, roster_data):
+    """Parse raw rosters by team ID without debug data; CPU-bound, so run it in the executor."""
+    return {team_id: sensor._parse_roster(raw, debug=False) for team_id, raw in roster_data.items()}
+
+class YahooFantasyLeagueCoordinator:
+    """Fetch league-wide matchup data once per interval and share it with every sensor in the league."""
+
+    def __init__(self, league_key, fetch_mode=FETCH_MODE_STANDARD):
+        self.league_key = league_key
+        self.fetch_mode = fetch_mode
+        self.data = None
+        self.last_refresh = 0
+        self._team_ids = set()
+        self._covered_team_ids = set()
+        self._lock = None
+        self._failure = None  # Data of the last failed refresh, shared until _COORDINATOR_FAILURE_TTL passes
+        self._failed_at = 0
+        self._snapshot_failures = 0
+        self._snapshot_retry_at = 0  # Standard requests are used until then
+
+    def subscribe(self, team_id):
+        """Register a tracked team so its matchup is included in each refresh."""
+        self._team_ids.add(str(team_id))
+
+    def unsubscribe(self, team_id):
+        """Stop including a team's matchup in refreshes."""
+        self._team_ids.discard(str(team_id))
+
+    async def async_get_data(self, sensor, max_age):
+        """Return league data no older than max_age seconds, refreshing it at most once for all callers."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            # Another sensor may have refreshed while we waited for the lock
+            now = time.time()
+            if (
+                self.data is not None
+                and now - self.last_refresh < max_age
+                and str(sensor._team_id) in self._covered_team_ids
+            ):
+                return self.data
+            # ...or just failed to; don't repeat that for every sensor in the league
+            if self._failure is not None and now - self._failed_at < min(max_age, _COORDINATOR_FAILURE_TTL):
+                return self._failure
+
+            data = await self._async_fetch(sensor)
+
+            if data.get("scoreboard_data"):
+                self.data = data
+                self.last_refresh = time.time()
+                self._failure = None
+            else:
+                self._failure = data
+                self._failed_at = time.time()
+            return data
+
+    def _tracked_team_ids(self, sensor, scoreboard_data):
+        """Team IDs of every matchup that a subscribed sensor is part of."""
+        tracked = self._team_ids | {str(sensor._team_id)}
+        team_ids = []
+        for matchup_team_ids in scoreboard_matchup_team_ids(scoreboard_data):
+            if tracked.intersection(matchup_team_ids):
+                team_ids.extend(team_id for team_id in matchup_team_ids if team_id not in team_ids)
+        return team_ids
+
+    async def _async_fetch(self, sensor):
+        """Fetch settings, scoreboard, rosters and player stats for every subscribed matchup."""
+        if self.fetch_mode == FETCH_MODE_SNAPSHOT and time.time() >= self._snapshot_retry_at:
+            data = await self._async_fetch_snapshot(sensor)
+            if data is not None:
+                self._snapshot_failures = 0
+                return data
+            # Back off so a broken snapshot doesn't cost an extra request per refresh
+            backoff = min(_SNAPSHOT_RETRY_BACKOFF * 2 ** self._snapshot_failures, _SNAPSHOT_RETRY_BACKOFF_MAX)
+            self._snapshot_failures += 1
+            self._snapshot_retry_at = time.time() + backoff
+            _LOGGER.warning(
+                f"Snapshot fetch failed for league {self.league_key}, using standard requests for the next {backoff}s"
+            )
+
+        return await self._async_fetch_standard(sensor)
+
+    async def _async_fetch_snapshot(self, sensor):
+        """Fetch the same data as _async_fetch_standard using two chained collection requests.
+
+        The league resource with ;out=settings,scoreboard carries the current week,
+        settings and this week's scoreboard. A teams collection chained through
+        roster/players/stats then returns every tracked roster with weekly player
+        stats. Returns None if either response is unusable.
+        """
+        try:
+            # Settings are only requested when they aren't cached yet
+            league_settings = _get_cache_entry("league_settings", self.league_key)
+            out = "scoreboard" if league_settings is not None else "settings,scoreboard"
+            league_url = f"{sensor._api_base}/league/{self.league_key};out={out}?format=json"
+
+            league_data, stat_categories = await asyncio.gather(
+                sensor._async_make_api_request(league_url),
+                sensor._async_get_stat_categories(sensor._game_key),
+            )
+            sensor._save_debug_data("league_snapshot", league_data)
+
+            current_week = find_key(league_data, "current_week")
+            if not current_week or not find_key(league_data, "matchups"):
+                return None
+            note_current_week(sensor._game_key, current_week)
+
+            if league_settings is None:
+                league_settings = await sensor.hass.async_add_executor_job(
+                    sensor._parse_league_settings, self.league_key, league_data
+                )
+                await sensor.hass.async_add_executor_job(save_persistent_cache)
+            else:
+                check_league_settings_version(self.league_key, league_data)
+
+            team_ids = self._tracked_team_ids(sensor, league_data)
+            team_keys = ",".join(f"{self.league_key}.t.{team_id}" for team_id in team_ids)
+            teams_url = (
+                f"{sensor._api_base}/teams;team_keys={team_keys}"
+                f"/roster;week={current_week}/players/stats;type=week;week={current_week}?format=json"
+            )
+            teams_data = await sensor._async_make_api_request(teams_url)
+            sensor._save_debug_data("teams_snapshot", teams_data, current_week)
+
+            rosters, parsed_rosters, player_stats = await sensor.hass.async_add_executor_job(
+                self._parse_snapshot_rosters, sensor, teams_data
+            )
+            if not rosters:
+                return None
+
+            self._covered_team_ids = set(team_ids)
+            _LOGGER.debug(f"Refreshed league {self.league_key} snapshot: {len(rosters)} rosters, {len(player_stats)} players")
+
+            return {
+                "league_settings": league_settings,
+                "stat_categories": stat_categories,
+                "current_week": current_week,
+                "scoreboard_data": league_data,
+                "roster_data": rosters,
+                "rosters": parsed_rosters,
+                "player_stats": player_stats,
+            }
+
+        except Exception as e:
+            _LOGGER.warning(f"Error fetching league snapshot for {self.league_key}: {e}")
+            return None
+
+    @staticmethod
+    def _parse_snapshot_rosters(sensor, teams_data):
+        """Split a teams collection into raw rosters, parsed rosters and player stats (executor)."""
+        rosters = split_teams_collection(teams_data)
+
+        # Player stats ride along inside each roster, so the regular parsers apply as-is
+        player_stats = {}
+        for roster_data in rosters.values():
+            player_stats.update(sensor._extract_player_stats(roster_data))
+
+        return rosters, _parse_rosters(sensor, rosters), player_stats
+
+    async def _async_fetch_standard(self, sensor):
+        """Fetch league data with one request per resource, running independent requests concurrently."""
+        league_settings, stat_categories, current_week = await asyncio.gather(
+            sensor._async_get_league_settings(sensor._game_key, sensor._league_id),
+            sensor._async_get_stat_categories(sensor._game_key),
+            sensor._async_get_current_week(),
+        )
+
+        data = {
+            "league_settings": league_settings,
+            "stat_categories": stat_categories,
+            "current_week": current_week,
+            "scoreboard_data": None,
+            "roster_data": {},
+            "rosters": {},
+            "player_stats": {},
+        }
+
+        if not current_week:
+            return data
+
+        scoreboard_data = await sensor._async_get_scoreboard_data(current_week)
+        if not scoreboard_data:
+            return data
+        data["scoreboard_data"] = scoreboard_data
+
+        # Only fetch rosters for matchups that a subscribed sensor is part of
+        team_ids = self._tracked_team_ids(sensor, scoreboard_data)
+
+        roster_results = await asyncio.gather(
+            *(sensor._async_get_team_roster(team_id, current_week) for team_id in team_ids)
+        )
+        data["roster_data"] = dict(zip(team_ids, roster_results))
+        # Parsed once here and shared by every sensor in the league
+        data["rosters"] = await sensor.hass.async_add_executor_job(_parse_rosters, sensor, data["roster_data"])
 
-            if not consumer_key or not consumer_secret:
-                raise ValueError("consumer_key and consumer_secret must be in oauth.json")
+        all_player_ids = sensor._collect_player_ids(*data["rosters"].values())
+        data["player_stats"] = await sensor._async_get_player_stats(all_player_ids, current_week)
 
-            _GLOBAL_OAUTH = OAuth2(
-                consumer_key=consumer_key,
-                consumer_secret=consumer_secret,
-                from_file=OAUTH_FILE,
-            )
-            
-        return _GLOBAL_OAUTH
+        self._covered_team_ids = set(team_ids)
+        _LOGGER.debug(f"Refreshed league {self.league_key}: {len(team_ids)} rosters, {len(data['player_stats'])} players")
 
-def reset_oauth_session():
-    """Reset the OAuth session completely."""
-    global _GLOBAL_OAUTH, _LAST_SESSION_RESET
-    
-    with _TOKEN_LOCK:
-        current_time = time.time()
-        
-        # Prevent too frequent resets
-        if current_time - _LAST_SESSION_RESET < 5:
-            return
-        
-        if _GLOBAL_OAUTH:
-            try:
-                # Close existing session
-                if hasattr(_GLOBAL_OAUTH, 'session') and _GLOBAL_OAUTH.session:
-                    _GLOBAL_OAUTH.session.close()
-                    
-                # Clear the session
-                _GLOBAL_OAUTH.session = None
-                
-                # Force new session creation on next request
-                _LAST_SESSION_RESET = current_time
-                
-            except Exception as e:
-                _LOGGER.error(f"Error resetting OAuth session: {e}")
+        return data
 
 def setup_platform(hass, config, add_entities, discovery_info=None):
     game_key = config.get(CONF_GAME_KEY)
@@ -188,6 +1939,14 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     team_id = config.get(CONF_TEAM_ID)
     min_update_interval = config.get(CONF_MIN_UPDATE_INTERVAL, 300)  # Default 5 minutes
     debug_mode = config.get(CONF_DEBUG_MODE, False)  # Enable debug features
+    fetch_mode = config.get(CONF_FETCH_MODE, FETCH_MODE_STANDARD)
+    adaptive_polling = config.get(CONF_ADAPTIVE_POLLING, True)
+    live_update_interval = config.get(CONF_LIVE_UPDATE_INTERVAL, 45)
+    api_base_url = config.get(CONF_API_BASE_URL, YAHOO_API_BASE).rstrip("/")
+    parallel_stats = config.get(CONF_PARALLEL_STATS, True)
+    attribute_mode = config.get(CONF_ATTRIBUTE_MODE, ATTRIBUTE_MODE_FULL)
+    configure_transport(config.get(CONF_CONNECTION_POOL_SIZE), config.get(CONF_HTTP2, True))
+    configure_rate_limiter(config.get(CONF_RATE_LIMIT), config.get(CONF_RATE_LIMIT_BURST))
 
     try:
         oauth = get_global_oauth()
@@ -195,17 +1954,65 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
         _LOGGER.error(f"Failed to initialize OAuth: {e}")
         raise
 
+    # Keep the token fresh in the background so updates never wait on a refresh
+    start_token_refresher(oauth, config.get(CONF_TOKEN_REFRESH_MARGIN))
+
+    # Warm start: league settings and stat categories come from disk when still valid
+    load_persistent_cache()
+
+    if not hass.services.has_service(DOMAIN, "clear_cache"):
+        def handle_clear_cache(call):
+            invalidate_league_cache(call.data.get("league_key"), call.data.get("game_key"))
+
+        hass.services.register(DOMAIN, "clear_cache", handle_clear_cache)
+
+        def handle_debug_analysis(call):
+            sensor = hass.data.get(DOMAIN, {}).get("sensors", {}).get(call.data["entity_id"])
+            if sensor is None:
+                raise ServiceValidationError(f"No Yahoo Fantasy sensor {call.data['entity_id']}")
+            return sensor.debug_analysis(call.data.get("source", "our_team"), call.data.get("analyses") or DEBUG_ANALYSES)
+
+        hass.services.register(DOMAIN, "debug_analysis", handle_debug_analysis,
+                               supports_response=SupportsResponse.ONLY)
+
+        # Registered once alongside the service: stop background work and release connections
+        def handle_stop(event):
+            stop_token_refresher()
+            close_stats_executor()
+            close_debug_capture_store()
+            close_transport()
+
+        hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, handle_stop)
+
     # Create the matchup entity
     entities = [
-        YahooFantasyMatchupSensor(oauth, game_key, league_id, team_id, min_update_interval, debug_mode)
+        YahooFantasyMatchupSensor(
+            oauth, game_key, league_id, team_id, min_update_interval, debug_mode, fetch_mode,
+            adaptive_polling, live_update_interval, api_base_url, parallel_stats, attribute_mode
+        )
     ]
     add_entities(entities, True)
 
 class YahooFantasyMatchupSensor(Entity):
     """Sensor for Yahoo Fantasy matchup data from scoreboard."""
+
+    _unrecorded_attributes = _UNRECORDED_ATTRIBUTES
     
-    def __init__(self, oauth, game_key, league_id, team_id, min_update_interval=300, debug_mode=False):
-        self._oauth = oauth
+    def __init__(self, oauth, game_key, league_id, team_id, min_update_interval=300, debug_mode=False,
+                 fetch_mode=FETCH_MODE_STANDARD, adaptive_polling=True, live_update_interval=45,
+                 api_base_url=YAHOO_API_BASE, parallel_stats=True, attribute_mode=ATTRIBUTE_MODE_FULL):
+        self._own_oauth = oauth  # Only used without the shared token refresher, see _oauth
+        self._api_base = api_base_url
+        self._parallel_stats = parallel_stats  # Fetch player stats batches concurrently
+        self._attribute_mode = attribute_mode
+        self._state_hash = None  # Fingerprint of the last written state, see _state_fingerprint
+        self._fingerprinted_attributes = None  # Attributes dict _state_hash was taken from
+        self._stats_revision = 0  # Bumped whenever a player's stats changed, see _state_fingerprint
+        self._matchup_listeners = []  # yahoo_fantasy/matchup/subscribe connections
+        self._debug_responses = {}  # Raw parts of the last matchup in debug mode, see debug_analysis
+        self._debug_stat_categories = {}
+        self._published_attributes = {}  # Full attributes as of the last snapshot or delta sent
+        self._update_running = False
         self._game_key = game_key
         self._league_id = league_id
         self._team_id = team_id
@@ -214,11 +2021,27 @@ class YahooFantasyMatchupSensor(Entity):
         self._last_update = 0
         self._min_update_interval = min_update_interval
         self._consecutive_401_errors = 0
+        self._sent_token = None  # Access token used by the last request, to spot stale 401s
         self._debug_mode = debug_mode  # New debug mode flag
 
+        # Adaptive polling: the interval is re-chosen after every successful update
+        self._adaptive_polling = adaptive_polling
+        self._live_update_interval = live_update_interval
+        self._update_interval = min_update_interval
+        self._update_interval_reason = "initial"
+        self._last_starter_points = {}   # {player_id: points} from last update
+        self._last_live_activity = 0     # When a starter's game last kicked off or their points moved
+        self._last_starter_locks = {}    # {player_id: is_locked} from last update
+
         self._previous_td_counts = {}  # Store {team_id: {player_id: td_count}} from last update
+        self._player_stat_state = {}   # {player_id: scored stats from the last update}, see _apply_player_stats
+        self._changed_players = []     # Players whose stats moved in the current update
         self._last_td_scorers = {}     # Store {team_id: {"name": "Player", "type": "Rushing", "timestamp": time}}
 
+        # Shared per-league fetcher used by the async update path
+        self._coordinator = get_league_coordinator(game_key, league_id, fetch_mode)
+        self._coordinator.subscribe(team_id)
+
     @property
     def name(self):
         return "Yahoo Fantasy Matchup"
@@ -231,57 +2054,226 @@ class YahooFantasyMatchupSensor(Entity):
     def state(self):
         return self._state
 
+    @property
+    def should_poll(self):
+        # Updates are scheduled in async_added_to_hass so unchanged results skip the state write
+        return False
+
     @property
     def extra_state_attributes(self):
+        if self._attribute_mode != ATTRIBUTE_MODE_COMPACT:
+            return self._attributes
+        # Rosters, stats and lists are served on demand by the yahoo_fantasy/matchup websocket command
+        compact = {
+            key: value for key, value in self._attributes.items()
+            if value is None or isinstance(value, (str, int, float, bool))
+        }
+        compact["attribute_mode"] = ATTRIBUTE_MODE_COMPACT
+        return compact
+
+    @property
+    def full_attributes(self):
+        """Every attribute, whatever the attribute mode."""
         return self._attributes
 
+    @callback
+    def async_subscribe_matchup(self, listener):
+        """Call listener with a matchup_delta after each update that changed something.
+
+        The caller sends the subscriber its snapshot of full_attributes; the
+        returned function removes the listener.
+        """
+        if not self._matchup_listeners:
+            self._published_attributes = self._attributes
+        self._matchup_listeners.append(listener)
+
+        @callback
+        def remove_listener():
+            if listener in self._matchup_listeners:
+                self._matchup_listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def _async_publish_matchup(self):
+        if not self._matchup_listeners:
+            return
+        delta = matchup_delta(self._published_attributes, self._attributes)
+        self._published_attributes = self._attributes
+        if delta is None:
+            return
+        delta["state"] = self._state
+        for listener in list(self._matchup_listeners):
+            listener(delta)
+
+    async def async_added_to_hass(self):
+        """Make the sensor reachable from the websocket command and start its update timer."""
+        self.hass.data.setdefault(DOMAIN, {}).setdefault("sensors", {})[self.entity_id] = self
+        # Adding the entity writes its first state
+        self._state_hash = self._state_fingerprint()
+        self._fingerprinted_attributes = self._attributes
+        self.async_on_remove(async_track_time_interval(self.hass, self._async_scheduled_update, SCAN_INTERVAL))
+
+    async def _async_scheduled_update(self, now=None):
+        """Update, then write state only if the result differs from what was last written."""
+        # A slow update shouldn't be overlapped by the next tick
+        if self._update_running:
+            return
+        self._update_running = True
+        try:
+            await self.async_update()
+        finally:
+            self._update_running = False
+        self._async_write_if_changed()
+        self._async_publish_matchup()
+
+    @callback
+    def _async_write_if_changed(self):
+        # Updates replace the attributes dict; a throttled tick leaves it as it was
+        if self._attributes is self._fingerprinted_attributes:
+            return
+        self._fingerprinted_attributes = self._attributes
+        state_hash = self._state_fingerprint()
+        if state_hash != self._state_hash:
+            self._state_hash = state_hash
+            self.async_write_ha_state()
+
+    def _state_fingerprint(self):
+        """Hash of what the entity exposes, built from cheap inputs, diagnostics aside.
+
+        Single values (scores, projections, status, counts) are hashed as they
+        are. Rosters count through each player's slot and points plus the stats
+        revision, which moves whenever a player's stats changed; the remaining
+        lists, such as touchdown scorers, follow from those.
+        """
+        attributes = self.extra_state_attributes
+        scalars = tuple(
+            (key, value) for key, value in attributes.items()
+            if key not in _VOLATILE_ATTRIBUTES and (value is None or isinstance(value, (str, int, float, bool)))
+        )
+        players = tuple(
+            tuple(player.get(field) for field in _FINGERPRINT_PLAYER_FIELDS)
+            for name in _ROSTER_ATTRIBUTES for player in attributes.get(name) or ()
+        )
+        # Compact mode leaves stats off the entity; changes to them don't need a write
+        stats_revision = self._stats_revision if self._attribute_mode != ATTRIBUTE_MODE_COMPACT else None
+        return hash((str(self._state), scalars, players, stats_revision))
+
+    async def async_will_remove_from_hass(self):
+        """Stop including this team in the shared league refresh."""
+        self._coordinator.unsubscribe(self._team_id)
+        self.hass.data.get(DOMAIN, {}).get("sensors", {}).pop(self.entity_id, None)
+        self._matchup_listeners.clear()
+
     def _should_update(self):
         """Check if enough time has passed to warrant an update."""
         current_time = time.time()
-        if current_time - self._last_update < self._min_update_interval:
+        if current_time - self._last_update < self._update_interval:
             return False
         return True
 
+    def _choose_update_interval(self, status, our_roster, opponent_roster):
+        """Pick the next refresh interval from the matchup status and live starter activity."""
+        # Track whether any starter's game kicked off or points moved since the previous update
+        now = time.time()
+        starters = [
+            p for p in (our_roster or []) + (opponent_roster or [])
+            if p.get("is_starting") and p.get("player_id")
+        ]
+        starter_points = {str(p["player_id"]): p.get("points_total", 0) for p in starters}
+        starter_locks = {str(p["player_id"]): p["is_locked"] for p in starters if p.get("is_locked") is not None}
+        if any(
+            locked and self._last_starter_locks.get(player_id) is False
+            for player_id, locked in starter_locks.items()
+        ):
+            self._last_live_activity = now
+        # Points only move in games that have started, where Yahoo says which those are
+        if any(
+            player_id in self._last_starter_points and self._last_starter_points[player_id] != points
+            and starter_locks.get(player_id, True)
+            for player_id, points in starter_points.items()
+        ):
+            self._last_live_activity = now
+        self._last_starter_points = starter_points
+        self._last_starter_locks = starter_locks
+
+        if not self._adaptive_polling:
+            return self._min_update_interval, "fixed interval"
+
+        if status == "postevent":
+            return _INTERVAL_POSTEVENT, "matchup finished"
+        if status == "preevent":
+            # Wake up for the first kickoff instead of sleeping through it
+            until_window = seconds_until_nfl_game_window()
+            if not until_window:
+                return max(_INTERVAL_GAME_WINDOW, self._live_update_interval), "matchup not started, NFL game window"
+            return min(_INTERVAL_PREEVENT, max(until_window, _INTERVAL_GAME_WINDOW)), "matchup not started"
+        if status != "midevent":
+            return self._min_update_interval, f"unknown matchup status '{status}'"
+
+        if now - self._last_live_activity < _LIVE_ACTIVITY_GRACE:
+            return self._live_update_interval, "starters in live games"
+        if in_nfl_game_window():
+            return max(_INTERVAL_GAME_WINDOW, self._live_update_interval), "NFL game window"
+        return _INTERVAL_BETWEEN_WINDOWS, "between NFL game windows"
+
     def _save_debug_data(self, data_type, data, week=None):
-        """Save debug data for inspection."""
+        """Capture a raw response to the on-disk debug ring buffer."""
         if not self._debug_mode:
             return
-            
-        global _DEBUG_DATA_CACHE
-        
-        with _DEBUG_CACHE_LOCK:
-            cache_key = f"{self._league_id}_{self._team_id}"
-            if cache_key not in _DEBUG_DATA_CACHE:
-                _DEBUG_DATA_CACHE[cache_key] = {}
-                
-            timestamp = time.time()
-            week_suffix = f"_week_{week}" if week else ""
-            
-            _DEBUG_DATA_CACHE[cache_key][f"{data_type}{week_suffix}"] = {
-                "timestamp": timestamp,
-                "data": data,
-                "exploration": explore_data_structure(data),
-            }
-            
-            # Log debug info
-            _LOGGER.info(f"Debug: Saved {data_type} data structure to cache")
 
-    def _create_team_debug_entity(self, team_data, stat_categories):
-        """Create comprehensive debug information for team data."""
-        if not team_data or not self._debug_mode:
-            return {}
-            
-        # Basic exploration
-        debug_info = {
-            "raw_structure": explore_data_structure(team_data),
-            "all_keys": self._extract_all_keys_from_data(team_data),
-            "translated_data": translate_stat_ids_in_data(team_data, stat_categories),
-        }
-        
-        # Look for common patterns
-        debug_info["found_patterns"] = self._find_common_patterns(team_data)
-        
-        return debug_info
+        get_debug_capture_store().capture(self._league_id, self._team_id, data_type, week, data)
+        _LOGGER.debug(f"Debug: Queued {data_type} capture")
+
+    def debug_analysis(self, source, analyses=DEBUG_ANALYSES):
+        """Analyze one raw response on demand.
+
+        source is a part of the last matchup (our_team, opponent_team,
+        matchup, player:<player_id> or player_stats:<player_id>) or the name
+        of a debug capture.
+        """
+        if source in self._debug_responses:
+            data = self._debug_responses[source]
+        elif source.startswith(("player:", "player_stats:")):
+            data = None
+        else:
+            body = get_debug_capture_store().read_capture(source)
+            try:
+                data = json.loads(gzip.decompress(body)).get("data") if body is not None else None
+            except (OSError, ValueError) as e:
+                raise HomeAssistantError(f"Debug capture '{source}' is unreadable: {e}") from e
+        if data is None:
+            raise ServiceValidationError(f"No debug response '{source}' for {self.name}; is debug_mode on?")
+
+        unknown = [name for name in analyses if name not in DEBUG_ANALYSES]
+        if unknown:
+            raise ServiceValidationError(f"Unknown debug analyses {unknown}, expected some of {list(DEBUG_ANALYSES)}")
+        return {"source": source, **self._analyze_debug_response(data, analyses, self._debug_stat_categories)}
+
+    def _analyze_debug_response(self, data, analyses, stat_categories):
+        """Run the requested analyses, reusing results for a response already analyzed."""
+        response_hash = hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+        categories_hash = None
+        if "translated_data" in analyses:
+            categories_hash = hashlib.sha1(json.dumps(stat_categories, sort_keys=True, default=str).encode()).hexdigest()
+
+        results = {"response_hash": response_hash}
+        for name in analyses:
+            # Only the translation depends on anything but the response
+            key = (response_hash, name, categories_hash if name == "translated_data" else None)
+            result = _debug_analysis_cache_get(key)
+            if result is None:
+                if name == "raw_structure":
+                    result = explore_data_structure(data)
+                elif name == "all_keys":
+                    result = self._extract_all_keys_from_data(data)
+                elif name == "translated_data":
+                    result = translate_stat_ids_in_data(data, stat_categories)
+                else:
+                    result = self._find_common_patterns(data)
+                _debug_analysis_cache_store(key, result)
+            results[name] = result
+        return results
 
     def _extract_all_keys_from_data(self, data, path="", all_keys=None):
         """Extract all keys from nested data structure with their paths."""
@@ -371,9 +2363,29 @@ class YahooFantasyMatchupSensor(Entity):
                     
         return patterns
 
+    def _token_needs_refresh(self):
+        """Lock-free check used before each request; always True without the background refresher."""
+        refresher = _TOKEN_REFRESHER
+        if refresher is None or not refresher.running:
+            return True
+        return refresher.needs_refresh()
+
     def _refresh_oauth_if_needed(self, force_refresh=False, after_401=False):
         """Refresh OAuth token if needed or if forced."""
         global _LAST_TOKEN_REFRESH
+
+        refresher = _TOKEN_REFRESHER
+        if refresher is not None and refresher.running:
+            if not (force_refresh or after_401 or refresher.needs_refresh()):
+                return True
+            if after_401 and self._consecutive_401_errors > 1:
+                reset_oauth_session()
+            # Skip the refresh if another sensor already replaced the token we sent
+            if not refresher.refresh(stale_token=self._sent_token if after_401 else None):
+                return False
+            if after_401:
+                self._consecutive_401_errors = 0
+            return True
         
         with _TOKEN_LOCK:
             current_time = time.time()
@@ -406,59 +2418,204 @@ class YahooFantasyMatchupSensor(Entity):
                 _LOGGER.error(f"Failed to refresh OAuth token: {e}")
                 return False
 
-    def _make_api_request(self, url, max_retries=3):
-        """Make API request with automatic 401 handling and retries."""
+    def _make_api_request(self, url, max_retries=3, priority=None, timing=None):
+        """Make API request with automatic 401 handling, retries and response caching.
+
+        Every attempt waits its turn at the shared rate limiter; priority
+        defaults to request_priority(url). Failed attempts are retried under
+        the shared retry policy, see next_retry_delay. While the host's
+        circuit is open the last cached response is served instead. If
+        timing is a dict, timing["transport"] receives the duration of the
+        HTTP exchange that produced the result, without rate limiter waits
+        or retry backoff.
+        """
+        cached = _response_cache_get(url)
+        if _response_cache_is_fresh(cached):
+            return cached["data"]
+        headers = _conditional_headers(cached)
+
+        breaker = get_circuit_breaker(url)
+        if not breaker.allow_request():
+            return self._serve_last_known(url, cached, breaker, YahooApiError(None, message=f"Circuit open for {breaker.host}"))
+        budget = get_retry_budget(url)
+        budget.record_request()
+        _count_retry_stat("requests")
+        limiter = get_rate_limiter()
+        priority = request_priority(url) if priority is None else priority
         
         for attempt in range(max_retries):
             try:
-                # Only do standard refresh on first attempt
-                if attempt == 0:
+                # Only do standard refresh on first attempt; the background refresher usually has
+                if attempt == 0 and self._token_needs_refresh():
                     if not self._refresh_oauth_if_needed():
-                        raise Exception("Failed to ensure valid OAuth token")
+                        raise YahooAuthError("Failed to ensure valid OAuth token")
                 
-                response = self._oauth.session.get(url, timeout=30)
+                limiter.acquire(priority)
+                exchange_started = time.monotonic()
+                response = get_transport().get(url, headers={**self._auth_headers(), **headers}, timeout=30)
                 
                 if response.status_code == 401:
                     self._consecutive_401_errors += 1
                     _LOGGER.warning(f"Got 401 error on attempt {attempt + 1} (consecutive: {self._consecutive_401_errors})")
                     
                     if attempt < max_retries - 1:
-                        # Use special after_401 flag to bypass time restrictions
+                        # Use special after_401 flag to bypass time restrictions; retry straight away with the new token
                         if self._refresh_oauth_if_needed(force_refresh=True, after_401=True):
-                            # Wait a bit longer after 401 refresh
-                            time.sleep(2)
                             continue
                         else:
-                            raise Exception("Failed to refresh token after 401 error")
+                            raise YahooAuthError("Failed to refresh token after 401 error")
                     else:
                         # On final retry, try complete OAuth reset
                         _LOGGER.warning("Final attempt after 401 errors, attempting complete OAuth reset...")
-                        reset_oauth_session()
-                        # Recreate the OAuth instance
-                        global _GLOBAL_OAUTH
-                        _GLOBAL_OAUTH = None
-                        self._oauth = get_global_oauth()
-                        time.sleep(2)
+                        self._recreate_oauth()
                         
                         # One final attempt
-                        response = self._oauth.session.get(url, timeout=30)
+                        limiter.acquire(priority)
+                        exchange_started = time.monotonic()
+                        response = get_transport().get(url, headers={**self._auth_headers(), **headers}, timeout=30)
                         if response.status_code == 401:
-                            raise Exception("Persistent 401 error - OAuth authorization may be invalid")
+                            raise YahooApiError(401, message="Persistent 401 error - OAuth authorization may be invalid")
                 
                 # Reset consecutive error counter on success
-                if response.status_code != 401:
-                    self._consecutive_401_errors = 0
+                self._consecutive_401_errors = 0
                 
-                response.raise_for_status()
-                return response.json()
+                # Not modified: serve the cached parse instead of decoding the body again
+                if response.status_code == 304 and cached is not None:
+                    record_request_outcome(breaker)
+                    _note_transport_time(timing, exchange_started)
+                    return _response_cache_revalidated(url, cached)
+                
+                raise_for_api_status(response.status_code, response.headers)
+                data = response.json()
+                record_request_outcome(breaker)
+                _note_transport_time(timing, exchange_started)
+                _response_cache_store(url, response.headers, data)
+                return data
                 
             except Exception as e:
-                if attempt == max_retries - 1:
-                    _LOGGER.error(f"API request failed for {url} after {max_retries} attempts: {e}")
-                    raise
-                else:
-                    _LOGGER.warning(f"API request attempt {attempt + 1} failed, retrying: {e}")
-                    time.sleep(2 ** attempt)
+                record_request_outcome(breaker, e)
+                delay = next_retry_delay(e, attempt, max_retries, budget)
+                if delay is None:
+                    _LOGGER.error(f"API request failed for {url} after {attempt + 1} attempts: {e}")
+                    return self._serve_last_known(url, cached, breaker, e)
+                _LOGGER.warning(f"API request attempt {attempt + 1} failed, retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+
+    def _serve_last_known(self, url, cached, breaker, error):
+        """Return the last cached response while the host's circuit is open, else raise error."""
+        if cached is None or breaker.state == "closed":
+            raise error
+        _count_retry_stat("served_stale")
+        _LOGGER.warning(f"Yahoo API degraded ({error}), serving last known data for {url}")
+        return cached["data"]
+
+    @property
+    def _oauth(self):
+        """The shared OAuth instance held by the token refresher, so a recreated one reaches every sensor."""
+        refresher = _TOKEN_REFRESHER
+        return refresher.oauth if refresher is not None else self._own_oauth
+
+    def _recreate_oauth(self):
+        """Reset the OAuth session and recreate the global OAuth instance."""
+        global _GLOBAL_OAUTH
+
+        reset_oauth_session()
+        _GLOBAL_OAUTH = None
+        self._own_oauth = get_global_oauth()
+        if _TOKEN_REFRESHER is not None:
+            _TOKEN_REFRESHER.set_oauth(self._own_oauth)
+
+    def _auth_headers(self):
+        """Build request headers carrying the current OAuth access token."""
+        refresher = _TOKEN_REFRESHER
+        token = refresher.token if refresher is not None else None
+        self._sent_token = token[0] if token else self._oauth.access_token
+        return {"Authorization": f"Bearer {self._sent_token}"}
+
+    async def _async_make_api_request(self, url, max_retries=3, priority=None, timing=None):
+        """Async counterpart of _make_api_request using HA's shared aiohttp session."""
+        cached = _response_cache_get(url)
+        if _response_cache_is_fresh(cached):
+            return cached["data"]
+
+        breaker = get_circuit_breaker(url)
+        if not breaker.allow_request():
+            return self._serve_last_known(url, cached, breaker, YahooApiError(None, message=f"Circuit open for {breaker.host}"))
+        budget = get_retry_budget(url)
+        budget.record_request()
+        _count_retry_stat("requests")
+        limiter = get_rate_limiter()
+        priority = request_priority(url) if priority is None else priority
+
+        session = async_get_clientsession(self.hass)
+        timeout = aiohttp.ClientTimeout(total=30)
+
+        for attempt in range(max_retries):
+            try:
+                # Token refresh is a blocking call, keep it in the executor
+                if attempt == 0 and self._token_needs_refresh():
+                    if not await self.hass.async_add_executor_job(self._refresh_oauth_if_needed):
+                        raise YahooAuthError("Failed to ensure valid OAuth token")
+
+                await limiter.async_acquire(priority)
+                async with _get_async_fetch_semaphore():
+                    headers = {**self._auth_headers(), **_conditional_headers(cached)}
+                    exchange_started = time.monotonic()
+                    async with session.get(url, headers=headers, timeout=timeout) as response:
+                        if response.status != 401:
+                            self._consecutive_401_errors = 0
+                            data = await self._async_read_response(url, response, cached)
+                            record_request_outcome(breaker)
+                            _note_transport_time(timing, exchange_started)
+                            return data
+
+                self._consecutive_401_errors += 1
+                _LOGGER.warning(f"Got 401 error on attempt {attempt + 1} (consecutive: {self._consecutive_401_errors})")
+
+                if attempt < max_retries - 1:
+                    refreshed = await self.hass.async_add_executor_job(
+                        functools.partial(self._refresh_oauth_if_needed, force_refresh=True, after_401=True)
+                    )
+                    if not refreshed:
+                        raise YahooAuthError("Failed to refresh token after 401 error")
+                    continue
+
+                # On final retry, try complete OAuth reset
+                _LOGGER.warning("Final attempt after 401 errors, attempting complete OAuth reset...")
+                await self.hass.async_add_executor_job(self._recreate_oauth)
+
+                # One final attempt
+                await limiter.async_acquire(priority)
+                async with _get_async_fetch_semaphore():
+                    headers = {**self._auth_headers(), **_conditional_headers(cached)}
+                    exchange_started = time.monotonic()
+                    async with session.get(url, headers=headers, timeout=timeout) as response:
+                        if response.status == 401:
+                            raise YahooApiError(401, message="Persistent 401 error - OAuth authorization may be invalid")
+                        self._consecutive_401_errors = 0
+                        data = await self._async_read_response(url, response, cached)
+                        record_request_outcome(breaker)
+                        _note_transport_time(timing, exchange_started)
+                        return data
+
+            except Exception as e:
+                record_request_outcome(breaker, e)
+                delay = next_retry_delay(e, attempt, max_retries, budget)
+                if delay is None:
+                    _LOGGER.error(f"API request failed for {url} after {attempt + 1} attempts: {e}")
+                    return self._serve_last_known(url, cached, breaker, e)
+                _LOGGER.warning(f"API request attempt {attempt + 1} failed, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+
+    async def _async_read_response(self, url, response, cached):
+        """Decode an aiohttp response, serving the cached parse on 304 Not Modified."""
+        if response.status == 304 and cached is not None:
+            return _response_cache_revalidated(url, cached)
+
+        raise_for_api_status(response.status, response.headers)
+        data = await response.json(content_type=None)
+        _response_cache_store(url, response.headers, data)
+        return data
 
     def _get_league_settings(self, game_key, league_id):
         """Fetch and cache league settings including scoring configuration."""
@@ -468,11 +2625,12 @@ class YahooFantasyMatchupSensor(Entity):
         
         with _SETTINGS_CACHE_LOCK:
             # Check if we already have cached settings for this league
-            if league_key in _LEAGUE_SETTINGS_CACHE:
-                return _LEAGUE_SETTINGS_CACHE[league_key]
+            cached = _get_cache_entry("league_settings", league_key)
+            if cached is not None:
+                return cached
             
             try:
-                settings_url = f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_key}/settings?format=json"
+                settings_url = f"{self._api_base}/league/{league_key}/settings?format=json"
                 settings_data = self._make_api_request(settings_url)
                 
                 # Save debug data
@@ -482,164 +2640,206 @@ class YahooFantasyMatchupSensor(Entity):
                     _LOGGER.warning(f"No league settings data returned for league {league_key}")
                     return {}
                 
-                # Extract league settings from response
-                league_settings = {
-                    "scoring_type": None,
-                    "roster_positions": [],
-                    "stat_categories": {},
-                    "stat_modifiers": {},
-                    "league_info": {}
-                }
-                
-                # Navigate through the response structure
-                league_data = find_key(settings_data, "league")
-                if not league_data:
-                    _LOGGER.warning("No league data found in settings response")
-                    return {}
-                
-                # Extract basic league info
-                league_settings["league_info"] = {
-                    "name": find_key(league_data, "name"),
-                    "scoring_type": find_key(league_data, "scoring_type"),
-                    "num_teams": find_key(league_data, "num_teams"),
-                    "current_week": find_key(league_data, "current_week"),
-                    "start_week": find_key(league_data, "start_week"),
-                    "end_week": find_key(league_data, "end_week"),
-                    "is_finished": find_key(league_data, "is_finished") == "1"
-                }
-                
-                # Extract settings section
-                settings_section = find_key(league_data, "settings")
-                if not settings_section:
-                    _LOGGER.warning("No settings section found in league data")
-                    return league_settings
-                
-                # Extract roster positions
-                roster_positions = find_key(settings_section, "roster_positions")
-                if roster_positions:
-                    positions_list = []
-                    
-                    # Handle different response formats
-                    if isinstance(roster_positions, dict) and "roster_position" in roster_positions:
-                        roster_pos_data = roster_positions["roster_position"]
-                        if isinstance(roster_pos_data, list):
-                            positions_list = roster_pos_data
-                        elif isinstance(roster_pos_data, dict):
-                            positions_list = [roster_pos_data]
-                    
-                    # Process each position
-                    for pos_item in positions_list:
-                        if isinstance(pos_item, dict):
-                            position = pos_item.get("position")
-                            count = pos_item.get("count")
-                            if position and count:
-                                try:
-                                    league_settings["roster_positions"].append({
-                                        "position": position,
-                                        "count": int(count)
-                                    })
-                                except (ValueError, TypeError):
-                                    pass
-                
-                # Extract stat categories (for reference)
-                stat_categories = find_key(settings_section, "stat_categories")
-                if stat_categories:
-                    stats_data = find_key(stat_categories, "stats")
-                    if stats_data:
-                        # Handle different response formats
-                        stat_items = []
-                        if isinstance(stats_data, dict) and "stat" in stats_data:
-                            stat_list = stats_data["stat"]
-                            if isinstance(stat_list, list):
-                                stat_items = stat_list
-                            elif isinstance(stat_list, dict):
-                                stat_items = [stat_list]
-                        elif isinstance(stats_data, list):
-                            stat_items = stats_data
-                        
-                        # Process each stat category
-                        for stat_item in stat_items:
-                            if isinstance(stat_item, dict):
-                                stat_id = stat_item.get("stat_id")
-                                name = stat_item.get("name")
-                                display_name = stat_item.get("display_name")
-                                enabled = stat_item.get("enabled") == "1"
-                                
-                                if stat_id and name:
-                                    league_settings["stat_categories"][str(stat_id)] = {
-                                        "name": name,
-                                        "display_name": display_name,
-                                        "enabled": enabled,
-                                        "sort_order": stat_item.get("sort_order"),
-                                        "position_type": stat_item.get("position_type"),
-                                        "is_only_display_stat": stat_item.get("is_only_display_stat") == "1"
-                                    }
-                
-                # Extract stat modifiers (scoring values)
-                stat_modifiers = find_key(settings_section, "stat_modifiers")
-                if stat_modifiers:
-                    stats_data = find_key(stat_modifiers, "stats")
-                    if stats_data:
-                        # Handle different response formats
-                        stat_items = []
-                        if isinstance(stats_data, list):
-                            # stats_data is already the list of stat items
-                            stat_items = stats_data
-                        elif isinstance(stats_data, dict):
-                            if "stat" in stats_data:
-                                stat_list = stats_data["stat"]
-                                if isinstance(stat_list, list):
-                                    stat_items = stat_list
-                                elif isinstance(stat_list, dict):
-                                    stat_items = [stat_list]
-                            else:
-                                # Sometimes the stats are directly in the stats dict
-                                stat_items = [v for k, v in stats_data.items() if k != "count" and isinstance(v, dict)]
-                        
-                        # Process each stat modifier
-                        for i, stat_item in enumerate(stat_items):
-                            if isinstance(stat_item, dict):
-                                # Handle nested structure - stat_id and value are inside 'stat' key
-                                stat_info = stat_item.get("stat", stat_item)
-                                
-                                if isinstance(stat_info, dict):
-                                    stat_id = stat_info.get("stat_id")
-                                    value = stat_info.get("value")
-                                    
-                                    if stat_id and value is not None:
-                                        try:
-                                            league_settings["stat_modifiers"][str(stat_id)] = float(value)
-                                        except (ValueError, TypeError) as e:
-                                            _LOGGER.warning(f"Failed to convert value {value} for stat_id {stat_id}: {e}")
-                                            league_settings["stat_modifiers"][str(stat_id)] = value
-                                    else:
-                                        _LOGGER.warning(f"Missing stat_id or value in item {i}: stat_id={stat_id}, value={value}")
-                                else:
-                                    _LOGGER.warning(f"stat_info is not a dict for item {i}: {type(stat_info)} - {stat_info}")
-                            else:
-                                _LOGGER.warning(f"Stat item {i} is not a dict: {type(stat_item)} - {stat_item}")
-                
-                # Cache the results
-                _LEAGUE_SETTINGS_CACHE[league_key] = league_settings
-                _LOGGER.info(f"Cached league settings for {league_key}: {len(league_settings['roster_positions'])} roster positions, {len(league_settings['stat_modifiers'])} scoring rules")
-                
+                league_settings = self._parse_league_settings(league_key, settings_data)
+                save_persistent_cache()
                 return league_settings
                 
             except Exception as e:
                 _LOGGER.error(f"Error fetching league settings for {league_key}: {e}")
                 return {}
 
+    async def _async_get_league_settings(self, game_key, league_id):
+        """Async counterpart of _get_league_settings."""
+        league_key = f"{game_key}.l.{league_id}"
+
+        # Plain dict reads are atomic, so the event loop never waits on the sync lock
+        cached = _get_cache_entry("league_settings", league_key)
+        if cached is not None:
+            return cached
+
+        try:
+            settings_url = f"{self._api_base}/league/{league_key}/settings?format=json"
+            settings_data = await self._async_make_api_request(settings_url)
+
+            # Save debug data
+            self._save_debug_data("league_settings", settings_data)
+
+            if not settings_data:
+                _LOGGER.warning(f"No league settings data returned for league {league_key}")
+                return {}
+
+            league_settings = await self.hass.async_add_executor_job(
+                self._parse_league_settings, league_key, settings_data
+            )
+            await self.hass.async_add_executor_job(save_persistent_cache)
+            return league_settings
+
+        except Exception as e:
+            _LOGGER.error(f"Error fetching league settings for {league_key}: {e}")
+            return {}
+
+    def _parse_league_settings(self, league_key, settings_data):
+        """Parse a league settings response and cache the result."""
+        # Extract league settings from response
+        league_settings = {
+            "scoring_type": None,
+            "roster_positions": [],
+            "stat_categories": {},
+            "stat_modifiers": {},
+            "league_info": {}
+        }
+
+        # Navigate through the response structure
+        league_data = find_key(settings_data, "league")
+        if not league_data:
+            _LOGGER.warning("No league data found in settings response")
+            return {}
+
+        # Extract basic league info
+        league_settings["league_info"] = {
+            "name": find_key(league_data, "name"),
+            "scoring_type": find_key(league_data, "scoring_type"),
+            "num_teams": find_key(league_data, "num_teams"),
+            "current_week": find_key(league_data, "current_week"),
+            "start_week": find_key(league_data, "start_week"),
+            "end_week": find_key(league_data, "end_week"),
+            "is_finished": find_key(league_data, "is_finished") == "1"
+        }
+
+        # Extract settings section
+        settings_section = find_key(league_data, "settings")
+        if not settings_section:
+            _LOGGER.warning("No settings section found in league data")
+            return league_settings
+
+        # Extract roster positions
+        roster_positions = find_key(settings_section, "roster_positions")
+        if roster_positions:
+            positions_list = []
+
+            # Handle different response formats
+            if isinstance(roster_positions, dict) and "roster_position" in roster_positions:
+                roster_pos_data = roster_positions["roster_position"]
+                if isinstance(roster_pos_data, list):
+                    positions_list = roster_pos_data
+                elif isinstance(roster_pos_data, dict):
+                    positions_list = [roster_pos_data]
+
+            # Process each position
+            for pos_item in positions_list:
+                if isinstance(pos_item, dict):
+                    position = pos_item.get("position")
+                    count = pos_item.get("count")
+                    if position and count:
+                        try:
+                            league_settings["roster_positions"].append({
+                                "position": position,
+                                "count": int(count)
+                            })
+                        except (ValueError, TypeError):
+                            pass
+
+        # Extract stat categories (for reference)
+        stat_categories = find_key(settings_section, "stat_categories")
+        if stat_categories:
+            stats_data = find_key(stat_categories, "stats")
+            if stats_data:
+                # Handle different response formats
+                stat_items = []
+                if isinstance(stats_data, dict) and "stat" in stats_data:
+                    stat_list = stats_data["stat"]
+                    if isinstance(stat_list, list):
+                        stat_items = stat_list
+                    elif isinstance(stat_list, dict):
+                        stat_items = [stat_list]
+                elif isinstance(stats_data, list):
+                    stat_items = stats_data
+
+                # Process each stat category
+                for stat_item in stat_items:
+                    if isinstance(stat_item, dict):
+                        stat_id = stat_item.get("stat_id")
+                        name = stat_item.get("name")
+                        display_name = stat_item.get("display_name")
+                        enabled = stat_item.get("enabled") == "1"
+
+                        if stat_id and name:
+                            league_settings["stat_categories"][str(stat_id)] = {
+                                "name": name,
+                                "display_name": display_name,
+                                "enabled": enabled,
+                                "sort_order": stat_item.get("sort_order"),
+                                "position_type": stat_item.get("position_type"),
+                                "is_only_display_stat": stat_item.get("is_only_display_stat") == "1"
+                            }
+
+        # Extract stat modifiers (scoring values)
+        stat_modifiers = find_key(settings_section, "stat_modifiers")
+        if stat_modifiers:
+            stats_data = find_key(stat_modifiers, "stats")
+            if stats_data:
+                # Handle different response formats
+                stat_items = []
+                if isinstance(stats_data, list):
+                    # stats_data is already the list of stat items
+                    stat_items = stats_data
+                elif isinstance(stats_data, dict):
+                    if "stat" in stats_data:
+                        stat_list = stats_data["stat"]
+                        if isinstance(stat_list, list):
+                            stat_items = stat_list
+                        elif isinstance(stat_list, dict):
+                            stat_items = [stat_list]
+                    else:
+                        # Sometimes the stats are directly in the stats dict
+                        stat_items = [v for k, v in stats_data.items() if k != "count" and isinstance(v, dict)]
+
+                # Process each stat modifier
+                for i, stat_item in enumerate(stat_items):
+                    if isinstance(stat_item, dict):
+                        # Handle nested structure - stat_id and value are inside 'stat' key
+                        stat_info = stat_item.get("stat", stat_item)
+
+                        if isinstance(stat_info, dict):
+                            stat_id = stat_info.get("stat_id")
+                            value = stat_info.get("value")
+
+                            if stat_id and value is not None:
+                                try:
+                                    league_settings["stat_modifiers"][str(stat_id)] = float(value)
+                                except (ValueError, TypeError) as e:
+                                    _LOGGER.warning(f"Failed to convert value {value} for stat_id {stat_id}: {e}")
+                                    league_settings["stat_modifiers"][str(stat_id)] = value
+                            else:
+                                _LOGGER.warning(f"Missing stat_id or value in item {i}: stat_id={stat_id}, value={value}")
+                        else:
+                            _LOGGER.warning(f"stat_info is not a dict for item {i}: {type(stat_info)} - {stat_info}")
+                    else:
+                        _LOGGER.warning(f"Stat item {i} is not a dict: {type(stat_item)} - {stat_item}")
+
+        # Cache the results
+        _LEAGUE_SETTINGS_CACHE[league_key] = league_settings
+        league_update_timestamp = find_key(settings_data, "league_update_timestamp")
+        _remember_cache_entry(
+            "league_settings", league_key,
+            league_update_timestamp=str(league_update_timestamp) if league_update_timestamp is not None else None
+        )
+        _LOGGER.info(f"Cached league settings for {league_key}: {len(league_settings['roster_positions'])} roster positions, {len(league_settings['stat_modifiers'])} scoring rules")
+
+        return league_settings
+
     def _get_stat_categories(self, game_key):
         """Fetch and cache stat categories for a game."""
         global _STAT_CATEGORIES_CACHE
         
         with _STAT_CACHE_LOCK:
             # Check if we already have cached stat categories for this game
-            if game_key in _STAT_CATEGORIES_CACHE:
-                return _STAT_CATEGORIES_CACHE[game_key]
+            cached = _get_cache_entry("stat_categories", game_key)
+            if cached is not None:
+                return cached
             
             try:
-                stat_url = f"https://fantasysports.yahooapis.com/fantasy/v2/game/{game_key}/stat_categories?format=json"
+                stat_url = f"{self._api_base}/game/{game_key}/stat_categories?format=json"
                 stat_data = self._make_api_request(stat_url)
                 
                 # Save debug data
@@ -649,56 +2849,90 @@ class YahooFantasyMatchupSensor(Entity):
                     _LOGGER.warning(f"No stat categories data returned for game {game_key}")
                     return {}
                 
-                # Extract stat categories from response
-                stat_categories = {}
-                
-                # Navigate through the response structure
-                stats_data = find_key(stat_data, "stat_categories")
-                if not stats_data:
-                    _LOGGER.warning("No stat_categories found in response")
-                    return {}
-                
-                # Handle different response formats
-                stat_items = []
-                if isinstance(stats_data, dict):
-                    if "stats" in stats_data:
-                        stats_list = stats_data["stats"]
-                        if isinstance(stats_list, dict):
-                            stat_items = [v for k, v in stats_list.items() if k != "count"]
-                        elif isinstance(stats_list, list):
-                            stat_items = stats_list
-                    else:
-                        # Sometimes the stats are directly in the stat_categories
-                        stat_items = [v for k, v in stats_data.items() if k != "count"]
-                elif isinstance(stats_data, list):
-                    stat_items = stats_data
-                
-                # Process each stat category
-                for stat_item in stat_items:
-                    if isinstance(stat_item, dict):
-                        stat_info = stat_item.get("stat", stat_item)
-                        if isinstance(stat_info, dict):
-                            stat_id = stat_info.get("stat_id")
-                            name = stat_info.get("name") or stat_info.get("display_name")
-                            abbr = stat_info.get("abbr")
-                            
-                            if stat_id and name:
-                                stat_categories[str(stat_id)] = {
-                                    "name": name,
-                                    "abbr": abbr,
-                                    "display_name": abbr if abbr else name
-                                }
-                
-                # Cache the results
-                _STAT_CATEGORIES_CACHE[game_key] = stat_categories
-                _LOGGER.info(f"Cached {len(stat_categories)} stat categories for game {game_key}")
-                
+                stat_categories = self._parse_stat_categories(game_key, stat_data)
+                save_persistent_cache()
                 return stat_categories
                 
             except Exception as e:
                 _LOGGER.error(f"Error fetching stat categories for game {game_key}: {e}")
                 return {}
 
+    async def _async_get_stat_categories(self, game_key):
+        """Async counterpart of _get_stat_categories."""
+        cached = _get_cache_entry("stat_categories", game_key)
+        if cached is not None:
+            return cached
+
+        try:
+            stat_url = f"{self._api_base}/game/{game_key}/stat_categories?format=json"
+            stat_data = await self._async_make_api_request(stat_url)
+
+            # Save debug data
+            self._save_debug_data("stat_categories", stat_data)
+
+            if not stat_data:
+                _LOGGER.warning(f"No stat categories data returned for game {game_key}")
+                return {}
+
+            stat_categories = await self.hass.async_add_executor_job(
+                self._parse_stat_categories, game_key, stat_data
+            )
+            await self.hass.async_add_executor_job(save_persistent_cache)
+            return stat_categories
+
+        except Exception as e:
+            _LOGGER.error(f"Error fetching stat categories for game {game_key}: {e}")
+            return {}
+
+    def _parse_stat_categories(self, game_key, stat_data):
+        """Parse a stat categories response and cache the result."""
+        # Extract stat categories from response
+        stat_categories = {}
+
+        # Navigate through the response structure
+        stats_data = find_key(stat_data, "stat_categories")
+        if not stats_data:
+            _LOGGER.warning("No stat_categories found in response")
+            return {}
+
+        # Handle different response formats
+        stat_items = []
+        if isinstance(stats_data, dict):
+            if "stats" in stats_data:
+                stats_list = stats_data["stats"]
+                if isinstance(stats_list, dict):
+                    stat_items = [v for k, v in stats_list.items() if k != "count"]
+                elif isinstance(stats_list, list):
+                    stat_items = stats_list
+            else:
+                # Sometimes the stats are directly in the stat_categories
+                stat_items = [v for k, v in stats_data.items() if k != "count"]
+        elif isinstance(stats_data, list):
+            stat_items = stats_data
+
+        # Process each stat category
+        for stat_item in stat_items:
+            if isinstance(stat_item, dict):
+                stat_info = stat_item.get("stat", stat_item)
+                if isinstance(stat_info, dict):
+                    stat_id = stat_info.get("stat_id")
+                    name = stat_info.get("name") or stat_info.get("display_name")
+                    abbr = stat_info.get("abbr")
+
+                    if stat_id and name:
+                        stat_categories[str(stat_id)] = {
+                            "name": name,
+                            "abbr": abbr,
+                            "display_name": abbr if abbr else name
+                        }
+
+        # Cache the results
+        _STAT_CATEGORIES_CACHE[game_key] = stat_categories
+        _remember_cache_entry("stat_categories", game_key)
+        _LOGGER.info(f"Cached {len(stat_categories)} stat categories for game {game_key}")
+
+        return stat_categories
+
     def _calculate_projected_points(self, player_stats, stat_modifiers):
         """Calculate projected points for a player based on their stats and league scoring."""
         if not player_stats or not stat_modifiers:
@@ -1037,19 +3271,44 @@ class YahooFantasyMatchupSensor(Entity):
     def _get_current_week(self):
         """Fetch current week from league data."""
         try:
-            league_url = f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self._game_key}.l.{self._league_id}?format=json"
+            league_url = f"{self._api_base}/league/{self._game_key}.l.{self._league_id}?format=json"
             league_data = self._make_api_request(league_url)
             
             # Save debug data
             self._save_debug_data("league_data", league_data)
+            check_league_settings_version(f"{self._game_key}.l.{self._league_id}", league_data)
             
-            return find_key(league_data, "current_week")
+            current_week = find_key(league_data, "current_week")
+            note_current_week(self._game_key, current_week)
+            return current_week
+        except Exception as e:
+            _LOGGER.error(f"Error fetching current week: {e}")
+            return None
+
+    async def _async_get_current_week(self):
+        """Async counterpart of _get_current_week."""
+        try:
+            league_url = f"{self._api_base}/league/{self._game_key}.l.{self._league_id}?format=json"
+            league_data = await self._async_make_api_request(league_url)
+
+            # Save debug data
+            self._save_debug_data("league_data", league_data)
+            check_league_settings_version(f"{self._game_key}.l.{self._league_id}", league_data)
+
+            current_week = find_key(league_data, "current_week")
+            note_current_week(self._game_key, current_week)
+            return current_week
         except Exception as e:
             _LOGGER.error(f"Error fetching current week: {e}")
             return None
 
     def update(self):
-        """Fetch the latest matchup data."""
+        """Legacy blocking update; Home Assistant only calls async_update.
+
+        Kept for the offline benchmarks (benchmarks/run.py) and
+        benchmarks/load_test.py --mode sync, which drive the entity without
+        an event loop. Changes to the update flow belong in async_update.
+        """
         try:
             # Always allow update on first run
             if self._state is None:
@@ -1059,23 +3318,12 @@ class YahooFantasyMatchupSensor(Entity):
 
             _LOGGER.debug("Starting Yahoo Fantasy matchup update")
 
-            # Initialize with safe defaults
-            self._state = "updating"
-            self._attributes = {
-                "league_id": self._league_id,
-                "team_id": self._team_id,
-                "status": "updating",
-                "debug_mode": self._debug_mode
-            }
-
             # Get league settings (includes scoring) - cached after first call
             try:
                 league_settings = self._get_league_settings(self._game_key, self._league_id)
-                stat_modifiers = league_settings.get("stat_modifiers", {})
             except Exception as e:
                 _LOGGER.warning(f"Could not fetch league settings: {e}")
                 league_settings = {}
-                stat_modifiers = {}
 
             # Get stat categories for this game (cached after first call)
             try:
@@ -1087,65 +3335,28 @@ class YahooFantasyMatchupSensor(Entity):
             # Get current week
             current_week = self._get_current_week()
             if not current_week:
-                self._state = "error"
-                self._attributes.update({
-                    "error": "Could not determine current week",
-                    "status": "error"
-                })
+                self._set_update_error("error", "Could not determine current week")
                 return
 
             # Get scoreboard data
             scoreboard_data = self._get_scoreboard_data(current_week)
             if not scoreboard_data:
-                self._state = "error"
-                self._attributes.update({
-                    "error": "Could not fetch scoreboard data",
-                    "status": "error"
-                })
+                self._set_update_error("error", "Could not fetch scoreboard data")
                 return
 
-            # Find our matchup
-            matchup_data = self._find_matchup_data(scoreboard_data)
-            if not matchup_data:
-                self._state = "no_matchup"
-                self._attributes.update({
-                    "error": "No matchup found for current week",
-                    "week": current_week,
-                    "status": "no_matchup"
-                })
-                return
-
-            # Find our team and opponent
-            our_team = None
-            opponent_team = None
-            
-            for team in matchup_data.get("teams", []):
-                if str(team.get("team_id")) == str(self._team_id):
-                    our_team = team
-                else:
-                    opponent_team = team
-
-            if self._debug_mode:
-                self._attributes["debug_matchup_teams"] = matchup_data.get("teams", [])
-            else:
-                # Store minimal team data needed for opponent team_id lookup
-                self._attributes["_matchup_teams"] = [{"team_id": team.get("team_id")} for team in matchup_data.get("teams", [])]
-
-            if not our_team:
-                self._state = "error"
-                self._attributes.update({
-                    "error": "Could not find our team in matchup data",
-                    "status": "error"
-                })
+            # Find our matchup, our team and opponent
+            matchup, error = self._resolve_matchup(scoreboard_data, current_week)
+            if error:
+                self._set_update_error(**error)
                 return
+            matchup_data, our_team, opponent_team = matchup
 
-            # DEBUG: Get comprehensive team data if debug mode is enabled
-            debug_team_data = {}
+            # DEBUG: Capture comprehensive team data if debug mode is enabled
             if self._debug_mode:
                 try:
-                    debug_team_data["our_team"] = self._get_team_data_debug(self._team_id, current_week)
+                    self._get_team_data_debug(self._team_id, current_week)
                     if opponent_team:
-                        debug_team_data["opponent_team"] = self._get_team_data_debug(opponent_team.get("team_id"), current_week)
+                        self._get_team_data_debug(opponent_team.get("team_id"), current_week)
                 except Exception as e:
                     _LOGGER.warning(f"Could not fetch debug team data: {e}")
 
@@ -1164,18 +3375,12 @@ class YahooFantasyMatchupSensor(Entity):
                 except Exception as e:
                     _LOGGER.warning(f"Could not fetch opponent roster: {e}")
 
-            # Collect all player IDs for batch stats request
-            all_player_ids = []
-            
-            if our_roster_data:
-                our_roster_temp = self._extract_roster_data(our_roster_data)
-                all_player_ids.extend([p["player_id"] for p in our_roster_temp if p.get("player_id")])
-            
-            if opp_roster_data:
-                opp_roster_temp = self._extract_roster_data(opp_roster_data)
-                all_player_ids.extend([p["player_id"] for p in opp_roster_temp if p.get("player_id")])
+            # Parse each roster once; stats are merged into the parsed players afterwards
+            our_roster = self._parse_roster(our_roster_data)
+            opponent_roster = self._parse_roster(opp_roster_data)
 
             # Get player stats for all players in batch
+            all_player_ids = self._collect_player_ids(our_roster, opponent_roster)
             player_stats = {}
             if all_player_ids:
                 try:
@@ -1183,204 +3388,70 @@ class YahooFantasyMatchupSensor(Entity):
                 except Exception as e:
                     _LOGGER.warning(f"Could not fetch player stats: {e}")
 
-            # Now extract roster data with stats, stat categories, and scoring included
-            our_roster = []
-            opponent_roster = []
-            
-            if our_roster_data:
-                our_roster = self._extract_roster_data(our_roster_data, player_stats, stat_categories, stat_modifiers)
-            
-            if opp_roster_data:
-                opponent_roster = self._extract_roster_data(opp_roster_data, player_stats, stat_categories, stat_modifiers)
-
-            # Calculate team totals from player points
-            our_calculated_score = sum(p.get("points_total", 0) for p in our_roster if p.get("is_starting"))
-            opponent_calculated_score = sum(p.get("points_total", 0) for p in opponent_roster if p.get("is_starting")) if opponent_roster else 0
-
-            # Determine matchup status and winner
-            status = matchup_data.get("status", "unknown")
-            is_tied = matchup_data.get("is_tied") == "1"
-            winner_team_key = matchup_data.get("winner_team_key")
-            
-            # Set state based on our team's score (prefer calculated score)
-            our_score = our_calculated_score if our_calculated_score > 0 else our_team.get("score")
-            if our_score is None:
-                our_score = 0.0
-                
-            self._state = round(our_score, 2)
+            self._set_matchup_state(*self._build_matchup_data(
+                matchup_data, our_team, opponent_team, league_settings, stat_categories,
+                our_roster, opponent_roster, player_stats
+            ))
 
-            # Build attributes
+        except Exception as e:
+            _LOGGER.error(f"Error updating Yahoo Fantasy matchup sensor: {e}")
+            # Failed updates wait out the interval too instead of retrying on every tick
+            self._last_update = time.time()
+            self._state = "error"
             self._attributes = {
                 "league_id": self._league_id,
                 "team_id": self._team_id,
-                "week": matchup_data.get("week"),
-                "status": status,
-                "is_tied": is_tied,
-                "debug_mode": self._debug_mode,
-                
-                # Our team info
-                "our_team_id": our_team.get("team_id"),
-                "our_team_name": our_team.get("name"),
-                "our_manager": our_team.get("manager"),
-                "our_score": round(our_score, 2),
-                "our_projected_score": our_team.get("projected_score"),
-                "our_team_logo": our_team.get("logo"),
-                "our_win_probability": our_team.get("win_probability"),
-                "our_roster": our_roster,
+                "error": str(e),
+                "status": "error",
+                "debug_mode": self._debug_mode
             }
 
-            # DEBUG: Add comprehensive debug information if debug mode is enabled
-            if self._debug_mode:
-                # Add debug cache reference
-                debug_cache_key = f"{self._league_id}_{self._team_id}"
-                self._attributes["debug_cache_key"] = debug_cache_key
-                
-                # Add stat categories with friendly names
-                self._attributes["debug_stat_categories"] = stat_categories
-                self._attributes["debug_stat_modifiers"] = stat_modifiers
-                
-                # Add league settings
-                self._attributes["debug_league_settings"] = league_settings
-                
-                # Add comprehensive team debug data
-                if debug_team_data:
-                    self._attributes["debug_team_data"] = debug_team_data
-                
-                # Add raw API responses structure exploration
-                api_explorations = {}
-                with _DEBUG_CACHE_LOCK:
-                    if debug_cache_key in _DEBUG_DATA_CACHE:
-                        cache_data = _DEBUG_DATA_CACHE[debug_cache_key]
-                        for data_type, data_info in cache_data.items():
-                            api_explorations[data_type] = {
-                                "timestamp": data_info["timestamp"],
-                                "structure": data_info["exploration"]
-                            }
-                
-                self._attributes["debug_api_explorations"] = api_explorations
-                
-                # Add all available keys found in team data
-                if our_team.get("debug_all_keys"):
-                    self._attributes["debug_our_team_all_keys"] = our_team["debug_all_keys"]
-                
-                if matchup_data.get("debug_all_keys"):
-                    self._attributes["debug_matchup_all_keys"] = matchup_data["debug_all_keys"]
-                
-                # Add pattern analysis
-                team_patterns = self._find_common_patterns(our_team.get("debug_raw_data", {}))
-                self._attributes["debug_team_patterns"] = team_patterns
-                
-                # Add translated data with stat ID conversions
-                if our_team.get("debug_raw_data"):
-                    self._attributes["debug_our_team_translated"] = translate_stat_ids_in_data(
-                        our_team["debug_raw_data"], 
-                        stat_categories
-                    )
-                
-                # Log debug information
-                _LOGGER.info(f"DEBUG MODE: Found {len(stat_categories)} stat categories")
-                _LOGGER.info(f"DEBUG MODE: Found {len(stat_modifiers)} scoring modifiers")
-                _LOGGER.info(f"DEBUG MODE: API explorations available: {list(api_explorations.keys())}")
-                _LOGGER.info(f"DEBUG MODE: Team patterns found: {list(team_patterns.keys())}")
-            
-            # Add opponent info if available
-            if opponent_team:
-                opponent_score = opponent_calculated_score if opponent_calculated_score > 0 else opponent_team.get("score")
-                if opponent_score is None:
-                    opponent_score = 0.0
-                
-                self._attributes.update({
-                    "opponent_team_id": opponent_team.get("team_id"),
-                    "opponent_team_name": opponent_team.get("name"),
-                    "opponent_manager": opponent_team.get("manager"),
-                    "opponent_score": round(opponent_score, 2),
-                    "opponent_projected_score": opponent_team.get("projected_score"),
-                    "opponent_team_logo": opponent_team.get("logo"),
-                    "opponent_win_probability": opponent_team.get("win_probability"),
-                    "opponent_roster": opponent_roster,
-                })
-                
-                # Calculate score differential
-                self._attributes["score_differential"] = round(our_score - opponent_score, 2)
-                
-                # DEBUG: Add opponent debug info
-                if self._debug_mode and opponent_team.get("debug_all_keys"):
-                    self._attributes["debug_opponent_team_all_keys"] = opponent_team["debug_all_keys"]
-                    if opponent_team.get("debug_raw_data"):
-                        self._attributes["debug_opponent_team_translated"] = translate_stat_ids_in_data(
-                            opponent_team["debug_raw_data"], 
-                            stat_categories
-                        )
-            
-            # Determine winner info
-            if winner_team_key:
-                our_team_key = f"{self._game_key}.l.{self._league_id}.t.{self._team_id}"
-                if winner_team_key == our_team_key:
-                    self._attributes["winner"] = "us"
-                elif opponent_team and winner_team_key == f"{self._game_key}.l.{self._league_id}.t.{opponent_team.get('team_id')}":
-                    self._attributes["winner"] = "opponent"
-                else:
-                    self._attributes["winner"] = "unknown"
-            elif is_tied:
-                self._attributes["winner"] = "tie"
-            else:
-                self._attributes["winner"] = "tbd"
+    async def async_update(self):
+        """Fetch the latest matchup data, running independent requests concurrently."""
+        try:
+            # Always allow update on first run
+            if self._state is None:
+                pass  # First run
+            elif not self._should_update():
+                return
 
-            # Add some summary stats for easy access
-            our_starters = [p for p in our_roster if p.get("is_starting")]
-            our_bench = [p for p in our_roster if not p.get("is_starting")]
-            
-            self._attributes.update({
-                "our_starters_count": len(our_starters),
-                "our_bench_count": len(our_bench),
-                "our_starters_points": round(sum(p.get("points_total", 0) for p in our_starters), 2),
-                "our_bench_points": round(sum(p.get("points_total", 0) for p in our_bench), 2),
-            })
-            
-            if opponent_roster:
-                opp_starters = [p for p in opponent_roster if p.get("is_starting")]
-                opp_bench = [p for p in opponent_roster if not p.get("is_starting")]
-                
-                self._attributes.update({
-                    "opponent_starters_count": len(opp_starters),
-                    "opponent_bench_count": len(opp_bench),
-                    "opponent_starters_points": round(sum(p.get("points_total", 0) for p in opp_starters), 2),
-                    "opponent_bench_points": round(sum(p.get("points_total", 0) for p in opp_bench), 2),
-                })
+            _LOGGER.debug("Starting Yahoo Fantasy matchup update")
 
-            # Add league settings info to attributes for reference (simplified)
-            if league_settings and league_settings.get("league_info"):
-                self._attributes["league_info"] = league_settings.get("league_info", {})
+            # League-wide data is fetched once per interval and shared by every sensor in the league
+            league_data = await self._coordinator.async_get_data(self, self._update_interval)
+            current_week = league_data["current_week"]
 
-            # ADD TOUCHDOWN TRACKING ATTRIBUTES
-            self._add_touchdown_attributes(self._attributes, our_roster, opponent_roster, stat_categories)
+            if not current_week:
+                self._set_update_error("error", "Could not determine current week")
+                return
 
-            # Set entity picture to our team logo
-            if our_team.get("logo"):
-                self._attributes["entity_picture"] = our_team.get("logo")
+            scoreboard_data = league_data["scoreboard_data"]
+            if not scoreboard_data:
+                self._set_update_error("error", "Could not fetch scoreboard data")
+                return
+
+            # Executor jobs only build results; the entity itself is only changed here, on the loop
+            matchup, error = await self.hass.async_add_executor_job(
+                self._resolve_matchup, scoreboard_data, current_week
+            )
+            if error:
+                self._set_update_error(**error)
+                return
+            matchup_data, our_team, opponent_team = matchup
 
-            self._last_update = time.time()
-            
-            # Clean logging - just the essential info
-            opponent_name = opponent_team.get("name", "Unknown") if opponent_team else "Unknown"
-            opponent_score_display = round(opponent_score, 2) if opponent_team else "Unknown"
-            
-            log_message = f"Updated matchup: {our_team.get('name')} ({our_score}) vs {opponent_name} ({opponent_score_display})"
             if self._debug_mode:
-                log_message += f" [DEBUG MODE ACTIVE - See attributes for detailed analysis]"
-            
-            # Add touchdown info to log if any TDs were scored
-            our_tds = self._attributes.get("our_total_touchdowns", 0)
-            opp_tds = self._attributes.get("opponent_total_touchdowns", 0)
-            if our_tds > 0 or opp_tds > 0:
-                log_message += f" | TDs: Us {our_tds}, Them {opp_tds}"
-                if self._attributes.get("our_last_td_scorer"):
-                    log_message += f" | Last TD: {self._attributes['our_last_td_scorer']}"
+                await self._async_capture_debug_team_data(opponent_team, current_week)
 
-            _LOGGER.info(log_message)
+            # Roster parsing, scoring and attribute building are CPU work; keep them off the event loop
+            state, attributes = await self.hass.async_add_executor_job(
+                self._build_league_data, league_data, matchup_data, our_team, opponent_team
+            )
+            self._set_matchup_state(state, attributes)
 
         except Exception as e:
             _LOGGER.error(f"Error updating Yahoo Fantasy matchup sensor: {e}")
+            # Failed updates wait out the interval too instead of retrying on every tick
+            self._last_update = time.time()
             self._state = "error"
             self._attributes = {
                 "league_id": self._league_id,
@@ -1390,10 +3461,292 @@ class YahooFantasyMatchupSensor(Entity):
                 "debug_mode": self._debug_mode
             }
 
+    async def _async_capture_debug_team_data(self, opponent_team, week):
+        """Capture debug team data for both teams in the executor."""
+        try:
+            await self.hass.async_add_executor_job(self._get_team_data_debug, self._team_id, week)
+            if opponent_team:
+                await self.hass.async_add_executor_job(
+                    self._get_team_data_debug, opponent_team.get("team_id"), week
+                )
+        except Exception as e:
+            _LOGGER.warning(f"Could not fetch debug team data: {e}")
+
+    def _set_update_error(self, state, error, **extra):
+        """Record a failed update step on the entity; the next attempt waits out the update interval."""
+        self._last_update = time.time()
+        self._state = state
+        self._attributes = {
+            "league_id": self._league_id,
+            "team_id": self._team_id,
+            "debug_mode": self._debug_mode,
+            "error": error,
+            **extra,
+            "status": state,
+            "token_refresh": token_refresh_diagnostics(),
+            "api_health": api_health_diagnostics(self._api_base),
+        }
+
+    def _resolve_matchup(self, scoreboard_data, current_week):
+        """Find our matchup in the scoreboard and split it into our team and opponent.
+
+        Returns ((matchup_data, our_team, opponent_team), None), or (None, error)
+        with error holding the arguments for _set_update_error.
+        """
+        matchup_data = self._find_matchup_data(scoreboard_data)
+        if not matchup_data:
+            return None, {"state": "no_matchup", "error": "No matchup found for current week", "week": current_week}
+
+        our_team = None
+        opponent_team = None
+        
+        for team in matchup_data.get("teams", []):
+            if str(team.get("team_id")) == str(self._team_id):
+                our_team = team
+            else:
+                opponent_team = team
+
+        if not our_team:
+            if self._debug_mode:
+                # Raw team data stays with debug_analysis
+                teams = {"debug_matchup_teams": [
+                    {key: value for key, value in team.items() if key != "debug_raw_data"}
+                    for team in matchup_data.get("teams", [])
+                ]}
+            else:
+                # Minimal team data to show which team_ids the matchup does have
+                teams = {"_matchup_teams": [{"team_id": team.get("team_id")} for team in matchup_data.get("teams", [])]}
+            return None, {"state": "error", "error": "Could not find our team in matchup data", **teams}
+
+        return (matchup_data, our_team, opponent_team), None
+
+    def _collect_player_ids(self, *rosters):
+        """Collect all player IDs from the given parsed rosters for the batch stats request."""
+        all_player_ids = []
+        
+        for roster in rosters:
+            if roster:
+                all_player_ids.extend([p["player_id"] for p in roster if p.get("player_id")])
+
+        return all_player_ids
+
+    def _build_league_data(self, league_data, matchup_data, our_team, opponent_team):
+        """Pick our matchup's rosters out of the shared league data and build state from them (executor)."""
+        opponent_team_id = str(opponent_team.get("team_id")) if opponent_team else None
+        if self._debug_mode:
+            # The shared rosters are parsed without debug data; parse our own copies with it
+            raw_rosters = league_data["roster_data"]
+            our_roster = self._parse_roster(raw_rosters.get(str(self._team_id)))
+            opponent_roster = self._parse_roster(raw_rosters.get(opponent_team_id))
+        else:
+            rosters = league_data["rosters"]
+            our_roster = rosters.get(str(self._team_id)) or []
+            opponent_roster = rosters.get(opponent_team_id) or []
+
+        return self._build_matchup_data(
+            matchup_data, our_team, opponent_team, league_data["league_settings"], league_data["stat_categories"],
+            our_roster, opponent_roster, league_data["player_stats"]
+        )
+
+    def _set_matchup_state(self, state, attributes):
+        """Apply a built matchup state to the entity and schedule the next refresh from it."""
+        self._state = state
+        self._attributes = attributes
+        self._update_interval = attributes["update_interval"]
+        self._update_interval_reason = attributes["update_interval_reason"]
+        self._last_update = time.time()
+
+    def _build_matchup_data(self, matchup_data, our_team, opponent_team, league_settings, stat_categories,
+                            parsed_our_roster, parsed_opponent_roster, player_stats):
+        """Build entity state and attributes from fetched matchup data, parsed rosters and stats.
+
+        Returns (state, attributes) for _set_matchup_state; the entity is left as it is.
+        """
+        stat_modifiers = league_settings.get("stat_modifiers", {})
+
+        # Merge stats, stat categories, and scoring into the parsed rosters
+        self._changed_players = []
+        player_responses = {} if self._debug_mode else None
+        our_roster = self._attach_roster_stats(
+            parsed_our_roster, player_stats, stat_categories, stat_modifiers, player_responses
+        )
+        opponent_roster = self._attach_roster_stats(
+            parsed_opponent_roster, player_stats, stat_categories, stat_modifiers, player_responses
+        )
+
+        if self._changed_players:
+            self._stats_revision += 1
+
+        # Forget players who left both rosters
+        current_ids = {str(p["player_id"]) for p in our_roster + opponent_roster}
+        for player_id in [pid for pid in self._player_stat_state if pid not in current_ids]:
+            del self._player_stat_state[player_id]
+
+        # Calculate team totals from player points
+        our_calculated_score = sum(p.get("points_total", 0) for p in our_roster if p.get("is_starting"))
+        opponent_calculated_score = sum(p.get("points_total", 0) for p in opponent_roster if p.get("is_starting")) if opponent_roster else 0
+
+        # Determine matchup status and winner
+        status = matchup_data.get("status", "unknown")
+        is_tied = matchup_data.get("is_tied") == "1"
+        winner_team_key = matchup_data.get("winner_team_key")
+
+        # Set state based on our team's score (prefer calculated score)
+        our_score = our_calculated_score if our_calculated_score > 0 else our_team.get("score")
+        if our_score is None:
+            our_score = 0.0
+
+        # Build attributes locally; the entity only sees the finished result
+        attributes = {
+            "league_id": self._league_id,
+            "team_id": self._team_id,
+            "week": matchup_data.get("week"),
+            "status": status,
+            "is_tied": is_tied,
+            "debug_mode": self._debug_mode,
+
+            # Our team info
+            "our_team_id": our_team.get("team_id"),
+            "our_team_name": our_team.get("name"),
+            "our_manager": our_team.get("manager"),
+            "our_score": round(our_score, 2),
+            "our_projected_score": our_team.get("projected_score"),
+            "our_team_logo": our_team.get("logo"),
+            "our_win_probability": our_team.get("win_probability"),
+            "our_roster": our_roster,
+            "changed_players": self._changed_players,
+        }
+
+        # DEBUG: Add comprehensive debug information if debug mode is enabled
+        if self._debug_mode:
+            # Add debug cache reference
+            debug_cache_key = f"{self._league_id}_{self._team_id}"
+            attributes["debug_cache_key"] = debug_cache_key
+
+            # Raw responses are on disk, downloadable from /api/yahoo_fantasy/debug_captures
+            debug_captures = get_debug_capture_store().summary(self._league_id, self._team_id)
+            attributes["debug_captures"] = debug_captures
+
+            # Key listings, stat ID translations and pattern searches are left to the
+            # debug_analysis service; only keep references to what it can analyze
+            self._debug_stat_categories = stat_categories
+            self._debug_responses = {
+                name: part["debug_raw_data"]
+                for name, part in (("our_team", our_team), ("opponent_team", opponent_team or {}), ("matchup", matchup_data))
+                if part.get("debug_raw_data") is not None
+            }
+            self._debug_responses.update(player_responses)
+            attributes["debug_analysis"] = {
+                "service": f"{DOMAIN}.debug_analysis",
+                "sources": [
+                    *(name for name in self._debug_responses if ":" not in name),
+                    "player:<player_id>", "player_stats:<player_id>", "<debug capture name>",
+                ],
+                "analyses": list(DEBUG_ANALYSES),
+            }
+
+            # Log debug information
+            _LOGGER.info(f"DEBUG MODE: Found {len(stat_categories)} stat categories")
+            _LOGGER.info(f"DEBUG MODE: Found {len(stat_modifiers)} scoring modifiers")
+            _LOGGER.info(f"DEBUG MODE: {debug_captures['count']} API response captures on disk")
+
+        # Add opponent info if available
+        if opponent_team:
+            opponent_score = opponent_calculated_score if opponent_calculated_score > 0 else opponent_team.get("score")
+            if opponent_score is None:
+                opponent_score = 0.0
+
+            attributes.update({
+                "opponent_team_id": opponent_team.get("team_id"),
+                "opponent_team_name": opponent_team.get("name"),
+                "opponent_manager": opponent_team.get("manager"),
+                "opponent_score": round(opponent_score, 2),
+                "opponent_projected_score": opponent_team.get("projected_score"),
+                "opponent_team_logo": opponent_team.get("logo"),
+                "opponent_win_probability": opponent_team.get("win_probability"),
+                "opponent_roster": opponent_roster,
+            })
+
+            # Calculate score differential
+            attributes["score_differential"] = round(our_score - opponent_score, 2)
+
+        # Determine winner info
+        if winner_team_key:
+            our_team_key = f"{self._game_key}.l.{self._league_id}.t.{self._team_id}"
+            if winner_team_key == our_team_key:
+                attributes["winner"] = "us"
+            elif opponent_team and winner_team_key == f"{self._game_key}.l.{self._league_id}.t.{opponent_team.get('team_id')}":
+                attributes["winner"] = "opponent"
+            else:
+                attributes["winner"] = "unknown"
+        elif is_tied:
+            attributes["winner"] = "tie"
+        else:
+            attributes["winner"] = "tbd"
+
+        # Add some summary stats for easy access
+        our_starters = [p for p in our_roster if p.get("is_starting")]
+        our_bench = [p for p in our_roster if not p.get("is_starting")]
+
+        attributes.update({
+            "our_starters_count": len(our_starters),
+            "our_bench_count": len(our_bench),
+            "our_starters_points": round(sum(p.get("points_total", 0) for p in our_starters), 2),
+            "our_bench_points": round(sum(p.get("points_total", 0) for p in our_bench), 2),
+        })
+
+        if opponent_roster:
+            opp_starters = [p for p in opponent_roster if p.get("is_starting")]
+            opp_bench = [p for p in opponent_roster if not p.get("is_starting")]
+
+            attributes.update({
+                "opponent_starters_count": len(opp_starters),
+                "opponent_bench_count": len(opp_bench),
+                "opponent_starters_points": round(sum(p.get("points_total", 0) for p in opp_starters), 2),
+                "opponent_bench_points": round(sum(p.get("points_total", 0) for p in opp_bench), 2),
+            })
+
+        # Add league settings info to attributes for reference (simplified)
+        if league_settings and league_settings.get("league_info"):
+            attributes["league_info"] = league_settings.get("league_info", {})
+
+        # ADD TOUCHDOWN TRACKING ATTRIBUTES
+        self._add_touchdown_attributes(attributes, our_roster, opponent_roster, stat_categories)
+
+        # Set entity picture to our team logo
+        if our_team.get("logo"):
+            attributes["entity_picture"] = our_team.get("logo")
+
+        # Schedule the next refresh based on how live the matchup is
+        attributes["update_interval"], attributes["update_interval_reason"] = self._choose_update_interval(
+            status, our_roster, opponent_roster
+        )
+        attributes["token_refresh"] = token_refresh_diagnostics()
+        attributes["api_health"] = api_health_diagnostics(self._api_base)
+
+        # Clean logging - just the essential info
+        opponent_name = opponent_team.get("name", "Unknown") if opponent_team else "Unknown"
+        opponent_score_display = round(opponent_score, 2) if opponent_team else "Unknown"
+
+        log_message = f"Updated matchup: {our_team.get('name')} ({our_score}) vs {opponent_name} ({opponent_score_display})"
+        if self._debug_mode:
+            log_message += f" [DEBUG MODE ACTIVE - See attributes for detailed analysis]"
+
+        # Add touchdown info to log if any TDs were scored
+        our_tds = attributes.get("our_total_touchdowns", 0)
+        opp_tds = attributes.get("opponent_total_touchdowns", 0)
+        if our_tds > 0 or opp_tds > 0:
+            log_message += f" | TDs: Us {our_tds}, Them {opp_tds}"
+            if attributes.get("our_last_td_scorer"):
+                log_message += f" | Last TD: {attributes['our_last_td_scorer']}"
+
+        _LOGGER.info(log_message)
+        return round(our_score, 2), attributes
+
     def _get_scoreboard_data(self, week):
         """Get scoreboard data for the specified week."""
         try:
-            scoreboard_url = f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self._game_key}.l.{self._league_id}/scoreboard;week={week}?format=json"
+            scoreboard_url = f"{self._api_base}/league/{self._game_key}.l.{self._league_id}/scoreboard;week={week}?format=json"
             scoreboard_data = self._make_api_request(scoreboard_url)
             
             # Save debug data
@@ -1404,20 +3757,29 @@ class YahooFantasyMatchupSensor(Entity):
             _LOGGER.error(f"Error fetching scoreboard data for week {week}: {e}")
             return None
 
+    async def _async_get_scoreboard_data(self, week):
+        """Async counterpart of _get_scoreboard_data."""
+        try:
+            scoreboard_url = f"{self._api_base}/league/{self._game_key}.l.{self._league_id}/scoreboard;week={week}?format=json"
+            scoreboard_data = await self._async_make_api_request(scoreboard_url)
+
+            # Save debug data
+            self._save_debug_data("scoreboard_data", scoreboard_data, week)
+
+            return scoreboard_data
+        except Exception as e:
+            _LOGGER.error(f"Error fetching scoreboard data for week {week}: {e}")
+            return None
+
     def _get_team_roster(self, team_id, week):
         """Get roster data for a specific team and week."""
         try:
-            # Try multiple roster API endpoints to find one with lineup data
-            urls_to_try = [
-                f"https://fantasysports.yahooapis.com/fantasy/v2/team/{self._game_key}.l.{self._league_id}.t.{team_id}/roster;week={week}?format=json",
-                f"https://fantasysports.yahooapis.com/fantasy/v2/team/{self._game_key}.l.{self._league_id}.t.{team_id}/roster;week={week}/players?format=json",
-                f"https://fantasysports.yahooapis.com/fantasy/v2/team/{self._game_key}.l.{self._league_id}.t.{team_id}/roster/players?format=json"
-            ]
-            
-            for url in urls_to_try:
+            for variant, url, max_retries in self._roster_requests(team_id, week):
                 try:
-                    roster_data = self._make_api_request(url)
+                    roster_data = self._make_api_request(url, max_retries=max_retries)
                     if roster_data:
+                        if self._remember_roster_variant(variant):
+                            save_persistent_cache()
                         # Save debug data with team ID info
                         self._save_debug_data(f"roster_team_{team_id}", roster_data, week)
                         return roster_data
@@ -1430,6 +3792,54 @@ class YahooFantasyMatchupSensor(Entity):
             _LOGGER.error(f"Error in _get_team_roster for team {team_id}, week {week}: {e}")
             return None
 
+    async def _async_get_team_roster(self, team_id, week):
+        """Async counterpart of _get_team_roster."""
+        try:
+            # Fallback variants depend on each other, so they stay sequential
+            for variant, url, max_retries in self._roster_requests(team_id, week):
+                try:
+                    roster_data = await self._async_make_api_request(url, max_retries=max_retries)
+                    if roster_data:
+                        if self._remember_roster_variant(variant):
+                            await self.hass.async_add_executor_job(save_persistent_cache)
+                        # Save debug data with team ID info
+                        self._save_debug_data(f"roster_team_{team_id}", roster_data, week)
+                        return roster_data
+                except Exception:
+                    continue
+
+            return None
+
+        except Exception as e:
+            _LOGGER.error(f"Error in _get_team_roster for team {team_id}, week {week}: {e}")
+            return None
+
+    def _roster_requests(self, team_id, week):
+        """Roster API endpoint variants to try, in order, as (variant, url, max_retries).
+
+        The variant that last returned a roster for this league goes first and
+        gets the usual retries; the others are tried once each, with no backoff.
+        """
+        team_key = f"{self._game_key}.l.{self._league_id}.t.{team_id}"
+        variants = [
+            ("week", f"{self._api_base}/team/{team_key}/roster;week={week}?format=json"),
+            ("week_players", f"{self._api_base}/team/{team_key}/roster;week={week}/players?format=json"),
+            ("players", f"{self._api_base}/team/{team_key}/roster/players?format=json"),
+        ]
+        learned = _get_cache_entry("roster_endpoints", f"{self._game_key}.l.{self._league_id}")
+        variants.sort(key=lambda item: item[0] != learned)
+        return [(variant, url, 3 if variant == learned else 1) for variant, url in variants]
+
+    def _remember_roster_variant(self, variant):
+        """Record the roster endpoint variant that worked for this league. Returns True if it changed."""
+        league_key = f"{self._game_key}.l.{self._league_id}"
+        if _get_cache_entry("roster_endpoints", league_key) == variant:
+            return False
+        _ROSTER_ENDPOINT_CACHE[league_key] = variant
+        _remember_cache_entry("roster_endpoints", league_key)
+        _LOGGER.info(f"Using roster endpoint variant '{variant}' for league {league_key}")
+        return True
+
     def _get_team_data_debug(self, team_id, week=None):
         """Get comprehensive team data for debugging purposes."""
         if not self._debug_mode:
@@ -1438,22 +3848,22 @@ class YahooFantasyMatchupSensor(Entity):
         try:
             # Try multiple team endpoints to get comprehensive data
             team_urls = [
-                f"https://fantasysports.yahooapis.com/fantasy/v2/team/{self._game_key}.l.{self._league_id}.t.{team_id}?format=json",
-                f"https://fantasysports.yahooapis.com/fantasy/v2/team/{self._game_key}.l.{self._league_id}.t.{team_id}/metadata?format=json",
-                f"https://fantasysports.yahooapis.com/fantasy/v2/team/{self._game_key}.l.{self._league_id}.t.{team_id}/stats?format=json",
+                f"{self._api_base}/team/{self._game_key}.l.{self._league_id}.t.{team_id}?format=json",
+                f"{self._api_base}/team/{self._game_key}.l.{self._league_id}.t.{team_id}/metadata?format=json",
+                f"{self._api_base}/team/{self._game_key}.l.{self._league_id}.t.{team_id}/stats?format=json",
             ]
             
             if week:
                 team_urls.extend([
-                    f"https://fantasysports.yahooapis.com/fantasy/v2/team/{self._game_key}.l.{self._league_id}.t.{team_id}/stats;type=week;week={week}?format=json",
-                    f"https://fantasysports.yahooapis.com/fantasy/v2/team/{self._game_key}.l.{self._league_id}.t.{team_id}/matchups;weeks={week}?format=json",
+                    f"{self._api_base}/team/{self._game_key}.l.{self._league_id}.t.{team_id}/stats;type=week;week={week}?format=json",
+                    f"{self._api_base}/team/{self._game_key}.l.{self._league_id}.t.{team_id}/matchups;weeks={week}?format=json",
                 ])
             
             debug_data = {}
             
             for i, url in enumerate(team_urls):
                 try:
-                    data = self._make_api_request(url)
+                    data = self._make_api_request(url, priority=PRIORITY_DEBUG)
                     if data:
                         endpoint_name = f"team_endpoint_{i}_{url.split('/')[-1].split('?')[0]}"
                         debug_data[endpoint_name] = data
@@ -1471,48 +3881,148 @@ class YahooFantasyMatchupSensor(Entity):
             return {}
 
     def _get_player_stats(self, player_ids, week):
-        """Get player stats for multiple players in a single API call."""
+        """Get player stats for multiple players, batched as few requests as Yahoo allows.
+
+        With parallel_stats the batches are fetched concurrently; pacing is
+        left to the shared rate limiter either way.
+        """
         if not player_ids:
             return {}
         
         try:
-            # Build the players query string for batch request
-            # Yahoo API allows requesting multiple players in one call
-            player_keys = [f"{self._game_key}.p.{pid}" for pid in player_ids]
-            
-            # Batch request for up to 25 players at a time (Yahoo API limit)
+            batches = self._player_stats_batches(player_ids)
+
+            def fetch(batch):
+                return self._fetch_player_stats_batch(batch[0], batch[1], week)
+
+            if self._parallel_stats and len(batches) > 1:
+                results = list(get_stats_executor().map(fetch, batches))
+            else:
+                results = [fetch(batch) for batch in batches]
+
+            # Merge in batch order so the result doesn't depend on completion order
             all_stats = {}
-            batch_size = 25
+            for batch_stats in results:
+                all_stats.update(batch_stats)
+            return all_stats
             
-            for i in range(0, len(player_keys), batch_size):
-                batch = player_keys[i:i + batch_size]
-                players_query = ",".join(batch)
-                
-                # Request player stats for the specific week
-                stats_url = f"https://fantasysports.yahooapis.com/fantasy/v2/players;player_keys={players_query}/stats;type=week;week={week}?format=json"
-                
+        except Exception as e:
+            _LOGGER.error(f"Error in _get_player_stats: {e}")
+            return {}
+
+    def _fetch_player_stats_batch(self, i, batch, week):
+        """Fetch and parse one stats batch, retrying it once on its own if it fails."""
+        for attempt in range(2):
+            timing = {}
+            try:
+                stats_data = self._make_api_request(self._player_stats_url(batch, week), timing=timing)
+            except Exception as e:
+                _STATS_BATCH_SIZER.record(len(batch), 0, failed=True)
+                if attempt == 0:
+                    _LOGGER.debug(f"Stats batch starting at index {i} failed, retrying it: {e}")
+                    continue
+                return self._log_missing_player_stats(i, batch, e)
+            # Only size batches on real exchanges, not cache hits or stale fallbacks
+            if "transport" in timing:
+                _STATS_BATCH_SIZER.record(len(batch), timing["transport"])
+            return self._parse_player_stats_batch(i, batch, stats_data, week)
+
+    async def _async_get_player_stats(self, player_ids, week):
+        """Async counterpart of _get_player_stats.
+
+        With parallel_stats, up to _STATS_FETCH_WORKERS batches are in flight
+        at once, like the sync path's thread pool; otherwise batches are
+        fetched one after another.
+        """
+        if not player_ids:
+            return {}
+
+        semaphore = asyncio.Semaphore(_STATS_FETCH_WORKERS if self._parallel_stats else 1)
+
+        async def fetch_batch(i, batch):
+            for attempt in range(2):
+                timing = {}
                 try:
-                    stats_data = self._make_api_request(stats_url)
-                    if stats_data:
-                        # Save debug data for player stats
-                        self._save_debug_data(f"player_stats_batch_{i}", stats_data, week)
-                        
-                        batch_stats = self._extract_player_stats(stats_data)
-                        all_stats.update(batch_stats)
+                    async with semaphore:
+                        stats_data = await self._async_make_api_request(self._player_stats_url(batch, week), timing=timing)
                 except Exception as e:
-                    _LOGGER.warning(f"Failed to fetch stats for batch starting at index {i}: {e}")
-                    continue
-                
-                # Small delay between batch requests to be respectful
-                if i + batch_size < len(player_keys):
-                    time.sleep(0.5)
-            
+                    _STATS_BATCH_SIZER.record(len(batch), 0, failed=True)
+                    if attempt == 0:
+                        _LOGGER.debug(f"Stats batch starting at index {i} failed, retrying it: {e}")
+                        continue
+                    return self._log_missing_player_stats(i, batch, e)
+                # Only size batches on real exchanges, not cache hits or stale fallbacks
+                if "transport" in timing:
+                    _STATS_BATCH_SIZER.record(len(batch), timing["transport"])
+                return await self.hass.async_add_executor_job(
+                    self._parse_player_stats_batch, i, batch, stats_data, week
+                )
+
+        try:
+            results = await asyncio.gather(
+                *(fetch_batch(i, batch) for i, batch in self._player_stats_batches(player_ids))
+            )
+
+            # Merge in batch order so the result matches the sync path
+            all_stats = {}
+            for batch_stats in results:
+                all_stats.update(batch_stats)
             return all_stats
-            
+
         except Exception as e:
             _LOGGER.error(f"Error in _get_player_stats: {e}")
             return {}
 
+    def _parse_player_stats_batch(self, i, batch, stats_data, week):
+        """Extract a fetched batch's stats, noting players Yahoo left out."""
+        if not stats_data:
+            return {}
+        # Save debug data for player stats
+        self._save_debug_data(f"player_stats_batch_{i}", stats_data, week)
+
+        batch_stats = self._extract_player_stats(stats_data)
+        if len(batch_stats) < len(batch):
+            missing = [key.rsplit(".", 1)[-1] for key in batch if key.rsplit(".", 1)[-1] not in batch_stats]
+            _LOGGER.debug(f"Stats batch starting at index {i} had no stats for players {', '.join(missing)}")
+        return batch_stats
+
+    def _log_missing_player_stats(self, i, batch, error):
+        """Report a batch that failed twice; its players score zero this update."""
+        player_ids = [key.rsplit(".", 1)[-1] for key in batch]
+        _LOGGER.warning(
+            f"Failed to fetch stats for batch starting at index {i}, "
+            f"missing stats for players {', '.join(player_ids)}: {error}"
+        )
+        return {}
+
+    def _player_stats_batches(self, player_ids, batch_size=None):
+        """Split player IDs into (start index, player keys) batches for stats requests.
+
+        Batches hold up to the adaptive batch size, and fewer when more keys
+        would push the request URL past _STATS_MAX_URL_LENGTH.
+        """
+        batch_size = batch_size or _STATS_BATCH_SIZER.size
+        url_budget = _STATS_MAX_URL_LENGTH - len(self._player_stats_url([], "00"))
+        batches = []
+        batch = []
+        batch_start = 0
+        batch_length = 0
+        for index, pid in enumerate(player_ids):
+            key = f"{self._game_key}.p.{pid}"
+            if batch and (len(batch) >= batch_size or batch_length + len(key) + 1 > url_budget):
+                batches.append((batch_start, batch))
+                batch, batch_start, batch_length = [], index, 0
+            batch.append(key)
+            batch_length += len(key) + 1
+        if batch:
+            batches.append((batch_start, batch))
+        return batches
+
+    def _player_stats_url(self, player_keys, week):
+        """Build the weekly stats URL for a batch of player keys."""
+        players_query = ",".join(player_keys)
+        return f"{self._api_base}/players;player_keys={players_query}/stats;type=week;week={week}?format=json"
+
     def _extract_player_stats(self, stats_data):
         """Extract player statistics from the API response."""
         player_stats = {}
@@ -1543,13 +4053,15 @@ class YahooFantasyMatchupSensor(Entity):
                 if not player_info:
                     continue
 
+                fields = read_record(player_info, _PLAYER_STATS_RECORD_FIELDS)
+
                 # Extract player ID
-                player_id = find_key(player_info, "player_id")
+                player_id = fields.get("player_id")
                 if not player_id:
                     continue
 
                 # Extract stats
-                stats = find_key(player_info, "player_stats")
+                stats = fields.get("player_stats")
                 if not stats:
                     continue
 
@@ -1607,8 +4119,11 @@ class YahooFantasyMatchupSensor(Entity):
         
         return player_stats
 
-    def _convert_stats_with_names(self, stats_by_id, stat_categories, stat_modifiers=None):
-        """Convert stat IDs to human-readable names with values and fantasy points."""
+    def _convert_stats_with_names(self, stats_by_id, stat_categories, stat_modifiers=None, stat_points=None):
+        """Convert stat IDs to human-readable names with values and fantasy points.
+
+        stat_points, from score_player_stats, saves recomputing each stat's points.
+        """
         named_stats = {}
         
         try:
@@ -1635,7 +4150,9 @@ class YahooFantasyMatchupSensor(Entity):
                 
                 # Calculate fantasy points for this individual stat if modifiers are available
                 fantasy_points = 0.0
-                if stat_modifiers and stat_id in stat_modifiers:
+                if stat_points is not None:
+                    fantasy_points = stat_points.get(stat_id, 0.0)
+                elif stat_modifiers and stat_id in stat_modifiers:
                     try:
                         stat_val = float(value)
                         modifier = float(stat_modifiers[stat_id])
@@ -1664,19 +4181,130 @@ class YahooFantasyMatchupSensor(Entity):
         
         return named_stats
 
+    def _apply_roster_stats(self, scored_players, stat_categories, stat_modifiers):
+        """Set points and named stats on (player, stats_info) pairs, rescoring only changed players.
+
+        Scored stats are kept per player_id; points and display strings are
+        only recomputed when the player's stats, the league's scoring or the
+        stat categories differ from last time. The changed players are scored
+        together by score_player_stats and noted in self._changed_players.
+        """
+        changed = []
+        for player, stats_info in scored_players:
+            previous = self._player_stat_state.get(str(player["player_id"]))
+            if (previous is not None and previous["stats_by_id"] == (stats_info.get("stats_by_id") or {})
+                    and previous["stat_modifiers"] is stat_modifiers and previous["stat_categories"] is stat_categories
+                    and previous["yahoo_points"] == stats_info.get("points_total", 0.0)):
+                player["points_total"] = previous["points_total"]
+                player["stats"] = previous["stats"]
+            else:
+                changed.append((player, stats_info, previous))
+
+        if not changed:
+            return
+        scores = score_player_stats(
+            {str(player["player_id"]): stats_info for player, stats_info, _ in changed}, stat_modifiers
+        )
+
+        for player, stats_info, previous in changed:
+            try:
+                self._apply_player_stats(player, stats_info, previous, scores.get(str(player["player_id"])),
+                                         stat_categories, stat_modifiers)
+            except Exception as e:
+                _LOGGER.debug(f"Error processing stats for player {player['player_id']}: {e}")
+                player["points_total"] = 0.0
+                player["stats"] = {}
+
+    def _apply_player_stats(self, player, stats_info, previous, score, stat_categories, stat_modifiers):
+        """Score one changed player and remember the result for the next update."""
+        player_id = str(player["player_id"])
+        stats_by_id = stats_info.get("stats_by_id") or {}
+
+        # Calculate points using league scoring if available
+        if score is not None and stats_by_id:
+            points_total = score["points_total"]
+        else:
+            # Fallback to Yahoo's points if we can't calculate
+            points_total = stats_info.get("points_total", 0.0)
+
+        # Convert stats to named format if stat categories are available
+        if stat_categories and stats_by_id:
+            named_stats = self._convert_stats_with_names(
+                stats_by_id, stat_categories, stat_modifiers, score["stat_points"] if score else None
+            )
+        else:
+            # Fallback - only show non-zero stats
+            named_stats = {f"Stat {k}": {"value": v, "fantasy_points": 0.0, "display": str(v)}
+                           for k, v in stats_by_id.items() if k != "0" and v != "0" and v != 0}
+
+        player["points_total"] = points_total
+        player["stats"] = named_stats
+        self._player_stat_state[player_id] = {
+            "stats_by_id": dict(stats_by_id),
+            "yahoo_points": stats_info.get("points_total", 0.0),
+            "stat_modifiers": stat_modifiers,
+            "stat_categories": stat_categories,
+            "points_total": points_total,
+            "stats": named_stats,
+        }
+
+        # A player seen for the first time hasn't changed, there's nothing to compare with
+        if previous is not None:
+            old_stats = previous["stats_by_id"]
+            self._changed_players.append({
+                "player_id": player_id,
+                "name": player["name"],
+                "points_total": points_total,
+                "points_change": round(points_total - previous["points_total"], 2),
+                "changed_stats": sorted(k for k in set(stats_by_id) | set(old_stats)
+                                        if stats_by_id.get(k) != old_stats.get(k)),
+            })
+
     def _extract_roster_data(self, roster_data, player_stats=None, stat_categories=None, stat_modifiers=None):
         """Extract player information from roster data, including stats if provided."""
+        return self._attach_roster_stats(
+            self._parse_roster(roster_data), player_stats or {}, stat_categories or {}, stat_modifiers or {}
+        )
+
+    def _attach_roster_stats(self, roster, player_stats, stat_categories, stat_modifiers, debug_responses=None):
+        """Copy a parsed roster's players and fill in their points and named stats.
+
+        The parsed roster is left untouched, so it can be parsed once and
+        shared, e.g. by the league coordinator. Raw player data never goes on
+        the copies; with debug_responses it is moved there for debug_analysis.
+        """
+        players = []
+        scored_players = []
+        for parsed_player in roster:
+            player = dict(parsed_player)
+            raw_player = player.pop("debug_raw_data", None)
+            players.append(player)
+
+            # Stats are scored below, all changed players together
+            stats_info = player_stats.get(str(player["player_id"]))
+            if stats_info is not None:
+                scored_players.append((player, stats_info))
+
+            # DEBUG: Keep the raw player and stats data for debug_analysis
+            if debug_responses is not None:
+                if raw_player is not None:
+                    debug_responses[f"player:{player['player_id']}"] = raw_player
+                if stats_info is not None:
+                    debug_responses[f"player_stats:{player['player_id']}"] = stats_info
+
+        self._apply_roster_stats(scored_players, stat_categories, stat_modifiers)
+        return players
+
+    def _parse_roster(self, roster_data, debug=None):
+        """Parse a roster response into player dicts, without stats.
+
+        debug adds the raw player data, and defaults to the sensor's debug mode.
+        """
         if not roster_data:
             return []
 
-        if player_stats is None:
-            player_stats = {}
-        
-        if stat_categories is None:
-            stat_categories = {}
-            
-        if stat_modifiers is None:
-            stat_modifiers = {}
+        if debug is None:
+            debug = self._debug_mode
 
         players = []
         try:
@@ -1706,11 +4334,13 @@ class YahooFantasyMatchupSensor(Entity):
                     if not player_info:
                         continue
 
+                    fields = read_record(player_info, _PLAYER_RECORD_FIELDS)
+
                     # Extract basic info with error handling
-                    player_id = find_key(player_info, "player_id")
+                    player_id = fields.get("player_id")
                     
                     # Extract name with better error handling
-                    name_data = find_key(player_info, "name")
+                    name_data = fields.get("name")
                     player_name = "Unknown"
                     if isinstance(name_data, dict):
                         full_name = name_data.get("full")
@@ -1728,23 +4358,24 @@ class YahooFantasyMatchupSensor(Entity):
                     player = {
                         "player_id": player_id,
                         "name": player_name,
-                        "position": find_key(player_info, "display_position") or find_key(player_info, "position"),
+                        "position": fields.get("display_position") or fields.get("position"),
                         "selected_position": None,
-                        "team": find_key(player_info, "editorial_team_abbr") or find_key(player_info, "team_abbr"),
+                        "team": fields.get("editorial_team_abbr") or fields.get("team_abbr"),
                         "is_starting": False,
-                        "image_url": find_key(player_info, "image_url"),
-                        "uniform_number": find_key(player_info, "uniform_number"),
+                        "image_url": fields.get("image_url"),
+                        "uniform_number": fields.get("uniform_number"),
+                        # Yahoo locks a player's lineup slot at their game's kickoff
+                        "is_locked": None if fields.get("is_editable") is None else str(fields.get("is_editable")) == "0",
                         "points_total": 0.0,  # Default to 0
                         "stats": {}  # Simplified stats format
                     }
 
-                    # DEBUG: Add raw player data if in debug mode
-                    if self._debug_mode:
+                    # DEBUG: Keep the raw player data for debug_analysis
+                    if debug:
                         player["debug_raw_data"] = player_info
-                        player["debug_all_keys"] = self._extract_all_keys_from_data(player_info)
 
                     # Look for selected_position - handle the array structure properly
-                    selected_pos_raw = find_key(player_info, "selected_position")
+                    selected_pos_raw = fields.get("selected_position")
                     selected_position = None
 
                     try:
@@ -1770,43 +4401,6 @@ class YahooFantasyMatchupSensor(Entity):
                     else:
                         player["is_starting"] = False
 
-                    # Add player stats if available
-                    if player_id and str(player_id) in player_stats:
-                        try:
-                            stats_info = player_stats[str(player_id)]
-                            
-                            # Calculate points using league scoring if available
-                            if stat_modifiers and stats_info.get("stats_by_id"):
-                                calculated_points = self._calculate_projected_points(stats_info, stat_modifiers)
-                                player["points_total"] = calculated_points  # Use calculated points as primary
-                            else:
-                                # Fallback to Yahoo's points if we can't calculate
-                                player["points_total"] = stats_info.get("points_total", 0.0)
-                            
-                            # Convert stats to named format if stat categories are available
-                            if stat_categories and stats_info.get("stats_by_id"):
-                                player["stats"] = self._convert_stats_with_names(
-                                    stats_info.get("stats_by_id"), 
-                                    stat_categories,
-                                    stat_modifiers
-                                )
-                            else:
-                                # Fallback - only show non-zero stats
-                                stats_by_id = stats_info.get("stats_by_id", {})
-                                non_zero_stats = {k: v for k, v in stats_by_id.items() 
-                                                if k != "0" and v != "0" and v != 0}
-                                player["stats"] = {f"Stat {k}": {"value": v, "fantasy_points": 0.0, "display": str(v)} 
-                                                for k, v in non_zero_stats.items()}
-                                                
-                            # DEBUG: Add raw stats data if in debug mode
-                            if self._debug_mode:
-                                player["debug_raw_stats"] = stats_info
-                                
-                        except Exception as e:
-                            _LOGGER.debug(f"Error processing stats for player {player_id}: {e}")
-                            player["points_total"] = 0.0
-                            player["stats"] = {}
-
                     # Only add if we have basic info
                     if player["player_id"] and player["name"] != "Unknown":
                         players.append(player)
@@ -1816,7 +4410,7 @@ class YahooFantasyMatchupSensor(Entity):
                     continue
 
         except Exception as e:
-            _LOGGER.error(f"Error in _extract_roster_data: {e}")
+            _LOGGER.error(f"Error in _parse_roster: {e}")
             
         return players
 
@@ -1826,10 +4420,11 @@ class YahooFantasyMatchupSensor(Entity):
             return {}
             
         try:
+            fields = read_record(team_data, _TEAM_RECORD_FIELDS)
             team_info = {
-                "team_id": find_key(team_data, "team_id"),
-                "name": find_key(team_data, "name"),
-                "manager": find_key(team_data, "nickname") or find_key(team_data, "manager"),
+                "team_id": fields.get("team_id"),
+                "name": fields.get("name"),
+                "manager": fields.get("nickname") or fields.get("manager"),
                 "score": None,
                 "projected_score": None,
                 "logo": None,
@@ -1840,18 +4435,17 @@ class YahooFantasyMatchupSensor(Entity):
             win_prob = self._extract_win_probability(team_data)
             team_info["win_probability"] = win_prob
             
-            # DEBUG: Add raw team data if in debug mode
+            # DEBUG: Keep the raw team data for debug_analysis
             if self._debug_mode:
                 team_info["debug_raw_data"] = team_data
-                team_info["debug_all_keys"] = self._extract_all_keys_from_data(team_data)
             
             # Extract team logo
-            team_logo = find_key(team_data, "team_logo")
+            team_logo = fields.get("team_logo")
             if isinstance(team_logo, dict):
                 team_info["logo"] = team_logo.get("url")
             
             # Extract current score from team_points
-            team_points = find_key(team_data, "team_points")
+            team_points = fields.get("team_points")
             if team_points and isinstance(team_points, dict):
                 total = team_points.get("total")
                 if total is not None:
@@ -1861,7 +4455,7 @@ class YahooFantasyMatchupSensor(Entity):
                         team_info["score"] = None
             
             # Extract projected score
-            projected_points = find_key(team_data, "team_projected_points")
+            projected_points = fields.get("team_projected_points")
             if projected_points and isinstance(projected_points, dict):
                 total = projected_points.get("total")
                 if total is not None:
@@ -2379,20 +4973,20 @@ class YahooFantasyMatchupSensor(Entity):
                         continue
 
                     # Get basic matchup info
+                    fields = read_record(matchup_info, _MATCHUP_RECORD_FIELDS)
                     matchup_data = {
-                        "week": find_key(matchup_info, "week"),
-                        "status": find_key(matchup_info, "status"),
-                        "is_tied": find_key(matchup_info, "is_tied"),
-                        "winner_team_key": find_key(matchup_info, "winner_team_key"),
+                        "week": fields.get("week"),
+                        "status": fields.get("status"),
+                        "is_tied": fields.get("is_tied"),
+                        "winner_team_key": fields.get("winner_team_key"),
                         "team_win_probabilities": {}  # New: store win probabilities by team_id
                     }
 
-                    # DEBUG: Add raw matchup data if in debug mode
+                    # DEBUG: Keep the raw matchup data for debug_analysis
                     if self._debug_mode:
                         matchup_data["debug_raw_data"] = matchup_info
-                        matchup_data["debug_all_keys"] = self._extract_all_keys_from_data(matchup_info)
 
-                    teams_data = find_key(matchup_info, "teams")
+                    teams_data = fields.get("teams")
                     if not teams_data:
                         continue
 
@@ -1,21 +1,192 @@
+// Column classes of a lineup or bench row, left to right
+const LINEUP_CELLS = [
+  'player-image-cell', 'player-info-cell our-side', 'player-points-cell', 'position-cell',
+  'player-points-cell', 'player-info-cell opp-side', 'player-image-cell',
+];
+
+// Headshots go through the integration's resizing, caching proxy
+const IMAGE_PROXY_URL = '/api/yahoo_fantasy/image';
+const HEADSHOT_SIZE = 64;
+// Proxy URL -> promise of an object URL, shared by every card on the page.
+// Least recently used first; evicted object URLs are revoked to free their blobs.
+const HEADSHOT_CACHE = new Map();
+const HEADSHOT_CACHE_SIZE = 150;
+let connectedCards = 0;
+
+function revokeHeadshot(promise) {
+  promise.then(objectUrl => URL.revokeObjectURL(objectUrl), () => {});
+}
+
+function clearHeadshotCache() {
+  HEADSHOT_CACHE.forEach(revokeHeadshot);
+  HEADSHOT_CACHE.clear();
+}
+
 class YahooFantasyMatchupCard extends HTMLElement {
   constructor() {
     super();
     this.attachShadow({ mode: 'open' });
+    this._fullAttributes = {};
+    this._fullAttributesFor = null;
+    this._matchupUnsub = null;
+    this._matchupStreamFailed = false;
+    this._entityState = null;
+    this._sections = null;
+    this._players = {};
+    this._imageObserver = null;
+    this._benchExpanded = true;
   }
 
   setConfig(config) {
     if (!config.entity) {
       throw new Error('You need to define an entity');
     }
+    if (this.config && this.config.entity !== config.entity) {
+      this.unsubscribeMatchup();
+    }
     this.config = config;
+    // show_bench: collapsed shows only the bench title until it's clicked
+    this._benchExpanded = config.show_bench !== 'collapsed';
+    // Options such as show_bench change the layout; build it again on the next render
+    this._entityState = null;
+    this._sections = null;
+    if (this._hass) this.renderIfChanged();
   }
 
   set hass(hass) {
     this._hass = hass;
+    if (this.isCompact()) {
+      this.subscribeMatchup();
+    } else if (this._matchupUnsub) {
+      // Back to full attribute mode: everything is on the entity again
+      this.unsubscribeMatchup();
+    }
+    this.renderIfChanged();
+  }
+
+  // In compact attribute mode rosters and stats are left off the entity
+  isCompact() {
+    const entity = this.config && this._hass && this._hass.states[this.config.entity];
+    return Boolean(entity && entity.attributes.attribute_mode === 'compact');
+  }
+
+  connectedCallback() {
+    connectedCards += 1;
+    if (this._hass) this.subscribeMatchup();
+  }
+
+  // In compact mode rosters and stats come over yahoo_fantasy/matchup/subscribe:
+  // one snapshot, then only the players and values each update changed
+  subscribeMatchup() {
+    if (this._matchupUnsub || this._matchupStreamFailed || !this.isConnected) return;
+    if (!this.config || !this.config.entity || !this._hass.connection || !this.isCompact()) return;
+    this._matchupUnsub = this._hass.connection.subscribeMessage(
+      message => this.onMatchupMessage(message),
+      { type: 'yahoo_fantasy/matchup/subscribe', entity_id: this.config.entity }
+    ).catch(err => {
+      // Older integration or sensor not set up yet; compact mode falls back to fetching per update
+      console.warn('yahoo-fantasy-matchup-card: could not subscribe to matchup updates', err);
+      this._matchupUnsub = null;
+      this._matchupStreamFailed = true;
+      this.render();
+    });
+  }
+
+  unsubscribeMatchup() {
+    if (this._matchupUnsub) {
+      this._matchupUnsub.then(unsub => unsub && unsub());
+      this._matchupUnsub = null;
+    }
+    this._matchupStreamFailed = false;
+    this._fullAttributes = {};
+    this._fullAttributesFor = null;
+  }
+
+  onMatchupMessage(message) {
+    if (message.type === 'snapshot') {
+      this._fullAttributes = message.attributes || {};
+    } else if (message.type === 'delta') {
+      const attributes = { ...this._fullAttributes, ...message.attributes };
+      (message.removed || []).forEach(key => delete attributes[key]);
+      for (const [name, changes] of Object.entries(message.rosters || {})) {
+        attributes[name] = this.applyRosterDelta(attributes[name] || [], changes);
+      }
+      this._fullAttributes = attributes;
+      if (this._sections && this.patchChangedPlayers(message.rosters || {})) {
+        if (Object.keys(message.attributes || {}).length || (message.removed || []).length) {
+          this.renderSummary(this.mergedAttributes());
+        }
+        return;
+      }
+    }
     this.render();
   }
 
+  // Rewrite only the cells of players whose stats changed. Returns false when
+  // players were added, removed, reordered or moved between slots; the tables
+  // then have to be laid out again.
+  patchChangedPlayers(rosters) {
+    const benchShown = Boolean(this.config.show_bench) && this._benchExpanded;
+    const updates = [];
+    for (const [name, changes] of Object.entries(rosters)) {
+      const isOur = name === 'our_roster';
+      if (!isOur && name !== 'opponent_roster') return false;
+      if ((changes.removed || []).length || changes.order) return false;
+      for (const player of changes.changed || []) {
+        const key = this.playerKey(player, isOur);
+        const previous = this._players[key];
+        if (!previous) {
+          // A bench player while the bench is collapsed isn't drawn at all
+          if (player.is_starting || benchShown) return false;
+          continue;
+        }
+        if (previous.is_starting !== player.is_starting || previous.selected_position !== player.selected_position) {
+          return false;
+        }
+        updates.push([player, this._playerRows[key]]);
+      }
+    }
+    updates.forEach(([player, { row, isOur, isBench }]) => {
+      const cells = this.renderPlayer(player, isOur, isBench);
+      const [image, info, points] = isOur ? [0, 1, 2] : [6, 5, 4];
+      this.patchHtml(row.children[image], cells.image);
+      this.patchHtml(row.children[info], cells.info);
+      this.patchHtml(row.children[points], cells.points);
+    });
+    return true;
+  }
+
+  // Same player keys as roster_delta in the integration
+  applyRosterDelta(roster, changes) {
+    const playerKey = player => String(player.player_id || player.name);
+    const players = new Map(roster.map(player => [playerKey(player), player]));
+    (changes.removed || []).forEach(key => players.delete(key));
+    (changes.changed || []).forEach(player => players.set(playerKey(player), player));
+    const order = changes.order || roster.map(playerKey).filter(key => players.has(key));
+    return order.map(key => players.get(key)).filter(Boolean);
+  }
+
+  renderIfChanged() {
+    if (!this.config || !this.config.entity) return;
+    if (this.entityChanged(this._hass.states[this.config.entity])) {
+      this.render();
+    }
+  }
+
+  // In compact attribute mode rosters and stats aren't on the entity; without the
+  // subscription, ask the integration for them after each update
+  async fetchFullAttributes(entity) {
+    this._fullAttributesFor = entity.last_updated;
+    try {
+      const result = await this._hass.callWS({ type: 'yahoo_fantasy/matchup', entity_id: this.config.entity });
+      if (this._fullAttributesFor !== entity.last_updated) return;
+      this._fullAttributes = result.attributes || {};
+      this.render();
+    } catch (err) {
+      console.warn('yahoo-fantasy-matchup-card: could not fetch matchup details', err);
+    }
+  }
+
   getPositionOrder(position) {
     const order = {
       'QB': 1, 'RB': 2, 'RB1': 2, 'RB2': 2,
@@ -431,6 +602,85 @@ class YahooFantasyMatchupCard extends HTMLElement {
   
   disconnectedCallback() {
     this.closePlayerPopup();
+    this.unsubscribeMatchup();
+    if (this._imageObserver) {
+      this._imageObserver.disconnect();
+      this._imageObserver = null;
+    }
+    connectedCards = Math.max(0, connectedCards - 1);
+    if (connectedCards === 0) {
+      clearHeadshotCache();
+      // Our <img> elements point at the revoked URLs; draw them again if we come back
+      this._entityState = null;
+      this._sections = null;
+    }
+  }
+
+  headshotUrl(imageUrl) {
+    if (this.config.image_proxy === false) return imageUrl;
+    return `${IMAGE_PROXY_URL}?url=${encodeURIComponent(imageUrl)}&size=${HEADSHOT_SIZE}`;
+  }
+
+  // Headshots are rendered with data-src and only fetched once they scroll into view
+  observeImages(root) {
+    const images = root.querySelectorAll ? root.querySelectorAll('img[data-src]') : [];
+    if (images.length === 0) return;
+    if (typeof IntersectionObserver === 'undefined') {
+      images.forEach(img => this.loadImage(img));
+      return;
+    }
+    if (!this._imageObserver) {
+      this._imageObserver = new IntersectionObserver((entries, observer) => {
+        entries.forEach(entry => {
+          if (entry.isIntersecting) {
+            observer.unobserve(entry.target);
+            this.loadImage(entry.target);
+          }
+        });
+      }, { rootMargin: '200px' });
+    }
+    images.forEach(img => this._imageObserver.observe(img));
+  }
+
+  loadImage(img) {
+    const src = img.dataset.src;
+    img.removeAttribute('data-src');
+    if (!src.startsWith(IMAGE_PROXY_URL)) {
+      img.src = src;
+      return;
+    }
+    // The proxy needs Home Assistant auth, which a plain <img src> can't send
+    let headshot = HEADSHOT_CACHE.get(src);
+    if (headshot) {
+      HEADSHOT_CACHE.delete(src);
+    } else {
+      headshot = this._hass.fetchWithAuth(src)
+        .then(response => {
+          if (!response.ok) throw new Error(`HTTP ${response.status}`);
+          return response.blob();
+        })
+        .then(blob => URL.createObjectURL(blob))
+        .catch(err => {
+          if (HEADSHOT_CACHE.get(src) === headshot) HEADSHOT_CACHE.delete(src);
+          throw err;
+        });
+    }
+    HEADSHOT_CACHE.set(src, headshot);
+    while (HEADSHOT_CACHE.size > HEADSHOT_CACHE_SIZE) {
+      const [oldest, promise] = HEADSHOT_CACHE.entries().next().value;
+      HEADSHOT_CACHE.delete(oldest);
+      revokeHeadshot(promise);
+    }
+    headshot
+      .then(objectUrl => { img.src = objectUrl; })
+      .catch(() => { img.src = img.dataset.fallback; });
+  }
+
+  toggleBench() {
+    this._benchExpanded = !this._benchExpanded;
+    // The bench title changes with it; build the section again
+    this.patchTable(this._sections.bench, '', '', [], false);
+    this.render();
   }
   
   renderPlayerStats(stats) {
@@ -460,25 +710,36 @@ class YahooFantasyMatchupCard extends HTMLElement {
     return statsHtml;
   }
 
+  formatPoints(player) {
+    const points = player.points_total || 0;
+    return typeof points === 'number' ? points.toFixed(2) : '0.0';
+  }
+
+  playerKey(player, isOur) {
+    return `${isOur ? 'our' : 'opp'}:${player.player_id || player.name}`;
+  }
+
+  // Cells hold no per-update data beyond what they show; clicks are resolved
+  // through this._players so stats changes don't touch the headshot markup
   renderPlayer(player, isOur = true, isBench = false) {
     const playerImg = player.image_url && !player.image_url.includes('blank_player') 
-      ? `<img src="${player.image_url}" alt="${player.name}" loading="lazy">` 
+      ? `<img data-src="${this.headshotUrl(player.image_url)}" data-fallback="${player.image_url}" alt="${player.name}">` 
       : '<div class="player-placeholder">👤</div>';
     
-    const points = player.points_total || 0;
-    const pointsDisplay = typeof points === 'number' ? points.toFixed(2) : '0.0';
     const formattedName = this.formatPlayerName(player.name);
+    const playerKey = this.playerKey(player, isOur);
+    this._players[playerKey] = player;
     
     const benchClass = isBench ? ' bench-player' : '';
     
     return {
       image: `
-        <div class="player-image" onclick="this.getRootNode().host.showPlayerPopup('${player.player_id || ''}', '${player.name?.replace(/'/g, "\\'")}', '${player.position}', '${player.team}', '${player.uniform_number || ''}', '${pointsDisplay}', '${player.image_url || ''}', ${JSON.stringify(player.stats || {}).replace(/"/g, '&quot;')})">
+        <div class="player-image" data-player="${playerKey}">
           ${playerImg}
         </div>
       `,
       info: `
-        <div class="player-info ${isOur ? 'our-side' : 'opp-side'}${benchClass}" onclick="this.getRootNode().host.showPlayerPopup('${player.player_id || ''}', '${player.name?.replace(/'/g, "\\'")}', '${player.position}', '${player.team}', '${player.uniform_number || ''}', '${pointsDisplay}', '${player.image_url || ''}', ${JSON.stringify(player.stats || {}).replace(/"/g, '&quot;')})">
+        <div class="player-info ${isOur ? 'our-side' : 'opp-side'}${benchClass}" data-player="${playerKey}">
           <div class="player-name">${formattedName}</div>
           <div class="player-details">
             <span class="player-team">${player.team || ''} — ${player.position}</span>
@@ -486,147 +747,108 @@ class YahooFantasyMatchupCard extends HTMLElement {
           </div>
         </div>
       `,
-      points: pointsDisplay
+      points: this.formatPoints(player)
     };
   }
 
-  renderCombinedBenchSection(ourRoster, oppRoster) {
-    const ourBench = ourRoster.filter(player => !player.is_starting);
-    const oppBench = oppRoster.filter(player => !player.is_starting);
+  // One lineup row as the contents of its seven cells, see LINEUP_CELLS
+  renderLineupRow(ourPlayer, oppPlayer, position, isBench = false) {
+    const ourPlayerData = ourPlayer ? this.renderPlayer(ourPlayer, true, isBench) : null;
+    const oppPlayerData = oppPlayer ? this.renderPlayer(oppPlayer, false, isBench) : null;
+    const emptySlot = '<div class="empty-slot">-</div>';
+    return [
+      ourPlayerData ? ourPlayerData.image : emptySlot,
+      ourPlayerData ? ourPlayerData.info : emptySlot,
+      ourPlayerData ? ourPlayerData.points : '-',
+      position,
+      oppPlayerData ? oppPlayerData.points : '-',
+      oppPlayerData ? oppPlayerData.info : emptySlot,
+      oppPlayerData ? oppPlayerData.image : emptySlot,
+    ];
+  }
+
+  renderCombinedBenchSection(ourBench, oppBench) {
     const maxBench = Math.max(ourBench.length, oppBench.length);
     
-    let benchRows = '';
+    const benchRows = [];
     for (let i = 0; i < maxBench; i++) {
-      const ourPlayer = ourBench[i];
-      const oppPlayer = oppBench[i];
-      
-      const ourPlayerData = ourPlayer ? this.renderPlayer(ourPlayer, true, true) : null;
-      const oppPlayerData = oppPlayer ? this.renderPlayer(oppPlayer, false, true) : null;
-      
-      benchRows += `
-        <div class="lineup-row">
-          <div class="player-image-cell">
-            ${ourPlayerData ? ourPlayerData.image : '<div class="empty-slot">-</div>'}
-          </div>
-          <div class="player-info-cell our-side">
-            ${ourPlayerData ? ourPlayerData.info : '<div class="empty-slot">-</div>'}
-          </div>
-          <div class="player-points-cell">
-            ${ourPlayerData ? ourPlayerData.points : '-'}
-          </div>
-          <div class="position-cell">BN</div>
-          <div class="player-points-cell">
-            ${oppPlayerData ? oppPlayerData.points : '-'}
-          </div>
-          <div class="player-info-cell opp-side">
-            ${oppPlayerData ? oppPlayerData.info : '<div class="empty-slot">-</div>'}
-          </div>
-          <div class="player-image-cell">
-            ${oppPlayerData ? oppPlayerData.image : '<div class="empty-slot">-</div>'}
-          </div>
-        </div>
-      `;
+      benchRows.push(this.renderLineupRow(ourBench[i], oppBench[i], 'BN', true));
     }
     
     return benchRows;
   }
 
-  render() {
-    if (!this._hass || !this.config.entity) return;
+  // Remember which row each drawn player is in, so a delta can patch just those cells
+  indexPlayerRows(slot, ourPlayers, oppPlayers, isBench) {
+    ourPlayers.forEach((player, i) => {
+      this._playerRows[this.playerKey(player, true)] = { row: slot._rows[i], isOur: true, isBench };
+    });
+    oppPlayers.forEach((player, i) => {
+      this._playerRows[this.playerKey(player, false)] = { row: slot._rows[i], isOur: false, isBench };
+    });
+  }
 
-    const entity = this._hass.states[this.config.entity];
-    if (!entity) {
-      this.shadowRoot.innerHTML = `
-        <div style="padding: 16px; color: red;">
-          Entity ${this.config.entity} not found
-        </div>
-      `;
+  // Whether the entity differs from the one last rendered; hass is pushed for
+  // every state change in Home Assistant, not just ours
+  entityChanged(entity) {
+    const previous = this._entityState;
+    this._entityState = entity;
+    if (!entity || !previous) return entity !== previous;
+    return entity.last_updated !== previous.last_updated || entity.attributes !== previous.attributes;
+  }
+
+  onCardClick(e) {
+    if (e.target.closest('.bench-toggle')) {
+      this.toggleBench();
       return;
     }
+    const target = e.target.closest('[data-player]');
+    const player = target && this._players[target.dataset.player];
+    if (!player) return;
+    this.showPlayerPopup(
+      player.player_id || '', player.name, player.position, player.team, player.uniform_number || '',
+      this.formatPoints(player), player.image_url || '', player.stats || {}
+    );
+  }
 
-    const attrs = entity.attributes;
-    const ourScore = attrs.our_score || 0;
-    const oppScore = attrs.opponent_score || 0;
-    const ourProjected = attrs.our_projected_score || 0;
-    const oppProjected = attrs.opponent_projected_score || 0;
-    const week = attrs.week || '?';
-    const leagueName = attrs.league_info?.name || 'Fantasy League';
-    const showBench = this.config.show_bench || false;
-
-    // Get win probabilities
-    const ourWinProb = attrs.our_win_probability || 0;
-    const oppWinProb = attrs.opponent_win_probability || 0;
-
-    const ourRoster = attrs.our_roster || [];
-    const oppRoster = attrs.opponent_roster || [];
-    
-    const ourStarters = ourRoster
-      .filter(player => player.is_starting)
-      .sort((a, b) => this.getPositionOrder(a.selected_position) - this.getPositionOrder(b.selected_position));
-    
-    const oppStarters = oppRoster
-      .filter(player => player.is_starting)
-      .sort((a, b) => this.getPositionOrder(a.selected_position) - this.getPositionOrder(b.selected_position));
-
-    const ourLogo = attrs.our_team_logo || '';
-    const oppLogo = attrs.opponent_team_logo || '';
+  patchHtml(element, html) {
+    if (element._html === html) return;
+    element.innerHTML = html;
+    element._html = html;
+    this.observeImages(element);
+  }
 
-    const maxPlayers = Math.max(ourStarters.length, oppStarters.length);
-    let lineupRows = '';
-    
-    for (let i = 0; i < maxPlayers; i++) {
-      const ourPlayer = ourStarters[i];
-      const oppPlayer = oppStarters[i];
-      
-      const position = (ourPlayer && (ourPlayer.selected_position || ourPlayer.position)) || 
-                      (oppPlayer && (oppPlayer.selected_position || oppPlayer.position)) || '';
-      
-      const ourPlayerData = ourPlayer ? this.renderPlayer(ourPlayer, true) : null;
-      const oppPlayerData = oppPlayer ? this.renderPlayer(oppPlayer, false) : null;
-      
-      lineupRows += `
-        <div class="lineup-row">
-          <div class="player-image-cell">
-            ${ourPlayerData ? ourPlayerData.image : '<div class="empty-slot">-</div>'}
-          </div>
-          <div class="player-info-cell our-side">
-            ${ourPlayerData ? ourPlayerData.info : '<div class="empty-slot">-</div>'}
-          </div>
-          <div class="player-points-cell">
-            ${ourPlayerData ? ourPlayerData.points : '-'}
-          </div>
-          <div class="position-cell">
-            ${position}
-          </div>
-          <div class="player-points-cell">
-            ${oppPlayerData ? oppPlayerData.points : '-'}
-          </div>
-          <div class="player-info-cell opp-side">
-            ${oppPlayerData ? oppPlayerData.info : '<div class="empty-slot">-</div>'}
-          </div>
-          <div class="player-image-cell">
-            ${oppPlayerData ? oppPlayerData.image : '<div class="empty-slot">-</div>'}
-          </div>
-        </div>
-      `;
+  // Keep a lineup table's title and header, add or drop rows at the end and
+  // rewrite only the cells whose contents changed
+  patchTable(slot, className, headerHtml, rows, show = rows.length > 0) {
+    if (!show) {
+      this.patchHtml(slot, '');
+      slot._table = null;
+      return;
     }
+    if (!slot._table) {
+      this.patchHtml(slot, `<div class="${className}">${headerHtml}</div>`);
+      slot._table = slot.firstElementChild;
+      slot._rows = [];
+    }
+    while (slot._rows.length > rows.length) {
+      slot._rows.pop().remove();
+    }
+    rows.forEach((cells, i) => {
+      let row = slot._rows[i];
+      if (!row) {
+        row = document.createElement('div');
+        row.className = 'lineup-row';
+        row.innerHTML = LINEUP_CELLS.map(cellClass => `<div class="${cellClass}"></div>`).join('');
+        slot._table.appendChild(row);
+        slot._rows.push(row);
+      }
+      cells.forEach((html, j) => this.patchHtml(row.children[j], html));
+    });
+  }
 
-    const benchSections = showBench ? `
-      <div class="bench-container">
-        <div class="bench-title-main">Bench Players</div>
-        <div class="bench-header">
-          <div></div>
-          <div>Your Bench</div>
-          <div></div>
-          <div>POS</div>
-          <div></div>
-          <div>Opponent Bench</div>
-          <div></div>
-        </div>
-        ${this.renderCombinedBenchSection(ourRoster, oppRoster)}
-      </div>
-    ` : '';
-
+  // Styles and section containers are created once and kept across updates
+  renderSkeleton() {
     this.shadowRoot.innerHTML = `
       <style>
         .card {
@@ -1131,6 +1353,13 @@ class YahooFantasyMatchupCard extends HTMLElement {
           margin-bottom: 16px;
           color: var(--primary-text-color, #333);
         }
+        .bench-toggle {
+          cursor: pointer;
+          margin-bottom: 0;
+        }
+        .bench-toggle.expanded {
+          margin-bottom: 16px;
+        }
         .bench-header {
           display: grid;
           grid-template-columns: 32px 1fr 40px 60px 40px 1fr 32px;
@@ -1216,70 +1445,197 @@ class YahooFantasyMatchupCard extends HTMLElement {
       </style>
       
       <div class="card">
-        <div class="header">
-          <div class="league-name">${leagueName}</div>
-          <div class="week">Week ${week}</div>
+        <div class="header"></div>
+        <div class="matchup-summary"></div>
+        <div class="field-slot"></div>
+        <div class="score-diff-slot"></div>
+        <div class="lineup-slot"></div>
+        <div class="bench-slot"></div>
+      </div>
+    `;
+    const card = this.shadowRoot.querySelector('.card');
+    card.addEventListener('click', (e) => this.onCardClick(e));
+    this._sections = {
+      header: card.querySelector('.header'),
+      summary: card.querySelector('.matchup-summary'),
+      field: card.querySelector('.field-slot'),
+      scoreDiff: card.querySelector('.score-diff-slot'),
+      lineup: card.querySelector('.lineup-slot'),
+      bench: card.querySelector('.bench-slot'),
+    };
+  }
+
+  // Entity attributes over the streamed rosters and stats (compact mode)
+  mergedAttributes() {
+    const entity = this._hass.states[this.config.entity];
+    return { ...this._fullAttributes, ...(entity ? entity.attributes : {}) };
+  }
+
+  render() {
+    if (!this._hass || !this.config.entity) return;
+    // The first render builds the whole card; it shows up as a measure in the browser's performance timeline
+    const cold = !this._sections;
+    if (cold && typeof performance !== 'undefined' && performance.mark) {
+      performance.mark('yahoo-fantasy-card:cold-render-start');
+    }
+
+    const entity = this._hass.states[this.config.entity];
+    if (!entity) {
+      this._sections = null;
+      this.shadowRoot.innerHTML = `
+        <div style="padding: 16px; color: red;">
+          Entity ${this.config.entity} not found
         </div>
-        
-        <div class="matchup-summary">
-          <div class="matchup-row">
-            <div class="team-logo">${ourLogo ? `<img src="${ourLogo}">` : '🏈'}</div>
-            <div></div>
-            <div class="team-logo">${oppLogo ? `<img src="${oppLogo}">` : '🏈'}</div>
-          </div>
+      `;
+      return;
+    }
 
-          <div class="matchup-row">
-            <div class="team-name">${attrs.our_team_name}</div>
-            <div class="vs">VS</div>
-            <div class="team-name">${attrs.opponent_team_name}</div>
-          </div>
+    if (this._matchupStreamFailed && entity.attributes.attribute_mode === 'compact'
+        && this._fullAttributesFor !== entity.last_updated) {
+      this.fetchFullAttributes(entity);
+    }
+    const attrs = this.mergedAttributes();
 
-          <div class="matchup-row">
-            <div class="manager-name">${attrs.our_manager}</div>
-            <div></div>
-            <div class="manager-name">${attrs.opponent_manager}</div>
-          </div>
+    if (!this._sections) {
+      this.renderSkeleton();
+    }
+    this.renderSummary(attrs);
+    this.renderLineups(attrs);
 
-          <div class="matchup-row">
-            <div class="score">${ourScore.toFixed(2)}</div>
-            <div></div>
-            <div class="score">${oppScore.toFixed(2)}</div>
-          </div>
+    if (cold && typeof performance !== 'undefined' && performance.measure) {
+      performance.measure('yahoo-fantasy-card:cold-render', 'yahoo-fantasy-card:cold-render-start');
+    }
+  }
 
-          <div class="matchup-row">
-            <div class="projected">Proj: ${ourProjected.toFixed(2)}</div>
-            <div></div>
-            <div class="projected">Proj: ${oppProjected.toFixed(2)}</div>
-          </div>
-        </div>
+  // Header, team summary, win probability field and score differential
+  renderSummary(attrs) {
+    const sections = this._sections;
+    const ourScore = attrs.our_score || 0;
+    const oppScore = attrs.opponent_score || 0;
+    const ourProjected = attrs.our_projected_score || 0;
+    const oppProjected = attrs.opponent_projected_score || 0;
+    const week = attrs.week || '?';
+    const leagueName = attrs.league_info?.name || 'Fantasy League';
 
-        ${this.renderFootballField(ourWinProb, oppWinProb, attrs.our_team_name, attrs.opponent_team_name)}
+    // Get win probabilities
+    const ourWinProb = attrs.our_win_probability || 0;
+    const oppWinProb = attrs.opponent_win_probability || 0;
 
-        ${attrs.score_differential !== undefined ? `
-          <div class="score-diff ${attrs.score_differential > 0 ? 'positive' : attrs.score_differential < 0 ? 'negative' : 'zero'}">
-            ${attrs.score_differential > 0 ? '+' : ''}${attrs.score_differential.toFixed(2)} points
-          </div>
-        ` : ''}
-        
-        ${ourStarters.length > 0 || oppStarters.length > 0 ? `
-          <div class="lineup-section">
-            <div class="lineup-title">Starting Lineup</div>
-            <div class="lineup-header">
-              <div></div>
-              <div>Your Team</div>
-              <div></div>
-              <div>POS</div>
-              <div></div>
-              <div>Opponent</div>
-              <div></div>
-            </div>
-            ${lineupRows}
-          </div>
-        ` : ''}
-        
-        ${benchSections}
+    const ourLogo = attrs.our_team_logo || '';
+    const oppLogo = attrs.opponent_team_logo || '';
+
+    this.patchHtml(sections.header, `
+      <div class="league-name">${leagueName}</div>
+      <div class="week">Week ${week}</div>
+    `);
+
+    this.patchHtml(sections.summary, `
+      <div class="matchup-row">
+        <div class="team-logo">${ourLogo ? `<img src="${ourLogo}">` : '🏈'}</div>
+        <div></div>
+        <div class="team-logo">${oppLogo ? `<img src="${oppLogo}">` : '🏈'}</div>
       </div>
-    `;
+
+      <div class="matchup-row">
+        <div class="team-name">${attrs.our_team_name}</div>
+        <div class="vs">VS</div>
+        <div class="team-name">${attrs.opponent_team_name}</div>
+      </div>
+
+      <div class="matchup-row">
+        <div class="manager-name">${attrs.our_manager}</div>
+        <div></div>
+        <div class="manager-name">${attrs.opponent_manager}</div>
+      </div>
+
+      <div class="matchup-row">
+        <div class="score">${ourScore.toFixed(2)}</div>
+        <div></div>
+        <div class="score">${oppScore.toFixed(2)}</div>
+      </div>
+
+      <div class="matchup-row">
+        <div class="projected">Proj: ${ourProjected.toFixed(2)}</div>
+        <div></div>
+        <div class="projected">Proj: ${oppProjected.toFixed(2)}</div>
+      </div>
+    `);
+
+    this.patchHtml(sections.field,
+      this.renderFootballField(ourWinProb, oppWinProb, attrs.our_team_name, attrs.opponent_team_name));
+
+    this.patchHtml(sections.scoreDiff, attrs.score_differential !== undefined ? `
+      <div class="score-diff ${attrs.score_differential > 0 ? 'positive' : attrs.score_differential < 0 ? 'negative' : 'zero'}">
+        ${attrs.score_differential > 0 ? '+' : ''}${attrs.score_differential.toFixed(2)} points
+      </div>
+    ` : '');
+  }
+
+  // Starting lineup and bench tables
+  renderLineups(attrs) {
+    const sections = this._sections;
+    const showBench = Boolean(this.config.show_bench);
+    const ourRoster = attrs.our_roster || [];
+    const oppRoster = attrs.opponent_roster || [];
+    
+    const ourStarters = ourRoster
+      .filter(player => player.is_starting)
+      .sort((a, b) => this.getPositionOrder(a.selected_position) - this.getPositionOrder(b.selected_position));
+    
+    const oppStarters = oppRoster
+      .filter(player => player.is_starting)
+      .sort((a, b) => this.getPositionOrder(a.selected_position) - this.getPositionOrder(b.selected_position));
+
+    this._players = {};
+    this._playerRows = {};
+
+    const maxPlayers = Math.max(ourStarters.length, oppStarters.length);
+    const lineupRows = [];
+    
+    for (let i = 0; i < maxPlayers; i++) {
+      const ourPlayer = ourStarters[i];
+      const oppPlayer = oppStarters[i];
+      
+      const position = (ourPlayer && (ourPlayer.selected_position || ourPlayer.position)) || 
+                      (oppPlayer && (oppPlayer.selected_position || oppPlayer.position)) || '';
+      
+      lineupRows.push(this.renderLineupRow(ourPlayer, oppPlayer, position));
+    }
+
+    this.patchTable(sections.lineup, 'lineup-section', `
+      <div class="lineup-title">Starting Lineup</div>
+      <div class="lineup-header">
+        <div></div>
+        <div>Your Team</div>
+        <div></div>
+        <div>POS</div>
+        <div></div>
+        <div>Opponent</div>
+        <div></div>
+      </div>
+    `, lineupRows);
+    this.indexPlayerRows(sections.lineup, ourStarters, oppStarters, false);
+
+    // Bench rows are only built while the bench is expanded
+    const benchExpanded = showBench && this._benchExpanded;
+    const ourBench = benchExpanded ? ourRoster.filter(player => !player.is_starting) : [];
+    const oppBench = benchExpanded ? oppRoster.filter(player => !player.is_starting) : [];
+    const benchRows = this.renderCombinedBenchSection(ourBench, oppBench);
+    this.patchTable(sections.bench, 'bench-container', `
+      <div class="bench-title-main bench-toggle${benchExpanded ? ' expanded' : ''}">Bench Players ${benchExpanded ? '▾' : '▸'}</div>
+      ${benchExpanded ? `
+        <div class="bench-header">
+          <div></div>
+          <div>Your Bench</div>
+          <div></div>
+          <div>POS</div>
+          <div></div>
+          <div>Opponent Bench</div>
+          <div></div>
+        </div>
+      ` : ''}
+    `, benchRows, showBench);
+    this.indexPlayerRows(sections.bench, ourBench, oppBench, true);
   }
 
   getCardSize() {